@@ -0,0 +1,141 @@
+"""Compare the emoji search index with the former linear scan.
+
+Times ``_EmojiIndex.search``, with the provider's result limit, against the
+linear ``_matches`` scan the emoji provider used before, on the full bundled
+emoji set, for every keystroke of a few typed queries. The linear scan is
+timed both as the provider ran it (stopping at ``--max-results`` matches) and
+over the whole set, and the full scan is checked to match the same emojis as
+the index.
+
+Usage (from the src folder):
+    python benchmarks/emoji_search.py
+    python benchmarks/emoji_search.py --repeat 50 --output before.json
+    python benchmarks/emoji_search.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+
+from benchmarks.quick_launch import _install_stubs, _keystrokes  # noqa: E402
+
+_QUERIES = ["smile", "heart", "thumbs up", "cat face", "flag", "red", "x", "party"]
+
+
+def _matches(query: str, entry: dict) -> bool:
+    """The former ``EmojiProvider._matches``."""
+    name = entry.get("name", "").lower()
+    aliases = entry.get("aliases", [])
+    tags = entry.get("tags", [])
+    if query in name:
+        return True
+    for alias in aliases:
+        if query in alias.lower():
+            return True
+    for tag in tags:
+        if query in tag.lower():
+            return True
+    return False
+
+
+def _linear_search(query: str, emojis: list[dict], limit: int | None) -> list[int]:
+    found = []
+    for i, entry in enumerate(emojis):
+        if _matches(query, entry):
+            found.append(i)
+            if limit is not None and len(found) >= limit:
+                break
+    return found
+
+
+def _time(run, texts: list[str], repeat: int) -> dict:
+    for text in texts:
+        run(text)
+    latencies = []
+    for _ in range(repeat):
+        for text in texts:
+            started = time.perf_counter_ns()
+            run(text)
+            latencies.append((time.perf_counter_ns() - started) / 1e6)
+    latencies.sort()
+    return {
+        "p50_ms": round(statistics.median(latencies), 4),
+        "p95_ms": round(latencies[max(int(len(latencies) * 0.95) - 1, 0)], 4),
+        "mean_ms": round(statistics.fmean(latencies), 4),
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as data_dir:
+        _install_stubs(Path(data_dir))
+        from core.utils.widgets.quick_launch.providers.emoji import _EmojiIndex, _load_emoji_data
+
+        emojis = _load_emoji_data()
+        started = time.perf_counter()
+        index = _EmojiIndex(emojis)
+        build_ms = (time.perf_counter() - started) * 1000
+
+    texts = [text.lower() for query in _QUERIES for text in _keystrokes(query)]
+    mismatches = [text for text in texts if set(index.search(text)) != set(_linear_search(text, emojis, None))]
+    results = {
+        "index": _time(lambda text: index.search(text, args.max_results)[: args.max_results], texts, args.repeat),
+        "linear": _time(lambda text: _linear_search(text, emojis, args.max_results), texts, args.repeat),
+        "linear_full": _time(lambda text: _linear_search(text, emojis, None), texts, args.repeat),
+    }
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "emojis": len(emojis),
+            "keystrokes": len(texts),
+            "repeat": args.repeat,
+            "max_results": args.max_results,
+            "index_build_ms": round(build_ms, 1),
+            "mismatches": mismatches,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the emoji search index with the former linear scan.")
+    parser.add_argument("--output", default="emoji_search_bench.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="Previous JSON results to compare median latencies against.")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed passes over every keystroke.")
+    parser.add_argument("--max-results", type=int, default=50, help="Result limit of the provider.")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["results"]
+    meta = report["meta"]
+    print(f"{meta['emojis']} emojis, {meta['keystrokes']} keystrokes, index built in {meta['index_build_ms']} ms")
+    print(f"{'search':<13}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for name, result in report["results"].items():
+        line = f"{name:<13}{result['p50_ms']:>10.4f}{result['p95_ms']:>10.4f}{result['mean_ms']:>10.4f}"
+        before = previous.get(name, {}).get("p50_ms")
+        if before:
+            line += f"   p50 {(result['p50_ms'] - before) / before * 100:+.1f}%"
+        print(line)
+    if meta["mismatches"]:
+        print(f"Index and linear scan disagree on: {', '.join(meta['mismatches'])}")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
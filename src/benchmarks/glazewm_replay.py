@@ -0,0 +1,323 @@
+"""Replay GlazeWM IPC traffic against the shared GlazeWM client.
+
+Starts a local stand-in for the GlazeWM websocket server that answers
+subscriptions and queries and pushes a stream of events, then connects the
+shared ``GlazewmClient`` to it with the subscriptions of the workspaces,
+tiling direction and binding mode widgets on ``--screens`` screens. Reports
+how many events were pushed, how many queries the client sent (and how many
+the former one-connection-per-widget clients would have sent), the deltas it
+published and the final model, so changes to the client can be checked
+without a running GlazeWM.
+
+The stream is either generated (focus changes, windows opened, closed and
+moved over a few monitors) or a recording of real traffic, one raw GlazeWM
+message per line, as written by ``--record`` on a machine running GlazeWM.
+
+Usage (from the src folder):
+    python benchmarks/glazewm_replay.py --events 500 --screens 3
+    python benchmarks/glazewm_replay.py --stream recorded.jsonl --output replay.json
+    python benchmarks/glazewm_replay.py --record recorded.jsonl --seconds 60
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, QTimer, QUrl  # noqa: E402
+from PyQt6.QtNetwork import QHostAddress  # noqa: E402
+from PyQt6.QtWebSockets import QWebSocket, QWebSocketServer  # noqa: E402
+
+from core.utils.widgets.glazewm.client import GlazewmClient, QueryType  # noqa: E402
+
+# The subscriptions the GlazeWM widgets make, per screen
+_WIDGET_SUBSCRIPTIONS = [
+    (
+        [
+            "workspace_activated",
+            "workspace_deactivated",
+            "workspace_updated",
+            "focus_changed",
+            "focused_container_moved",
+        ],
+        [QueryType.MONITORS],
+    ),
+    (["focus_changed", "tiling_direction_changed", "focused_container_moved"], [QueryType.TILING_DIRECTION]),
+    (["binding_modes_changed"], [QueryType.BINDING_MODES]),
+]
+
+
+def _response(client_message: str, data: dict) -> str:
+    return json.dumps(
+        {"messageType": "client_response", "clientMessage": client_message, "data": data, "success": True}
+    )
+
+
+def _event(event_type: str) -> str:
+    return json.dumps({"messageType": "event_subscription", "data": {"eventType": event_type}, "success": True})
+
+
+def _synthetic_stream(events: int, rng: random.Random) -> tuple[dict[str, dict], list[tuple[str, dict[str, dict]]]]:
+    """Generate (initial state, steps); each step is an event and the query results after it."""
+    monitors = {1001: [str(n) for n in range(1, 6)], 1002: [str(n) for n in range(6, 11)]}
+    windows = {name: [] for names in monitors.values() for name in names}
+    displayed = {hwnd: names[0] for hwnd, names in monitors.items()}
+    focused = "1"
+    next_handle = 5000
+    tiling = "horizontal"
+
+    def window(handle: int) -> dict:
+        return {
+            "type": "window",
+            "id": f"w{handle}",
+            "handle": handle,
+            "title": f"Window {handle}",
+            "className": "Chrome_WidgetWin_1",
+            "processName": "app.exe",
+            "displayState": "shown",
+            "state": {"type": "tiling"},
+        }
+
+    def state() -> dict[str, dict]:
+        tree = [
+            {
+                "hardwareId": f"MON{hwnd}",
+                "handle": hwnd,
+                "children": [
+                    {
+                        "type": "workspace",
+                        "name": name,
+                        "displayName": name,
+                        "isDisplayed": displayed[hwnd] == name,
+                        "hasFocus": focused == name,
+                        "children": [window(handle) for handle in windows[name]],
+                    }
+                    for name in names
+                ],
+            }
+            for hwnd, names in monitors.items()
+        ]
+        return {
+            QueryType.MONITORS: {"monitors": tree},
+            QueryType.TILING_DIRECTION: {"tilingDirection": tiling},
+            QueryType.BINDING_MODES: {"bindingModes": []},
+        }
+
+    initial = state()
+    steps = []
+    while len(steps) < events:
+        action = rng.random()
+        if action < 0.4:
+            focused = rng.choice(list(windows))
+            hwnd = next(h for h, names in monitors.items() if focused in names)
+            displayed[hwnd] = focused
+            kinds = ["focus_changed", "workspace_activated"]
+        elif action < 0.6:
+            windows[focused].append(next_handle)
+            next_handle += 1
+            kinds = ["focus_changed", "workspace_updated"]
+        elif action < 0.8:
+            if not windows[focused]:
+                continue
+            windows[focused].pop(rng.randrange(len(windows[focused])))
+            kinds = ["focus_changed", "workspace_updated"]
+        elif action < 0.95:
+            if not windows[focused]:
+                continue
+            target = rng.choice(list(windows))
+            windows[target].append(windows[focused].pop())
+            kinds = ["focused_container_moved"]
+        else:
+            tiling = "vertical" if tiling == "horizontal" else "horizontal"
+            kinds = ["tiling_direction_changed"]
+        # GlazeWM sends several events for one user action; they arrive back to back
+        for kind in kinds:
+            steps.append((kind, state()))
+    return initial, steps[:events]
+
+
+def _recorded_stream(path: str) -> tuple[dict[str, dict], list[tuple[str, dict[str, dict]]]]:
+    """Split a recording into steps: the query results that follow an event describe the state after it."""
+    initial: dict[str, dict] = {}
+    steps: list[tuple[str, dict[str, dict]]] = []
+    current = initial
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            message = json.loads(line)
+            if message.get("messageType") == "event_subscription":
+                current = dict(current)
+                steps.append(((message.get("data") or {}).get("eventType", ""), current))
+            elif message.get("clientMessage") in set(QueryType):
+                current[message["clientMessage"]] = message.get("data", {})
+    return initial, steps
+
+
+class ReplayServer:
+    """A local stand-in for the GlazeWM IPC server that pushes a prepared stream of events."""
+
+    def __init__(self, initial: dict[str, dict], steps: list[tuple[str, dict[str, dict]]], interval_ms: int):
+        self.state = dict(initial)
+        self.steps = steps
+        self.received: Counter[str] = Counter()
+        self.pushed = 0
+        self._socket: QWebSocket | None = None
+        self._server = QWebSocketServer("glazewm-replay", QWebSocketServer.SslMode.NonSecureMode)
+        self._server.newConnection.connect(self._on_connection)
+        self._server.listen(QHostAddress.SpecialAddress.LocalHost, 0)
+        self._timer = QTimer()
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._push)
+
+    @property
+    def uri(self) -> str:
+        return f"ws://127.0.0.1:{self._server.serverPort()}"
+
+    @property
+    def done(self) -> bool:
+        return self.pushed >= len(self.steps)
+
+    def _on_connection(self):
+        self._socket = self._server.nextPendingConnection()
+        self._socket.textMessageReceived.connect(self._on_message)
+        self._timer.start()
+
+    def _on_message(self, message: str):
+        self.received[message.split(" ", 1)[0] if not message.startswith("query") else message] += 1
+        if message.startswith("sub"):
+            self._socket.sendTextMessage(_response(message, {"subscriptionId": "replay"}))
+        elif message in self.state:
+            self._socket.sendTextMessage(_response(message, self.state[message]))
+
+    def _push(self):
+        if self.done:
+            self._timer.stop()
+            return
+        event_type, state = self.steps[self.pushed]
+        self.state.update(state)
+        self._socket.sendTextMessage(_event(event_type))
+        self.pushed += 1
+
+
+def replay(args: argparse.Namespace) -> dict:
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    if args.stream:
+        initial, steps = _recorded_stream(args.stream)
+    else:
+        initial, steps = _synthetic_stream(args.events, random.Random(args.seed))
+    server = ReplayServer(initial, steps, args.interval_ms)
+
+    client = GlazewmClient(server.uri)
+    deltas: Counter[str] = Counter()
+    client.workspaces_changed.connect(lambda _, changes: deltas.update(type(change).__name__ for change in changes))
+    for _ in range(args.screens):
+        for events, queries in _WIDGET_SUBSCRIPTIONS:
+            client.subscribe(events, queries)
+
+    started = time.perf_counter()
+    client.connect()
+    deadline = started + args.timeout
+    idle_since = None
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        if server.done:
+            idle_since = idle_since or time.perf_counter()
+            # Give the last queries time to be answered
+            if time.perf_counter() - idle_since > 0.2:
+                break
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - started
+
+    # Every widget used to re-send all three queries on each of its own subscription events
+    legacy_queries = sum(
+        len(QueryType) * args.screens
+        for event_type, _ in steps[: server.pushed]
+        for events, _ in _WIDGET_SUBSCRIPTIONS
+        if event_type in events
+    )
+    monitors = client.monitors or []
+    return {
+        "meta": {
+            "stream": args.stream or f"synthetic ({args.events} events, seed {args.seed})",
+            "screens": args.screens,
+            "interval_ms": args.interval_ms,
+            "seconds": round(elapsed, 3),
+        },
+        "events_pushed": server.pushed,
+        "client_messages": dict(server.received),
+        "queries_sent": client.stats["queries"],
+        "legacy_queries": legacy_queries,
+        "connections": 1,
+        "legacy_connections": len(_WIDGET_SUBSCRIPTIONS) * args.screens,
+        "deltas": dict(deltas),
+        "model": {
+            "monitors": len(monitors),
+            "workspaces": sum(len(m.workspaces) for m in monitors),
+            "windows": sum(len(ws.windows) for m in monitors for ws in m.workspaces),
+            "focused": next((ws.name for m in monitors for ws in m.workspaces if ws.focus), None),
+            "tiling_direction": client.tiling_direction,
+        },
+    }
+
+
+def record(args: argparse.Namespace) -> None:
+    """Write the raw traffic of a running GlazeWM, querying everything after each event."""
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    socket = QWebSocket()
+    events = sorted({event for events, _ in _WIDGET_SUBSCRIPTIONS for event in events})
+    with open(args.record, "w", encoding="utf-8") as f:
+
+        def on_connected():
+            socket.sendTextMessage(f"sub -e {' '.join(events)}")
+            for query in QueryType:
+                socket.sendTextMessage(query)
+
+        def on_message(message: str):
+            f.write(message.replace("\n", " ") + "\n")
+            if json.loads(message).get("messageType") == "event_subscription":
+                for query in QueryType:
+                    socket.sendTextMessage(query)
+
+        socket.connected.connect(on_connected)
+        socket.textMessageReceived.connect(on_message)
+        socket.open(QUrl(args.uri))
+        QTimer.singleShot(args.seconds * 1000, app.quit)
+        app.exec()
+    print(f"Recording written to {args.record}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay GlazeWM IPC traffic against the shared GlazeWM client.")
+    parser.add_argument("--stream", help="A recording to replay instead of a generated stream.")
+    parser.add_argument("--events", type=int, default=500, help="Number of generated events.")
+    parser.add_argument("--screens", type=int, default=2, help="Screens with all three GlazeWM widgets.")
+    parser.add_argument("--interval-ms", type=int, default=2, help="Delay between pushed events.")
+    parser.add_argument("--timeout", type=float, default=60, help="Give up after this many seconds.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Where to write the JSON results.")
+    parser.add_argument("--record", help="Record a running GlazeWM to this file instead of replaying.")
+    parser.add_argument("--uri", default="ws://localhost:6123", help="GlazeWM IPC server to record.")
+    parser.add_argument("--seconds", type=int, default=60, help="How long to record.")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args)
+        return
+    report = replay(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Import-time report for the modules loaded before the first bar is shown.
+
+Imports a module in a fresh interpreter with ``-X importtime`` and lists the
+slowest imports by cumulative time. With ``--budget-ms`` it exits non-zero
+when the total exceeds that budget (by default it only reports), and
+``--forbid`` fails the run if any of the given modules were imported at all,
+which catches a heavy dependency (PIL, winrt namespaces, COM shell modules)
+creeping back onto the startup path. Such dependencies belong behind
+``core.utils.lazy_import.lazy_import`` when only some code paths need them.
+
+Usage (from the src folder, on Windows):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module core.bar_manager --top 30
+    python benchmarks/import_time.py --budget-ms 600 --forbid PIL win32comext.shell
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+_LINE_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+# Report only; no startup import budget has been measured on Windows yet
+_DEFAULT_BUDGET_MS = 0.0
+_DEFAULT_FORBIDDEN = ["PIL", "win32comext.shell", "winrt.windows.ui.notifications", "winrt.windows.data.xml.dom"]
+
+
+def measure(module: str) -> list[dict]:
+    """Import *module* in a new interpreter and return one entry per imported module, in import order."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"importing {module} failed: {tail[0]}")
+    imports = []
+    for line in result.stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append(
+                {
+                    "module": name,
+                    "self_ms": int(self_us) / 1000,
+                    "cumulative_ms": int(cumulative_us) / 1000,
+                    "depth": len(indent) // 2,
+                }
+            )
+    return imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the slowest imports of a yasb module.")
+    parser.add_argument("--module", default="core.bar_manager", help="Module to import.")
+    parser.add_argument("--top", type=int, default=20, help="Number of imports to list.")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=_DEFAULT_BUDGET_MS,
+        help="Fail if the module takes longer than this to import; 0 disables the check.",
+    )
+    parser.add_argument(
+        "--forbid",
+        nargs="*",
+        default=_DEFAULT_FORBIDDEN,
+        help="Fail if any of these modules (or their submodules) get imported.",
+    )
+    parser.add_argument("--output", help="Where to write the JSON results.")
+    args = parser.parse_args()
+
+    imports = measure(args.module)
+    total_ms = sum(entry["self_ms"] for entry in imports)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"module": args.module, "total_ms": round(total_ms, 3), "imports": imports}, f, indent=2)
+
+    print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+    for entry in sorted(imports, key=lambda e: e["cumulative_ms"], reverse=True)[: args.top]:
+        print(f"{entry['cumulative_ms']:>14.1f}{entry['self_ms']:>10.1f}  {'  ' * entry['depth']}{entry['module']}")
+    print(f"{len(imports)} modules imported in {total_ms:.1f} ms")
+
+    failed = False
+    names = [entry["module"] for entry in imports]
+    for forbidden in args.forbid:
+        loaded = [name for name in names if name == forbidden or name.startswith(f"{forbidden}.")]
+        if loaded:
+            print(f"FAIL: {forbidden} is imported at startup ({', '.join(loaded[:3])})")
+            failed = True
+    if args.budget_ms and total_ms > args.budget_ms:
+        print(f"FAIL: {total_ms:.1f} ms is over the {args.budget_ms:.1f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,432 @@
+"""Replay komorebi pipe traffic through the state store.
+
+komorebi writes its whole state to the yasb pipe with every event. This
+replays a stream of those messages the way the event listener handles them,
+through the event service to stand-ins for the workspaces, stack and active
+layout widgets on ``--screens`` screens, and reports the CPU time per event
+(parse, dispatch and the widgets' state lookups) and the part of it spent on
+the GUI thread for two paths:
+
+- ``legacy``: every widget receives every message and walks the state to
+  find its monitor, workspace and container, as they did before the state
+  store.
+- ``store``: the message is diffed once by ``KomorebiStateStore``; messages
+  that change nothing are dropped and only the widgets whose monitor (or,
+  for the workspaces and active layout widgets, the top-level fields)
+  changed walk the state.
+
+The widgets' Qt work after a lookup (restyling buttons, loading icons) is
+not included, so the widget update counts understate what dropping updates
+saves on a real bar.
+
+The stream is either generated (focus and title changes, workspace
+switches, windows opening and closing, and the retile and cloak events that
+leave the visible state untouched) or a recording of real traffic, one pipe
+message per line, as written by ``--record`` on a machine running komorebi.
+
+Usage (from the src folder):
+    python benchmarks/komorebi_replay.py --events 5000 --screens 3
+    python benchmarks/komorebi_replay.py --stream recorded.jsonl --output replay.json
+    python benchmarks/komorebi_replay.py --record recorded.jsonl --seconds 60
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+
+from PyQt6.QtCore import QCoreApplication, QObject, Qt, pyqtSignal  # noqa: E402
+
+from core.event_enums import KomorebiEvent  # noqa: E402
+from core.event_service import EventService  # noqa: E402
+from core.utils.widgets.komorebi.client import KomorebiClient  # noqa: E402
+from core.utils.widgets.komorebi.state_store import KomorebiStateDiff, KomorebiStateStore  # noqa: E402
+
+# As in core.utils.widgets.komorebi.event_listener, which needs pywin32 to import
+WORKSPACE_UPDATE_EVENTS = frozenset({"MoveWindow", "Show", "Hide", "Destroy"})
+# The events the active layout widget listens for besides KomorebiUpdate
+_LAYOUT_CHANGE_EVENTS = [
+    KomorebiEvent.ChangeLayout,
+    KomorebiEvent.FocusWorkspaceNumber,
+    KomorebiEvent.FocusMonitorWorkspaceNumber,
+    KomorebiEvent.TogglePause,
+    KomorebiEvent.ToggleTiling,
+    KomorebiEvent.ToggleMonocle,
+    KomorebiEvent.ToggleMaximize,
+]
+
+_EXES = ["firefox.exe", "Code.exe", "WindowsTerminal.exe", "explorer.exe", "Discord.exe", "Spotify.exe"]
+
+
+def _walk_workspaces(komorebic: KomorebiClient, state: dict, screen_hwnd: int) -> None:
+    screen = komorebic.get_screen_by_hwnd(state, screen_hwnd)
+    workspaces = komorebic.get_workspaces(screen)
+    komorebic.get_focused_workspace(screen)
+    for workspace in workspaces:
+        komorebic.get_num_windows(workspace)
+
+
+def _walk_stack(komorebic: KomorebiClient, state: dict, screen_hwnd: int) -> None:
+    screen = komorebic.get_screen_by_hwnd(state, screen_hwnd)
+    workspace = komorebic.get_focused_workspace(screen)
+    container = komorebic.get_focused_container(workspace, get_monocle=True)
+    if container:
+        komorebic.get_windows(container)
+        komorebic.get_focused_window(container)
+
+
+def _walk_active_layout(komorebic: KomorebiClient, state: dict, screen_hwnd: int) -> None:
+    screen = komorebic.get_screen_by_hwnd(state, screen_hwnd)
+    komorebic.get_focused_workspace(screen)
+
+
+# (widget, reads top-level fields, state walk) for each komorebi widget on a screen
+_WIDGETS = [
+    ("workspaces", True, _walk_workspaces),
+    ("stack", False, _walk_stack),
+    ("active_layout", True, _walk_active_layout),
+]
+
+
+class _SyntheticKomorebi:
+    """A komorebi-shaped state that the generated events mutate."""
+
+    def __init__(self, screens: int, rng: random.Random):
+        self.rng = rng
+        self.next_hwnd = 100000
+        self.next_container = 0
+        self.state = {
+            "monitors": {
+                "elements": [self._monitor(65537 + index) for index in range(screens)],
+                "focused": 0,
+            },
+            "is_paused": False,
+            "resize_delta": 50,
+            "float_override": False,
+            "mouse_follows_focus": True,
+            "has_pending_raise_op": False,
+        }
+
+    def _window(self) -> dict:
+        self.next_hwnd += 1
+        exe = self.rng.choice(_EXES)
+        return {"hwnd": self.next_hwnd, "title": f"{exe} {self.next_hwnd}", "exe": exe, "class": "Window"}
+
+    def _container(self) -> dict:
+        self.next_container += 1
+        return {"id": f"container-{self.next_container}", "windows": {"elements": [self._window()], "focused": 0}}
+
+    def _workspace(self, name: str) -> dict:
+        containers = [self._container() for _ in range(self.rng.randint(0, 4))]
+        return {
+            "name": name,
+            "containers": {"elements": containers, "focused": 0},
+            "monocle_container": None,
+            "maximized_window": None,
+            "floating_windows": {"elements": [], "focused": 0},
+            "layout": {"Default": "BSP"},
+            "latest_layout": [],
+            "resize_dimensions": [],
+            "tile": True,
+            "layer": "Tiling",
+        }
+
+    def _monitor(self, hwnd: int) -> dict:
+        return {
+            "id": hwnd,
+            "name": f"DISPLAY{hwnd}",
+            "size": {"left": 0, "top": 0, "right": 2560, "bottom": 1440},
+            "workspaces": {"elements": [self._workspace(str(n)) for n in range(1, 6)], "focused": 0},
+            "last_focused_workspace": None,
+        }
+
+    def _focused(self) -> tuple[dict, dict]:
+        monitors = self.state["monitors"]
+        monitor = monitors["elements"][monitors["focused"]]
+        return monitor, monitor["workspaces"]["elements"][monitor["workspaces"]["focused"]]
+
+    def _retile(self, workspace: dict) -> None:
+        workspace["latest_layout"] = [
+            {"left": self.rng.randint(0, 2560), "top": 0, "right": 1280, "bottom": 1440}
+            for _ in workspace["containers"]["elements"]
+        ]
+
+    def step(self) -> dict:
+        """Apply one event and return it."""
+        rng = self.rng
+        monitor, workspace = self._focused()
+        containers = workspace["containers"]
+        action = rng.random()
+        if action < 0.3:
+            # Retiles, cloaking and focus events for the window that already has focus change nothing visible
+            kind = rng.choice(["Show", "Hide", "Cloak", "Uncloak", "MoveResizeEnd", "FocusChange", "Raise"])
+            if kind in ("Show", "MoveResizeEnd"):
+                self._retile(workspace)
+            return {"type": kind, "content": ["ObjectNameChange", {"hwnd": self.next_hwnd}]}
+        if action < 0.55 and containers["elements"]:
+            # Browsers and terminals retitle their windows constantly
+            window = rng.choice(containers["elements"])["windows"]["elements"][0]
+            window["title"] = f"{window['exe']} {rng.randint(0, 1 << 20)}"
+            return {"type": "TitleUpdate", "content": ["ObjectNameChange", window]}
+        if action < 0.75 and containers["elements"]:
+            containers["focused"] = rng.randrange(len(containers["elements"]))
+            window = containers["elements"][containers["focused"]]["windows"]["elements"][0]
+            return {"type": "FocusChange", "content": ["SystemForeground", window]}
+        if action < 0.85:
+            monitors = self.state["monitors"]
+            monitors["focused"] = rng.randrange(len(monitors["elements"]))
+            monitor, _ = self._focused()
+            monitor["workspaces"]["focused"] = rng.randrange(len(monitor["workspaces"]["elements"]))
+            return {"type": "FocusMonitorWorkspaceNumber", "content": monitor["workspaces"]["focused"]}
+        if action < 0.93:
+            if containers["elements"] and rng.random() < 0.5:
+                containers["elements"].pop(rng.randrange(len(containers["elements"])))
+                containers["focused"] = 0
+                kind = "Destroy"
+            else:
+                containers["elements"].append(self._container())
+                containers["focused"] = len(containers["elements"]) - 1
+                kind = "Manage"
+            self._retile(workspace)
+            return {"type": kind, "content": ["ObjectCreate", {"hwnd": self.next_hwnd}]}
+        if action < 0.98:
+            workspace["layout"] = {"Default": rng.choice(["BSP", "Columns", "Rows", "VerticalStack", "Grid"])}
+            self._retile(workspace)
+            return {"type": "ChangeLayout", "content": workspace["layout"]}
+        self.state["is_paused"] = not self.state["is_paused"]
+        return {"type": "TogglePause", "content": None}
+
+
+def _synthetic_stream(events: int, screens: int, seed: int) -> list[str]:
+    komorebi = _SyntheticKomorebi(screens, random.Random(seed))
+    messages = [json.dumps({"event": {"type": "Initial", "content": None}, "state": komorebi.state})]
+    for _ in range(events):
+        event = komorebi.step()
+        messages.append(json.dumps({"event": event, "state": komorebi.state}))
+    return messages
+
+
+def _recorded_stream(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line for line in f if line.strip()]
+
+
+def _screen_ids(messages: list[str], screens: int) -> list[int]:
+    """Monitor ids of the screens with a bar; recordings bring their own."""
+    state = json.loads(messages[0])["state"]
+    return [monitor["id"] for monitor in state["monitors"]["elements"]][:screens]
+
+
+class _Widget(QObject):
+    """Receives komorebi updates through the event service the way a komorebi widget does."""
+
+    k_signal_legacy_update = pyqtSignal(dict, dict)
+    k_signal_update = pyqtSignal(dict, dict, object)
+    k_signal_layout_change = pyqtSignal(dict, dict)
+
+    def __init__(self, name: str, global_state: bool, walk, screen_hwnd: int, walks: Counter[str]):
+        super().__init__()
+        self.name = name
+        self.global_state = global_state
+        self.walk = walk
+        self.screen_hwnd = screen_hwnd
+        self.walks = walks
+        self.komorebic = KomorebiClient()
+        # Widgets receive the listener thread's signals queued on the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.k_signal_legacy_update.connect(self._on_legacy_update, queued)
+        self.k_signal_update.connect(self._on_update, queued)
+        self.k_signal_layout_change.connect(self._on_layout_change, queued)
+
+    def _update(self, state: dict) -> None:
+        self.walk(self.komorebic, state, self.screen_hwnd)
+        self.walks[self.name] += 1
+
+    def _on_legacy_update(self, event: dict, state: dict) -> None:
+        self._update(state)
+        if self.name == "workspaces" and event["type"] in WORKSPACE_UPDATE_EVENTS:
+            EventService().emit_event("workspace_update", event["type"])
+
+    def _on_update(self, event: dict, state: dict, diff: KomorebiStateDiff) -> None:
+        if diff.touches(self.screen_hwnd, global_state=self.global_state):
+            self._update(state)
+
+    def _on_layout_change(self, event: dict, state: dict) -> None:
+        self._update(state)
+
+
+class _ActiveWindow(QObject):
+    workspace_update = pyqtSignal(str)
+
+    def __init__(self, received: Counter[str]):
+        super().__init__()
+        self.workspace_update.connect(
+            lambda _: received.update(["workspace_update"]), Qt.ConnectionType.QueuedConnection
+        )
+
+
+def _emit_legacy(event_service: EventService, store: KomorebiStateStore, event: dict, state: dict) -> None:
+    # KomorebiEventListener._emit_event before the state store
+    event_service.emit_event(KomorebiEvent.KomorebiUpdate, event, state)
+    if event["type"] in KomorebiEvent:
+        event_service.emit_event(KomorebiEvent[event["type"]], event, state)
+
+
+def _emit_store(event_service: EventService, store: KomorebiStateStore, event: dict, state: dict) -> None:
+    # KomorebiEventListener._emit_event
+    if event["type"] in WORKSPACE_UPDATE_EVENTS:
+        event_service.emit_event("workspace_update", event["type"])
+    diff = store.apply(state)
+    if diff.is_empty:
+        return
+    event_service.emit_event(KomorebiEvent.KomorebiUpdate, event, state, diff)
+    if event["type"] in KomorebiEvent:
+        event_service.emit_event(KomorebiEvent[event["type"]], event, state)
+
+
+def _run(app: QCoreApplication, messages: list[str], screen_ids: list[int], mode: str) -> dict:
+    event_service = EventService()
+    event_service.clear()
+    store = KomorebiStateStore()
+    walks: Counter[str] = Counter()
+    received: Counter[str] = Counter()
+    receivers = []
+    for screen_hwnd in screen_ids:
+        for name, global_state, walk in _WIDGETS:
+            widget = _Widget(name, global_state, walk, screen_hwnd, walks)
+            update_signal = widget.k_signal_legacy_update if mode == "legacy" else widget.k_signal_update
+            event_service.register_event(KomorebiEvent.KomorebiUpdate, update_signal)
+            if name == "active_layout":
+                for event_type in _LAYOUT_CHANGE_EVENTS:
+                    event_service.register_event(event_type, widget.k_signal_layout_change)
+            receivers.append(widget)
+        active_window = _ActiveWindow(received)
+        event_service.register_event("workspace_update", active_window.workspace_update)
+        receivers.append(active_window)
+    emit = _emit_legacy if mode == "legacy" else _emit_store
+
+    event_ns = []
+    gui_ns = 0
+    for message in messages:
+        started = time.process_time_ns()
+        payload = json.loads(message)
+        emit(event_service, store, payload["event"], payload["state"])
+        handled = time.process_time_ns()
+        # What the widgets do with the queued signals on the GUI thread
+        app.processEvents()
+        finished = time.process_time_ns()
+        gui_ns += finished - handled
+        event_ns.append(finished - started)
+    event_service.clear()
+
+    event_ns.sort()
+    return {
+        "cpu_us_per_event": round(sum(event_ns) / len(event_ns) / 1000, 3),
+        "p95_us": round(event_ns[int(len(event_ns) * 0.95) - 1] / 1000, 3),
+        "gui_us_per_event": round(gui_ns / len(event_ns) / 1000, 3),
+        "messages": len(messages),
+        "delivered": len(messages) - store.stats["dropped"],
+        "widget_updates": sum(walks.values()),
+        "widget_updates_by_widget": dict(walks),
+        "workspace_update_events": received["workspace_update"],
+        "diff_us_per_event": round(store.stats["diff_ns"] / store.stats["messages"] / 1000, 3)
+        if store.stats["messages"]
+        else None,
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    if args.stream:
+        messages = _recorded_stream(args.stream)
+    else:
+        messages = _synthetic_stream(args.events, args.screens, args.seed)
+    screen_ids = _screen_ids(messages, args.screens)
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    results = {mode: _run(app, messages, screen_ids, mode) for mode in ("legacy", "store")}
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "stream": args.stream or f"synthetic ({args.events} events, seed {args.seed})",
+            "screens": len(screen_ids),
+        },
+        "results": results,
+    }
+
+
+def record(args: argparse.Namespace) -> None:
+    """Write the pipe messages of a running komorebi, one per line."""
+    from PyQt6.QtCore import QTimer
+
+    from core.utils.widgets.komorebi.event_listener import KomorebiEventListener
+
+    class RecordingListener(KomorebiEventListener):
+        def __init__(self, f):
+            super().__init__()
+            self._file = f
+
+        def _emit_event(self, event: dict, state: dict) -> None:
+            self._file.write(json.dumps({"event": event, "state": state}) + "\n")
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    with open(args.record, "w", encoding="utf-8") as f:
+        listener = RecordingListener(f)
+        listener.start()
+        QTimer.singleShot(args.seconds * 1000, app.quit)
+        app.exec()
+        listener.stop()
+        listener.wait()
+    print(f"Recording written to {args.record}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay komorebi pipe traffic through the state store.")
+    parser.add_argument("--stream", help="A recording to replay instead of a generated stream.")
+    parser.add_argument("--events", type=int, default=5000, help="Number of generated events.")
+    parser.add_argument("--screens", type=int, default=2, help="Screens with all three komorebi widgets.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="Previous JSON results to compare CPU times against.")
+    parser.add_argument("--record", help="Record a running komorebi to this file instead of replaying.")
+    parser.add_argument("--seconds", type=int, default=60, help="How long to record.")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args)
+        return
+    report = run_benchmarks(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["results"]
+    print(f"{'path':<8}{'cpu us/event':>14}{'p95 us':>10}{'gui us/event':>14}{'delivered':>11}{'widget updates':>16}")
+    for mode, result in report["results"].items():
+        line = (
+            f"{mode:<8}{result['cpu_us_per_event']:>14.1f}{result['p95_us']:>10.1f}{result['gui_us_per_event']:>14.1f}"
+            f"{result['delivered']:>11}{result['widget_updates']:>16}"
+        )
+        if previous.get(mode, {}).get("cpu_us_per_event"):
+            change = (result["cpu_us_per_event"] - previous[mode]["cpu_us_per_event"]) / previous[mode][
+                "cpu_us_per_event"
+            ]
+            line += f"   cpu {change * 100:+.1f}%"
+        print(line)
+    store = report["results"]["store"]
+    print(f"{store['messages'] - store['delivered']} of {store['messages']} messages changed nothing and were dropped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""Compare komorebi command latency over the command socket and through komorebic.
+
+Starts a local stand-in for komorebi's command socket that reads newline
+separated ``SocketMessage`` JSON the way komorebi does, records when each
+message arrives and answers ``State`` queries. Then sends the same commands
+two ways and reports the latency from the call until the message reached the
+server:
+
+- ``socket``: ``KomorebiCommandSocket``, the batched socket writes
+  ``KomorebiClient`` now uses.
+- ``komorebic``: one process per command, as ``KomorebiClient`` used to run
+  ``komorebic.exe`` (through the shell on Windows). The process is a Python
+  stand-in that writes one message to the socket like komorebic does; it
+  starts somewhat slower than komorebic.exe, but the shell and process
+  creation that dominate are the same.
+
+Commands are sent in bursts (``--burst`` commands ``--gap-ms`` apart, like
+scrolling across workspaces) and as single ``State`` queries. The stand-in
+server can also be used on its own to try the client without komorebi. On
+Windows, where CPython has no ``socket.AF_UNIX``, the server and the
+komorebic stand-in bind, accept and connect through Winsock like the client.
+
+Usage (from the src folder):
+    python benchmarks/komorebi_socket.py
+    python benchmarks/komorebi_socket.py --bursts 20 --burst 10 --output before.json
+    python benchmarks/komorebi_socket.py --output after.json --compare before.json
+"""
+
+import argparse
+import ctypes
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+
+from core.utils.widgets.komorebi.command_socket import (  # noqa: E402
+    AF_UNIX,
+    KomorebiCommandSocket,
+    winsock_address,
+)
+
+# What a komorebic invocation does: connect, write one message, read the reply, disconnect.
+# Kept to the standard library so the process starts about as fast as it can.
+_KOMOREBIC_STAND_IN = """
+import socket, sys
+if hasattr(socket, "AF_UNIX"):
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.connect(sys.argv[1])
+else:
+    import ctypes
+    class SOCKADDR_UN(ctypes.Structure):
+        _fields_ = [("sun_family", ctypes.c_ushort), ("sun_path", ctypes.c_char * 108)]
+    s = socket.socket(1, socket.SOCK_STREAM)
+    address = SOCKADDR_UN(1, sys.argv[1].encode())
+    if ctypes.windll.ws2_32.connect(ctypes.c_size_t(s.fileno()), ctypes.byref(address), ctypes.sizeof(address)):
+        sys.exit(1)
+with s:
+    s.sendall(sys.argv[2].encode() + b"\\n")
+    s.shutdown(socket.SHUT_WR)
+    while s.recv(65536):
+        pass
+"""
+
+
+class FakeKomorebiServer:
+    """A local stand-in for komorebi's command socket."""
+
+    def __init__(self, path: str, state: dict | None = None):
+        self.path = path
+        self.state = state or {"monitors": {"elements": [], "focused": 0}, "is_paused": False}
+        # (arrival time from time.perf_counter_ns, message)
+        self.received: list[tuple[int, dict]] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = socket.socket(AF_UNIX, socket.SOCK_STREAM)
+        if hasattr(socket, "AF_UNIX"):
+            self._server.bind(path)
+        else:
+            from core.utils.win32.bindings.ws2_32 import bind
+
+            address = winsock_address(path)
+            if bind(self._server.fileno(), ctypes.byref(address), ctypes.sizeof(address)) != 0:
+                raise ctypes.WinError(ctypes.get_last_error())
+        self._server.listen(16)
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept_connection(self) -> socket.socket:
+        if hasattr(socket, "AF_UNIX"):
+            return self._server.accept()[0]
+        from core.utils.win32.bindings.ws2_32 import INVALID_SOCKET, accept
+
+        server = self._server.fileno()
+        if server < 0:
+            raise OSError("server closed")
+        fd = accept(server)
+        if fd == INVALID_SOCKET:
+            raise ctypes.WinError(ctypes.get_last_error())
+        return socket.socket(AF_UNIX, socket.SOCK_STREAM, 0, fd)
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                connection = self._accept_connection()
+            except OSError:
+                return
+            with self._lock:
+                self.connections += 1
+            threading.Thread(target=self._serve, args=(connection,), daemon=True).start()
+
+    def _serve(self, connection: socket.socket) -> None:
+        # Like komorebi: one message per line, until the client closes its side
+        with connection, connection.makefile("rb") as reader:
+            try:
+                for line in reader:
+                    arrived = time.perf_counter_ns()
+                    message = json.loads(line)
+                    with self._lock:
+                        self.received.append((arrived, message))
+                    if message.get("type") == "State":
+                        connection.sendall(json.dumps(self.state).encode("utf-8"))
+            except OSError:
+                pass
+
+    def wait_for(self, count: int, timeout: float = 10) -> None:
+        deadline = time.perf_counter() + timeout
+        while len(self.received) < count and time.perf_counter() < deadline:
+            time.sleep(0.0005)
+
+    def close(self) -> None:
+        # Unblocks the accept() of the server thread, which close() alone doesn't on Linux
+        try:
+            self._server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._server.close()
+
+
+def _percentiles(values_ns: list[int]) -> dict:
+    values = sorted(v / 1e6 for v in values_ns)
+    return {
+        "p50_ms": round(statistics.median(values), 3),
+        "p95_ms": round(values[max(int(len(values) * 0.95) - 1, 0)], 3),
+        "max_ms": round(values[-1], 3),
+    }
+
+
+def _commands(args: argparse.Namespace) -> list[dict]:
+    return [
+        {"type": "FocusMonitorWorkspaceNumber", "content": [0, n % 5], "id": n} for n in range(args.bursts * args.burst)
+    ]
+
+
+def _send_bursts(server: FakeKomorebiServer, args: argparse.Namespace, send) -> list[int]:
+    """Send all commands in bursts with *send* and return each one's latency."""
+    sent: dict[int, int] = {}
+    start = len(server.received)
+    commands = _commands(args)
+    for index, command in enumerate(commands):
+        sent[command["id"]] = time.perf_counter_ns()
+        send(command)
+        if (index + 1) % args.burst:
+            time.sleep(args.gap_ms / 1000)
+        else:
+            server.wait_for(start + index + 1)
+    server.wait_for(start + len(commands))
+    return [arrived - sent[message["id"]] for arrived, message in server.received[start:] if "id" in message]
+
+
+def _spawn_komorebic(path: str, message: dict, wait: bool = False) -> subprocess.Popen:
+    # The client runs komorebic with shell=True; a list only works that way on Windows
+    args = [sys.executable, "-S", "-c", _KOMOREBIC_STAND_IN, path, json.dumps(message)]
+    proc = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=os.name == "nt")
+    if wait:
+        proc.wait()
+    return proc
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "komorebi.sock")
+        server = FakeKomorebiServer(path)
+        results = {}
+
+        command_socket = KomorebiCommandSocket(path)
+        latencies = _send_bursts(server, args, command_socket.send)
+        query_ns = []
+        for _ in range(args.queries):
+            started = time.perf_counter_ns()
+            json.loads(command_socket.query({"type": "State"}))
+            query_ns.append(time.perf_counter_ns() - started)
+        results["socket"] = {
+            "commands": _percentiles(latencies),
+            "state_query": _percentiles(query_ns),
+            "connections": command_socket.stats["connects"] + command_socket.stats["queries"],
+            "writes": command_socket.stats["writes"],
+        }
+        command_socket.close()
+
+        connections = server.connections
+        procs = []
+        latencies = _send_bursts(server, args, lambda message: procs.append(_spawn_komorebic(path, message)))
+        for proc in procs:
+            proc.wait()
+        query_ns = []
+        for _ in range(args.queries):
+            started = time.perf_counter_ns()
+            # komorebic state: a process that asks over the socket and prints the reply
+            _spawn_komorebic(path, {"type": "State"}, wait=True)
+            query_ns.append(time.perf_counter_ns() - started)
+        results["komorebic"] = {
+            "commands": _percentiles(latencies),
+            "state_query": _percentiles(query_ns),
+            "connections": server.connections - connections,
+            "writes": len(procs) + args.queries,
+        }
+        server.close()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commands": args.bursts * args.burst,
+            "burst": args.burst,
+            "gap_ms": args.gap_ms,
+            "queries": args.queries,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare komorebi command latency over the socket and komorebic.")
+    parser.add_argument("--output", default="komorebi_socket_bench.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="Previous JSON results to compare median latencies against.")
+    parser.add_argument("--bursts", type=int, default=10, help="Number of bursts of commands.")
+    parser.add_argument("--burst", type=int, default=10, help="Commands per burst.")
+    parser.add_argument("--gap-ms", type=float, default=5, help="Delay between the commands of a burst.")
+    parser.add_argument("--queries", type=int, default=20, help="Number of State queries.")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["results"]
+    print(f"{'path':<11}{'cmd p50 ms':>12}{'cmd p95 ms':>12}{'state p50 ms':>14}{'connections':>13}{'writes':>8}")
+    for path, result in report["results"].items():
+        line = (
+            f"{path:<11}{result['commands']['p50_ms']:>12.3f}{result['commands']['p95_ms']:>12.3f}"
+            f"{result['state_query']['p50_ms']:>14.3f}{result['connections']:>13}{result['writes']:>8}"
+        )
+        before = previous.get(path, {}).get("commands", {}).get("p50_ms")
+        if before:
+            line += f"   p50 {(result['commands']['p50_ms'] - before) / before * 100:+.1f}%"
+        print(line)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
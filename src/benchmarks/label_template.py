@@ -0,0 +1,208 @@
+"""Benchmark for label updates of polling widgets.
+
+Builds a bar of 20 cpu-style widgets (an icon span, a formatted value and a
+status class) and feeds them a recorded-looking series of samples, as a 1 s
+update interval would. Every tick is applied twice: with the per-tick
+re-parse, ``setText`` and restyle the widgets used to do, and with the
+compiled ``LabelTemplate`` they use now. Reports the time per tick for the
+whole bar, the share of one interval that is, and how many ``setText`` and
+class changes reached Qt.
+
+Usage (from the src folder):
+    python benchmarks/label_template.py
+    python benchmarks/label_template.py --widgets 20 --ticks 600 --output before.json
+    python benchmarks/label_template.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QFrame, QHBoxLayout, QLabel, QWidget  # noqa: E402
+
+from core.utils.utilities import refresh_widget_style  # noqa: E402
+from core.utils.widgets.label_template import LabelTemplate, compile_label  # noqa: E402
+
+_LABEL = "<span></span> {info[percent][total]}% <span class='histogram'>{info[histograms][cpu_percent]}</span>"
+_HISTOGRAM = "▁▂▃▄▅▆▇█"
+_STYLESHEET = """
+.label { padding: 0 4px; }
+.status-low { color: #a6e3a1; }
+.status-medium { color: #f9e2af; }
+.status-high { color: #fab387; }
+.status-critical { color: #f38ba8; font-weight: bold; }
+.icon { font-size: 14px; }
+"""
+
+
+class _CountingLabel(QLabel):
+    counts = {"set_text": 0, "set_class": 0}
+
+    def setText(self, text):
+        _CountingLabel.counts["set_text"] += 1
+        super().setText(text)
+
+    def setProperty(self, name, value):
+        if name == "class":
+            _CountingLabel.counts["set_class"] += 1
+        return super().setProperty(name, value)
+
+
+def _status(percent: float) -> str:
+    if percent <= 25:
+        return "low"
+    if percent <= 50:
+        return "medium"
+    if percent <= 90:
+        return "high"
+    return "critical"
+
+
+def _samples(ticks: int, rng: random.Random) -> list[float]:
+    """A CPU load that drifts slowly with occasional bursts, like a mostly idle desktop."""
+    value, samples = 8.0, []
+    for _ in range(ticks):
+        value = min(100.0, max(0.0, value + rng.gauss(0, 1.5)))
+        if rng.random() < 0.02:
+            value = rng.uniform(40, 100)
+        samples.append(value)
+    return samples
+
+
+class _Widget:
+    def __init__(self, layout: QHBoxLayout):
+        frame = QFrame()
+        frame_layout = QHBoxLayout(frame)
+        self.widgets = []
+        for part in compile_label(_LABEL):
+            label = _CountingLabel(part.text)
+            label.setProperty("class", part.class_name if part.is_icon else "label")
+            frame_layout.addWidget(label)
+            self.widgets.append(label)
+        layout.addWidget(frame)
+        self.template = LabelTemplate(_LABEL, self.widgets)
+        self.history = [0] * 10
+
+    def info(self, percent: float) -> dict:
+        self.history = self.history[1:] + [percent]
+        histogram = "".join(_HISTOGRAM[min(int(p / 100 * len(_HISTOGRAM)), len(_HISTOGRAM) - 1)] for p in self.history)
+        return {"percent": {"total": round(percent)}, "histograms": {"cpu_percent": histogram}}
+
+    def update_legacy(self, percent: float) -> None:
+        # The per-tick loop the polling widgets ran before LabelTemplate
+        info = self.info(percent)
+        label_parts = re.split("(<span.*?>.*?</span>)", _LABEL)
+        label_parts = [part for part in label_parts if part]
+        widget_index = 0
+        for part in label_parts:
+            part = part.strip()
+            if part and widget_index < len(self.widgets):
+                if "<span" in part and "</span>" in part:
+                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
+                    self.widgets[widget_index].setText(icon)
+                else:
+                    self.widgets[widget_index].setText(part.format(info=info))
+                    self.widgets[widget_index].setProperty("class", f"label status-{_status(percent)}")
+                    refresh_widget_style(self.widgets[widget_index])
+                widget_index += 1
+
+    def update_template(self, percent: float) -> None:
+        self.template.format({"info": self.info(percent)}, status=_status(percent))
+
+
+def _run(app: QApplication, widgets: list[_Widget], samples: list[list[float]], mode: str) -> dict:
+    _CountingLabel.counts = {"set_text": 0, "set_class": 0}
+    tick_ms = []
+    for tick in samples:
+        started = time.perf_counter_ns()
+        for widget, percent in zip(widgets, tick):
+            getattr(widget, f"update_{mode}")(percent)
+        app.processEvents()
+        tick_ms.append((time.perf_counter_ns() - started) / 1e6)
+    tick_ms.sort()
+    return {
+        "mean_ms": round(statistics.fmean(tick_ms), 4),
+        "p95_ms": round(tick_ms[int(len(tick_ms) * 0.95) - 1], 4),
+        "set_text": _CountingLabel.counts["set_text"],
+        "set_class": _CountingLabel.counts["set_class"],
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = random.Random(args.seed)
+    per_widget = [_samples(args.ticks, rng) for _ in range(args.widgets)]
+    samples = list(zip(*per_widget))
+
+    results = {}
+    for mode in ("legacy", "template"):
+        bar = QWidget()
+        bar.setStyleSheet(_STYLESHEET)
+        layout = QHBoxLayout(bar)
+        widgets = [_Widget(layout) for _ in range(args.widgets)]
+        bar.show()
+        app.processEvents()
+        result = _run(app, widgets, samples, mode)
+        result["interval_share_pct"] = round(result["mean_ms"] / args.interval_ms * 100, 4)
+        results[mode] = result
+        bar.close()
+        bar.deleteLater()
+        app.processEvents()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "widgets": args.widgets,
+            "ticks": args.ticks,
+            "interval_ms": args.interval_ms,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark label updates of a bar of polling widgets.")
+    parser.add_argument("--output", default="label_template_bench.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="Previous JSON results to compare mean times against.")
+    parser.add_argument("--widgets", type=int, default=20, help="Number of widgets on the bar.")
+    parser.add_argument("--ticks", type=int, default=600, help="Number of updates (10 minutes at 1 s).")
+    parser.add_argument("--interval-ms", type=int, default=1000, help="Update interval the ticks stand for.")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    report = run_benchmarks(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["results"]
+    print(f"{'mode':<10}{'mean ms':>10}{'p95 ms':>10}{'% of tick':>11}{'setText':>10}{'restyles':>10}")
+    for mode, result in report["results"].items():
+        line = (
+            f"{mode:<10}{result['mean_ms']:>10.3f}{result['p95_ms']:>10.3f}{result['interval_share_pct']:>11.3f}"
+            f"{result['set_text']:>10}{result['set_class']:>10}"
+        )
+        if previous.get(mode, {}).get("mean_ms"):
+            line += f"   mean {(result['mean_ms'] - previous[mode]['mean_ms']) / previous[mode]['mean_ms'] * 100:+.1f}%"
+        print(line)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""Compare LibreHardwareMonitor polling per sensor and through the shared poller.
+
+Starts a local stand-in for the LibreHardwareMonitor web server that serves
+a generated sensor tree as ``data.json`` and answers ``/Sensor?action=Get``
+requests, each after ``--latency-ms``. Then refreshes ``--bars`` bars with
+``--widgets`` libre monitor widgets each, with the popup of the first widget
+of every bar open and showing ``--popup-sensors`` sensors, two ways:
+
+- ``per_sensor``: how ``LibreHardwareMonitorWidget`` used to poll. Every
+  widget posts its own request for its sensor, and every open popup posts one
+  request per sensor on a new network manager and waits for it in a nested
+  event loop.
+- ``poller``: every widget and popup polls the shared ``LibreMonitorPoller``,
+  which fetches ``data.json`` once per refresh.
+
+Reports, per refresh, how long the GUI thread was blocked inside the timer
+callbacks, how long until every widget and popup had a value and how many
+requests reached the server. A server that can't be reached is simulated
+with ``--unreachable``.
+
+Usage (from the src folder):
+    python benchmarks/libre_monitor.py
+    python benchmarks/libre_monitor.py --bars 3 --popup-sensors 10 --output before.json
+    python benchmarks/libre_monitor.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QUrl  # noqa: E402
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest  # noqa: E402
+
+from core.utils.widgets.libre_monitor.poller import LibreMonitorPoller  # noqa: E402
+
+
+def _sensor_tree(sensors: int) -> tuple[dict, dict[str, float]]:
+    """A data.json tree shaped like LibreHardwareMonitor's, and the value of every sensor id."""
+    values = {}
+    hardware = []
+    node_id = 1
+    for hw_index, (hw, sensor_type, unit) in enumerate(
+        [
+            ("amdcpu", "load", "%"),
+            ("amdcpu", "temperature", "°C"),
+            ("gpu-nvidia", "clock", "MHz"),
+            ("lpc", "fan", "RPM"),
+        ]
+    ):
+        children = []
+        for index in range(sensors // 4):
+            sensor_id = f"/{hw}/0/{sensor_type}/{index}"
+            values[sensor_id] = value = round(10 + (index * 7.3 + hw_index) % 80, 1)
+            children.append(
+                {
+                    "id": node_id,
+                    "Text": f"{sensor_type} #{index}",
+                    "Min": f"{value:.1f} {unit}",
+                    "Value": f"{value:.1f} {unit}",
+                    "Max": f"{value:.1f} {unit}",
+                    "SensorId": sensor_id,
+                    "Type": sensor_type.capitalize(),
+                    "ImageURL": "images/transparent.png",
+                    "Children": [],
+                }
+            )
+            node_id += 1
+        hardware.append({"id": node_id, "Text": hw, "ImageURL": "", "Children": children})
+        node_id += 1
+    tree = {"id": 0, "Text": "Sensor", "Min": "Min", "Value": "Value", "Max": "Max", "Children": hardware}
+    return tree, values
+
+
+class FakeLibreServer:
+    """A local stand-in for the LibreHardwareMonitor web server."""
+
+    def __init__(self, sensors: int, latency_ms: float):
+        tree, values = _sensor_tree(sensors)
+        data_json = json.dumps(tree).encode("utf-8")
+        self.sensor_ids = list(values)
+        self.requests = 0
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, body: bytes) -> None:
+                with lock:
+                    server.requests += 1
+                time.sleep(latency_ms / 1000)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self._reply(data_json)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                sensor_id = parse_qs(urlparse(self.path).query).get("id", [""])[0]
+                if sensor_id in values:
+                    body = {"result": "ok", "value": values[sensor_id], "format": "{0:F1} %"}
+                else:
+                    body = {"result": "fail", "message": "Sensor not found"}
+                self._reply(json.dumps(body).encode("utf-8"))
+
+            def log_message(self, *args):
+                pass
+
+        self._http = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._http.daemon_threads = True
+        self.port = self._http.server_address[1]
+        threading.Thread(target=self._http.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._http.shutdown()
+        self._http.server_close()
+
+
+class _PerSensorWidget:
+    """The former widget's network code: one request per widget, one blocking request per popup sensor."""
+
+    def __init__(self, port: int, sensor_id: str, popup_sensors: list[str]):
+        self._port = port
+        self._popup_sensors = popup_sensors
+        self._manager = QNetworkAccessManager()
+        self._manager.finished.connect(self._handle_network_response)
+        self._request = QNetworkRequest(QUrl(f"http://127.0.0.1:{port}/Sensor?action=Get&id={sensor_id}"))
+        self._request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/x-www-form-urlencoded")
+        self.done = False
+        self.popup_values = 0
+
+    def tick(self) -> None:
+        self._manager.post(self._request, b"")
+        for sensor_id in self._popup_sensors:
+            url = QUrl(f"http://127.0.0.1:{self._port}/Sensor?action=Get&id={sensor_id}")
+            request = QNetworkRequest(url)
+            request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/x-www-form-urlencoded")
+            manager = QNetworkAccessManager()
+            reply = manager.post(request, b"")
+            loop = QEventLoop()
+            reply.finished.connect(loop.quit)
+            loop.exec()
+            if reply.error() == QNetworkReply.NetworkError.NoError:
+                json.loads(reply.readAll().data().decode("utf-8"))
+                self.popup_values += 1
+            reply.deleteLater()
+
+    def _handle_network_response(self, reply: QNetworkReply) -> None:
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            json.loads(reply.readAll().data().decode("utf-8"))
+        self.done = True
+        reply.deleteLater()
+
+
+class _PollerWidget:
+    """The widget's network code now: poll the shared poller and render when it has current values."""
+
+    def __init__(self, poller: LibreMonitorPoller, sensor_id: str, popup_sensors: list[str], max_age_ms: int):
+        self._poller = poller
+        self._sensor_id = sensor_id
+        self._popup_sensors = popup_sensors
+        self._max_age_ms = max_age_ms
+        self._pending = False
+        self.done = False
+        self.popup_values = 0
+        poller.updated.connect(self._on_sensors_updated)
+
+    def tick(self) -> None:
+        self._pending = True
+        if self._poller.poll(self._max_age_ms):
+            self._on_sensors_updated()
+
+    def _on_sensors_updated(self) -> None:
+        if not self._pending:
+            return
+        self._pending = False
+        self._poller.readings.get(self._sensor_id)
+        self.popup_values += sum(1 for sensor_id in self._popup_sensors if sensor_id in self._poller.readings)
+        self.done = True
+
+
+def _percentiles(values: list[float]) -> dict:
+    values = sorted(values)
+    return {
+        "p50_ms": round(statistics.median(values), 3),
+        "p95_ms": round(values[max(int(len(values) * 0.95) - 1, 0)], 3),
+        "max_ms": round(values[-1], 3),
+    }
+
+
+def _refresh(app: QCoreApplication, widgets: list, timeout: float) -> tuple[float, float]:
+    """Tick every widget like their timers do, then wait until all have a value. Returns (blocked, total) ms."""
+    for widget in widgets:
+        widget.done = False
+    started = time.perf_counter()
+    for widget in widgets:
+        widget.tick()
+    blocked = time.perf_counter() - started
+    deadline = started + timeout
+    while not all(widget.done for widget in widgets) and time.perf_counter() < deadline:
+        app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 5)
+    return blocked * 1000, (time.perf_counter() - started) * 1000
+
+
+def run_mode(app: QCoreApplication, server: FakeLibreServer, args: argparse.Namespace, mode: str) -> dict:
+    port = server.port if not args.unreachable else 1
+    popup_sensors = server.sensor_ids[: args.popup_sensors]
+    poller = LibreMonitorPoller("127.0.0.1", port) if mode == "poller" else None
+    widgets = []
+    for bar in range(args.bars):
+        for index in range(args.widgets):
+            sensor_id = server.sensor_ids[(bar * args.widgets + index) % len(server.sensor_ids)]
+            popup = popup_sensors if index == 0 else []
+            if poller is None:
+                widgets.append(_PerSensorWidget(port, sensor_id, popup))
+            else:
+                widgets.append(_PollerWidget(poller, sensor_id, popup, args.interval_ms // 2))
+
+    requests_before = server.requests
+    blocked, total = [], []
+    for _ in range(args.refreshes):
+        refresh_blocked, refresh_total = _refresh(app, widgets, args.timeout)
+        blocked.append(refresh_blocked)
+        total.append(refresh_total)
+        # The rest of the interval, as the widget timers would leave it
+        idle_until = time.perf_counter() + max(args.interval_ms - refresh_total, 0) / 1000
+        while time.perf_counter() < idle_until:
+            app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 5)
+    result = {
+        "gui_blocked": _percentiles(blocked),
+        "refresh": _percentiles(total),
+        "requests_per_refresh": round((server.requests - requests_before) / args.refreshes, 2),
+        "popup_values": sum(widget.popup_values for widget in widgets),
+    }
+    if poller is not None:
+        result["poller"] = dict(poller.stats)
+    return result
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    server = FakeLibreServer(args.sensors, args.latency_ms)
+    results = {mode: run_mode(app, server, args, mode) for mode in ("per_sensor", "poller")}
+    server.close()
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "bars": args.bars,
+            "widgets": args.widgets,
+            "popup_sensors": args.popup_sensors,
+            "sensors": args.sensors,
+            "latency_ms": args.latency_ms,
+            "refreshes": args.refreshes,
+            "unreachable": args.unreachable,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare LibreHardwareMonitor polling per sensor and shared.")
+    parser.add_argument("--output", default="libre_monitor_bench.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="Previous JSON results to compare median blocked times against.")
+    parser.add_argument("--bars", type=int, default=3, help="Number of bars.")
+    parser.add_argument("--widgets", type=int, default=1, help="Libre monitor widgets per bar.")
+    parser.add_argument("--popup-sensors", type=int, default=10, help="Sensors in the open popup of each bar.")
+    parser.add_argument("--sensors", type=int, default=200, help="Sensors in the served tree.")
+    parser.add_argument("--latency-ms", type=float, default=2, help="Server time per request.")
+    parser.add_argument("--interval-ms", type=int, default=1000, help="Widget update interval.")
+    parser.add_argument("--refreshes", type=int, default=10, help="Number of refreshes.")
+    parser.add_argument("--timeout", type=float, default=10, help="Seconds to wait for a refresh.")
+    parser.add_argument("--unreachable", action="store_true", help="Poll a port nothing listens on.")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["results"]
+    print(f"{'mode':<12}{'blocked p50 ms':>16}{'blocked max ms':>16}{'refresh p50 ms':>16}{'requests':>10}")
+    for mode, result in report["results"].items():
+        line = (
+            f"{mode:<12}{result['gui_blocked']['p50_ms']:>16.3f}{result['gui_blocked']['max_ms']:>16.3f}"
+            f"{result['refresh']['p50_ms']:>16.3f}{result['requests_per_refresh']:>10}"
+        )
+        before = previous.get(mode, {}).get("gui_blocked", {}).get("p50_ms")
+        if before:
+            line += f"   blocked p50 {(result['gui_blocked']['p50_ms'] - before) / before * 100:+.1f}%"
+        print(line)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
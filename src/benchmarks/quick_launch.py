@@ -0,0 +1,336 @@
+"""Headless latency benchmark for Quick Launch search.
+
+Drives individual providers and the QueryWorker with synthetic datasets
+(10k apps, 100k bookmarks, the bundled emoji set) and scripted keystroke
+sequences, and reports p50/p95/p99 per-keystroke latency and allocation
+peaks. Windows-only services (shell, COM, app data folder) are replaced
+with local stand-ins, so it also runs on Linux.
+
+Usage (from the src folder):
+    python benchmarks/quick_launch.py
+    python benchmarks/quick_launch.py --repeat 10 --output before.json
+    python benchmarks/quick_launch.py --output after.json --compare before.json
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Event
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+
+_PROVIDERS_PKG = "core.utils.widgets.quick_launch.providers"
+
+_WORDS = [
+    "Adobe", "Audio", "Backup", "Blender", "Calculator", "Camera", "Chrome", "Cloud", "Code", "Control",
+    "Desktop", "Discord", "Docker", "Editor", "Excel", "Explorer", "Firefox", "Git", "Google", "Helper",
+    "Install", "Java", "Manager", "Media", "Microsoft", "Monitor", "Music", "Notepad", "Office", "Outlook",
+    "Paint", "Photo", "Player", "Power", "Python", "Remote", "Settings", "Shell", "Slack", "Spotify",
+    "Steam", "Studio", "Sync", "Terminal", "Tools", "Update", "Viewer", "Visual", "Windows", "Word",
+]  # fmt: skip
+_DOMAINS = ["github.com", "docs.python.org", "stackoverflow.com", "news.ycombinator.com", "wikipedia.org",
+            "youtube.com", "reddit.com", "developer.mozilla.org", "learn.microsoft.com", "pypi.org"]  # fmt: skip
+_FOLDERS = ["Bookmarks bar", "Work", "Reading", "Python", "Recipes", "Travel", "News", "Tools", "Docs"]
+
+# Each sequence is typed one character at a time; "\b" is a backspace.
+_SEARCH_KEYS = ["chrome\b\b\b\bode", "visual studio", "mic off", "pyth\b\bthon", "zzq", "term\b\b\b\bterm"]
+_EMOJI_KEYS = [": smile", ": heart\b\b\b\bappy", ": thumbs up", ": cat face", ": flag"]
+_CALCULATOR_KEYS = ["= 2*(3+4)/5", "= sqrt(16)+2**10", "= 1,000,000/7"]
+_UNIT_KEYS = ["~ 10 km to mi", "~ 100 f to c", "~ 5 gb to mb"]
+_COLOR_KEYS = ["c: #ff8800", "c: rgb(10, 20, 30)", "c: oklch(0.7 0.1 200)", "c: rebeccapurple"]
+
+
+def _install_stubs(data_dir: Path) -> None:
+    """Replace Windows-only services with local stand-ins before any provider is imported."""
+    os.environ["LOCALAPPDATA"] = str(data_dir / "Local")
+    os.environ["APPDATA"] = str(data_dir / "Roaming")
+
+    def app_data_path(filename: str = None) -> Path:
+        folder = data_dir / "YASB"
+        folder.mkdir(parents=True, exist_ok=True)
+        return folder / filename if filename is not None else folder
+
+    utilities = types.ModuleType("core.utils.utilities")
+    utilities.app_data_path = app_data_path
+    shell_utils = types.ModuleType("core.utils.shell_utils")
+    shell_utils.shell_open = lambda *args, **kwargs: None
+    # Skip providers/__init__, which imports every provider including the Win32-only ones.
+    providers = types.ModuleType(_PROVIDERS_PKG)
+    providers.__path__ = [str(SRC_DIR / Path(*_PROVIDERS_PKG.split(".")))]
+    sys.modules.update(
+        {
+            "core.utils.utilities": utilities,
+            "core.utils.shell_utils": shell_utils,
+            _PROVIDERS_PKG: providers,
+        }
+    )
+
+    # pywin32 is only needed when a result is executed, never while searching.
+    if importlib.util.find_spec("pythoncom") is None:
+        sys.modules["pythoncom"] = types.ModuleType("pythoncom")
+        shell = types.ModuleType("win32comext.shell")
+        shell.shell = types.SimpleNamespace()
+        win32comext = types.ModuleType("win32comext")
+        win32comext.shell = shell
+        sys.modules.update({"win32comext": win32comext, "win32comext.shell": shell})
+
+
+def _make_apps(count: int, rng: random.Random) -> list[tuple[str, str, object]]:
+    apps: list[tuple[str, str, object]] = []
+    for i in range(count):
+        words = rng.sample(_WORDS, rng.randint(1, 3))
+        if rng.random() < 0.2:
+            words.append(str(rng.randint(2, 2026)))
+        name = " ".join(words)
+        if rng.random() < 0.15:
+            pkg = "".join(rng.sample(_WORDS, 2))
+            path = f"UWP::{rng.choice(_WORDS)}.{pkg}_{i:08x}!App"
+        else:
+            path = rf"C:\ProgramData\Microsoft\Windows\Start Menu\Programs\{words[0]}\{name} {i}.lnk"
+        apps.append((name, path, None))
+    return apps
+
+
+def _write_bookmarks(count: int, rng: random.Random) -> None:
+    """Write a Chrome bookmark file with *count* synthetic bookmarks."""
+    children = []
+    for i in range(count):
+        title = " ".join(rng.sample(_WORDS, rng.randint(2, 5)))
+        slug = "/".join(w.lower() for w in rng.sample(_WORDS, 2))
+        children.append({"type": "url", "name": title, "url": f"https://{rng.choice(_DOMAINS)}/{slug}/{i}"})
+    folders = [
+        {"type": "folder", "name": name, "children": children[i :: len(_FOLDERS)]} for i, name in enumerate(_FOLDERS)
+    ]
+    profile = Path(os.environ["LOCALAPPDATA"]) / "Google" / "Chrome" / "User Data" / "Default"
+    profile.mkdir(parents=True, exist_ok=True)
+    data = {"roots": {"bookmark_bar": {"type": "folder", "name": "Bookmarks bar", "children": folders}}}
+    (profile / "Bookmarks").write_text(json.dumps(data), encoding="utf-8")
+
+
+def _keystrokes(sequence: str) -> list[str]:
+    """Expand a typed sequence into the query text after every keystroke."""
+    texts: list[str] = []
+    text = ""
+    for ch in sequence:
+        text = text[:-1] if ch == "\b" else text + ch
+        texts.append(text)
+    return texts
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(p: float) -> float:
+        return ordered[min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))]
+
+    return {
+        "p50": round(pick(50), 4),
+        "p95": round(pick(95), 4),
+        "p99": round(pick(99), 4),
+        "mean": round(statistics.fmean(ordered), 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def _measure(name: str, kind: str, texts: list[str], run: Callable[[str], object], repeat: int) -> dict:
+    """Time *run* for every keystroke text, then measure its allocation peak in a separate pass."""
+    for text in texts:  # warm-up, fills lazy indexes and caches
+        run(text)
+
+    latencies: list[float] = []
+    for _ in range(repeat):
+        for text in texts:
+            started = time.perf_counter_ns()
+            run(text)
+            latencies.append((time.perf_counter_ns() - started) / 1e6)
+
+    peaks: list[float] = []
+    tracemalloc.start()
+    try:
+        for text in texts:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            run(text)
+            peaks.append((tracemalloc.get_traced_memory()[1] - base) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": name,
+        "kind": kind,
+        "keystrokes": len(texts),
+        "samples": len(latencies),
+        "latency_ms": _percentiles(latencies),
+        "alloc_peak_kib": _percentiles(peaks),
+    }
+
+
+def _provider_runner(provider) -> Callable[[str], object]:
+    cancel = Event()
+    return lambda text: provider.get_results(text, cancel_event=cancel)
+
+
+def _worker_runner(worker, providers: list, max_results: int) -> Callable[[str], object]:
+    """Run a query on the calling thread and wait for the worker's final emission."""
+    done: list[bool] = []
+    worker.finished.connect(lambda _query_id, _results, final: final and done.append(True))
+
+    def run(text: str):
+        done.clear()
+        worker._run_query("bench", text.lstrip(), max_results, providers, Event())
+        if not done:
+            raise RuntimeError(f"QueryWorker did not finish {text!r}")
+
+    return run
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    data_dir = Path(tempfile.mkdtemp(prefix="yasb_quick_launch_bench_"))
+    _install_stubs(data_dir)
+
+    from core.utils.widgets.quick_launch.fuzzy import fuzzy_score
+    from core.utils.widgets.quick_launch.providers.apps import AppsProvider
+    from core.utils.widgets.quick_launch.providers.bookmarks import BookmarksProvider
+    from core.utils.widgets.quick_launch.providers.calculator import CalculatorProvider
+    from core.utils.widgets.quick_launch.providers.color import ColorProvider
+    from core.utils.widgets.quick_launch.providers.emoji import EmojiProvider
+    from core.utils.widgets.quick_launch.providers.unit_converter import UnitConverterProvider
+    from core.utils.widgets.quick_launch.result_cache import ResultCache
+    from core.utils.widgets.quick_launch.search_index import AppSearchIndex
+    from core.utils.widgets.quick_launch.workers import QueryWorker
+
+    setup: dict[str, float] = {}
+    started = time.perf_counter()
+    apps = _make_apps(args.apps, rng)
+    app_index = AppSearchIndex(apps)
+    setup["app_index_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    apps_provider = AppsProvider({"prefix": "*", "_max_results": args.max_results})
+    # The provider resolves QuickLaunchService lazily; hand it the synthetic app list instead.
+    apps_provider._service = types.SimpleNamespace(apps=apps, app_index=app_index, icon_paths={})
+
+    _write_bookmarks(args.bookmarks, rng)
+    bookmarks_provider = BookmarksProvider({"prefix": "*", "_max_results": args.max_results})
+    started = time.perf_counter()
+    bookmarks_provider.get_results("")
+    setup["bookmarks_ingest_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    emoji_provider = EmojiProvider({"prefix": ":", "_max_results": args.max_results})
+    started = time.perf_counter()
+    emoji_provider.get_results(": a")
+    setup["emoji_index_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    calculator = CalculatorProvider({"prefix": "=", "_max_results": args.max_results})
+    unit_converter = UnitConverterProvider({"prefix": "~", "_max_results": args.max_results})
+    color = ColorProvider({"prefix": "c:", "_max_results": args.max_results})
+
+    search_texts = [t for seq in _SEARCH_KEYS for t in _keystrokes(seq)]
+    app_names = [name for name, _, _ in apps]
+    keys = {
+        "emoji": [t for seq in _EMOJI_KEYS for t in _keystrokes(seq)],
+        "calculator": [t for seq in _CALCULATOR_KEYS for t in _keystrokes(seq)],
+        "unit_converter": [t for seq in _UNIT_KEYS for t in _keystrokes(seq)],
+        "color": [t for seq in _COLOR_KEYS for t in _keystrokes(seq)],
+    }
+
+    def score_all(text: str):
+        query = text.lower()
+        return [fuzzy_score(query, name) for name in app_names]
+
+    results = [
+        _measure("fuzzy_score", "fuzzy", search_texts, score_all, args.repeat),
+        _measure("apps", "provider", search_texts, _provider_runner(apps_provider), args.repeat),
+        _measure("bookmarks", "provider", search_texts, _provider_runner(bookmarks_provider), args.repeat),
+        _measure("emoji", "provider", keys["emoji"], _provider_runner(emoji_provider), args.repeat),
+        _measure("calculator", "provider", keys["calculator"], _provider_runner(calculator), args.repeat),
+        _measure("unit_converter", "provider", keys["unit_converter"], _provider_runner(unit_converter), args.repeat),
+        _measure("color", "provider", keys["color"], _provider_runner(color), args.repeat),
+    ]
+
+    providers = [apps_provider, bookmarks_provider, emoji_provider, calculator, unit_converter, color]
+    mixed = search_texts + [t for texts in keys.values() for t in texts]
+    for parallel in (False, True):
+        cache = ResultCache() if args.cache else None
+        worker = QueryWorker(cache, parallel=parallel)
+        try:
+            name = "query_worker_parallel" if parallel else "query_worker_serial"
+            results.append(
+                _measure(name, "worker", mixed, _worker_runner(worker, providers, args.max_results), args.repeat)
+            )
+        finally:
+            worker.shutdown()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "apps": args.apps,
+            "bookmarks": args.bookmarks,
+            "max_results": args.max_results,
+            "result_cache": args.cache,
+            "setup": setup,
+        },
+        "results": results,
+    }
+
+
+def _print_report(report: dict, baseline: dict | None) -> None:
+    previous = {r["name"]: r for r in baseline["results"]} if baseline else {}
+    print(f"{'benchmark':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'alloc p95 KiB':>15}")
+    for r in report["results"]:
+        lat, alloc = r["latency_ms"], r["alloc_peak_kib"]
+        line = f"{r['name']:<24}{lat['p50']:>10.3f}{lat['p95']:>10.3f}{lat['p99']:>10.3f}{alloc['p95']:>15.1f}"
+        old = previous.get(r["name"])
+        if old and old["latency_ms"].get("p95"):
+            change = (lat["p95"] - old["latency_ms"]["p95"]) / old["latency_ms"]["p95"] * 100
+            line += f"   p95 {change:+.1f}%"
+        print(line)
+    for key, value in report["meta"]["setup"].items():
+        print(f"setup {key}: {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Quick Launch providers and the query worker.")
+    parser.add_argument("--output", default="quick_launch_bench.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="Previous JSON results to compare p95 latency against.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over every keystroke sequence.")
+    parser.add_argument("--apps", type=int, default=10_000, help="Number of synthetic apps.")
+    parser.add_argument("--bookmarks", type=int, default=100_000, help="Number of synthetic bookmarks.")
+    parser.add_argument("--max-results", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--cache", action="store_true", help="Run the query worker with the result cache enabled.")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    report = run_benchmarks(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    _print_report(report, baseline)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark for the stylesheet pipeline (CSSProcessor).
+
+Generates a synthetic theme of a few thousand rules spread over a deep
+``@import`` chain, with variables that reference variables defined in
+earlier files, and times three cases: a cold compile with empty caches,
+a reload of the unchanged graph, and a reload after editing one file.
+
+Usage (from the src folder):
+    python benchmarks/stylesheet.py
+    python benchmarks/stylesheet.py --rules 5000 --depth 40 --output before.json
+    python benchmarks/stylesheet.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SRC_DIR))
+
+from core.utils.css_processor import CSSProcessor  # noqa: E402
+
+_PROPERTIES = ["color", "background-color", "border-color", "padding", "margin", "font-size", "border-radius"]
+_CLASSES = ["widget", "label", "icon", "container", "popup", "menu", "item", "header", "button", "workspace"]
+
+
+def _write_theme(root: Path, rules: int, depth: int, rng: random.Random) -> Path:
+    """Write *depth* chained files holding *rules* rules in total; returns the main stylesheet."""
+    per_file = max(1, rules // (depth + 1))
+    files = [root / "styles.css"] + [root / "theme" / f"part_{i:03}.css" for i in range(depth)]
+    (root / "theme").mkdir(parents=True, exist_ok=True)
+    for index, path in enumerate(files):
+        lines = [f"/* {path.name}: generated theme part {index} */"]
+        if index + 1 < len(files):
+            lines.append(f'@import "theme/{files[index + 1].name}";')
+        lines.append(":root {")
+        for v in range(20):
+            if index and v % 2:
+                lines.append(f"  --c{index}-{v}: var(--c{index - 1}-{v});  /* chained */")
+            else:
+                lines.append(f"  --c{index}-{v}: #{rng.randrange(16**8):08x};")
+        lines.append("}")
+        for r in range(per_file):
+            selector = f".{rng.choice(_CLASSES)}-{index}-{r} .{rng.choice(_CLASSES)}"
+            body = []
+            for prop in rng.sample(_PROPERTIES, 3):
+                if "color" in prop:
+                    body.append(f"{prop}: var(--c{index}-{rng.randrange(20)});")
+                else:
+                    body.append(f"{prop}: {rng.randrange(1, 12)}px;")
+            lines.append(f"{selector} {{ {' '.join(body)} }} // rule {r}")
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return files[0]
+
+
+def _time(run, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        run()
+        samples.append((time.perf_counter_ns() - started) / 1e6)
+    return {"mean": round(statistics.fmean(samples), 3), "min": round(min(samples), 3), "max": round(max(samples), 3)}
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="yasb-css-bench-") as tmp:
+        main_path = _write_theme(Path(tmp), args.rules, args.depth, rng)
+        edited = Path(tmp) / "theme" / f"part_{args.depth // 2:03}.css"
+        original = edited.read_text(encoding="utf-8")
+
+        def cold():
+            CSSProcessor.clear_cache()
+            CSSProcessor(str(main_path)).process()
+
+        def warm():
+            CSSProcessor(str(main_path)).process()
+
+        edits = iter(range(10**9))
+
+        def edit_one():
+            edited.write_text(original + f".edited-{next(edits)} {{ color: red; }}\n", encoding="utf-8")
+            CSSProcessor(str(main_path)).process()
+
+        results = {"cold": _time(cold, args.repeat)}
+        warm()
+        results["unchanged"] = _time(warm, args.repeat)
+        results["one_file_edited"] = _time(edit_one, args.repeat)
+        size = len(CSSProcessor(str(main_path)).process())
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rules": args.rules,
+            "depth": args.depth,
+            "output_chars": size,
+        },
+        "results_ms": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the stylesheet processor on a large synthetic theme.")
+    parser.add_argument("--output", default="stylesheet_bench.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="Previous JSON results to compare mean times against.")
+    parser.add_argument("--rules", type=int, default=5000, help="Number of rules in the theme.")
+    parser.add_argument("--depth", type=int, default=40, help="Length of the @import chain.")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    report = run_benchmarks(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["results_ms"]
+    print(f"{'case':<20}{'mean ms':>10}{'min ms':>10}{'max ms':>10}")
+    for case, timing in report["results_ms"].items():
+        line = f"{case:<20}{timing['mean']:>10.3f}{timing['min']:>10.3f}{timing['max']:>10.3f}"
+        if previous.get(case, {}).get("mean"):
+            line += f"   mean {(timing['mean'] - previous[case]['mean']) / previous[case]['mean'] * 100:+.1f}%"
+        print(line)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
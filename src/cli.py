@@ -346,6 +346,30 @@ class CLIHandler:
             add_help=False,
         )
 
+        startup_profile_parser = subparsers.add_parser(
+            "startup-profile",
+            help="Write the startup timeline of the running application to a file",
+            prog="yasbc startup-profile",
+        )
+        startup_profile_parser.add_argument(
+            "-f",
+            "--format",
+            choices=["json", "chrome"],
+            default="json",
+            help="Plain JSON, or Chrome trace format for chrome://tracing and Perfetto",
+        )
+        startup_profile_parser.add_argument(
+            "-o",
+            "--output",
+            help="Output file (default: yasb_startup.json in the current directory)",
+        )
+
+        subparsers.add_parser(
+            "event-stats",
+            help="Write event listeners and per-event counters to the log",
+            add_help=False,
+        )
+
         subparsers.add_parser(
             "config-dir",
             help="Open config directory in file explorer",
@@ -595,6 +619,33 @@ class CLIHandler:
             print("Reset complete.")
             sys.exit(0)
 
+        elif args.command == "startup-profile":
+            if not is_process_running("yasb.exe"):
+                print("YASB is not running.")
+                sys.exit(1)
+            output_path = os.path.abspath(args.output or "yasb_startup.json")
+            if os.path.splitext(output_path)[1].lower() != ".json":
+                print("The output file must have a .json extension.")
+                sys.exit(1)
+            previous_mtime = os.path.getmtime(output_path) if os.path.exists(output_path) else None
+            self.send_command_to_application(f"startup-profile {args.format} {output_path}")
+            # The application writes the file after acknowledging the command
+            for _ in range(50):
+                if os.path.exists(output_path) and os.path.getmtime(output_path) != previous_mtime:
+                    print(f"Startup timeline written to {output_path}")
+                    sys.exit(0)
+                time.sleep(0.1)
+            print("YASB did not write the startup timeline. Check the logs with 'yasbc log'.")
+            sys.exit(1)
+
+        elif args.command == "event-stats":
+            if not is_process_running("yasb.exe"):
+                print("YASB is not running.")
+                sys.exit(1)
+            self.send_command_to_application("event-stats")
+            print("Event statistics written to the log. View them with 'yasbc log'.")
+            sys.exit(0)
+
         elif args.command == "config-dir":
             try:
                 subprocess.Popen(["explorer", DEFAULT_CONFIG_DIRECTORY])
@@ -627,6 +678,8 @@ class CLIHandler:
                   update                    Update the application
                   log                       Tail yasb process logs (cancel with Ctrl-C)
                   reset                     Restore default config files and clear cache
+                  startup-profile           Write the startup timeline (JSON or Chrome trace)
+                  event-stats               Log event listeners and per-event counters
                   config-dir                Open config directory in file explorer
                   help                      Print this message
 
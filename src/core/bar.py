@@ -13,6 +13,7 @@ from core.bar_helper import (
     OsThemeManager,
 )
 from core.event_service import EventService
+from core.utils.stylesheet_scope import apply_scoped_stylesheet, clear_scoped_stylesheets
 from core.utils.utilities import is_valid_percentage_str, percent_to_float
 from core.utils.win32.utilities import get_monitor_hwnd
 from core.utils.win32.win32_accent import Blur
@@ -65,6 +66,7 @@ class Bar(QWidget):
         self._maximized_watcher = None
         self._animation_manager = None
         self._target_screen = bar_screen
+        self._column_layouts: dict[str, QHBoxLayout] = {}
 
         self.screen_name = self._target_screen.name()
         self.app_bar_edge = (
@@ -72,6 +74,8 @@ class Bar(QWidget):
         )
 
         self.setWindowTitle(APP_BAR_TITLE)
+        # The latest stylesheet; the bar's own sheet lags behind it while widgets carry scoped rules
+        self._stylesheet = stylesheet
         self.setStyleSheet(stylesheet)
         self.setWindowFlag(Qt.WindowType.Tool)
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
@@ -145,6 +149,93 @@ class Bar(QWidget):
     def bar_id(self) -> str:
         return self._bar_id
 
+    @property
+    def bar_name(self) -> str:
+        return self._bar_name
+
+    @property
+    def widgets(self) -> dict[str, list[QWidget]]:
+        return self._widgets
+
+    def update_stylesheet(self, stylesheet: str) -> None:
+        """Apply *stylesheet*, restyling only the widgets its changes reach when possible."""
+        self._stylesheet = stylesheet
+        widgets = [widget for column in self._widgets.values() for widget in column]
+        if not apply_scoped_stylesheet(self.styleSheet(), stylesheet, widgets):
+            self.setStyleSheet(stylesheet)
+            clear_scoped_stylesheets(widgets)
+
+    def apply_geometry_config(self, config: BarConfig) -> None:
+        """Adopt the alignment, dimensions and padding of *config* and reposition the bar."""
+        self.config = config
+        self._alignment = config.alignment.model_dump()
+        self._align = self._alignment["align"]
+        self._dimensions = config.dimensions.model_dump()
+        self._padding = config.padding.model_dump()
+        self._context_menu = config.context_menu
+        self.app_bar_edge = (
+            app_bar.AppBarEdge.Top if self._alignment["position"] == "top" else app_bar.AppBarEdge.Bottom
+        )
+        is_auto_width = str(config.dimensions.width).lower() == "auto"
+        if is_auto_width != self._is_auto_width:
+            self._is_auto_width = is_auto_width
+            if is_auto_width:
+                self._bar_frame.installEventFilter(self)
+            else:
+                self._bar_frame.removeEventFilter(self)
+        self.position_bar()
+        self.update_app_bar()
+        if self._autohide_manager and self._autohide_manager.is_enabled():
+            self._autohide_manager.setup_detection_zone()
+        if self._is_auto_width:
+            QTimer.singleShot(0, self._sync_auto_width)
+
+    def set_widgets(self, widgets: dict[str, list[QWidget]], config: BarConfig) -> None:
+        """Lay out *widgets* in place of the current ones.
+
+        Widgets present in both the old and new layout are moved rather than
+        recreated; the rest of the old widgets are closed and deleted.
+        """
+        self.config = config
+        self._context_menu = config.context_menu
+        self._widget_config_map = config.widgets.model_dump() or {}
+        kept = {id(widget) for column in widgets.values() for widget in column}
+        for layout_type, layout in self._column_layouts.items():
+            for widget in self._widgets.get(layout_type, []):
+                layout.removeWidget(widget)
+                if id(widget) not in kept:
+                    self._shutdown_widget(widget)
+                    widget.close()
+                    widget.deleteLater()
+            # Only the stretch items are left; widgets go after a leading one.
+            layout_config = self._layouts.model_dump()[layout_type]
+            offset = 1 if layout_config["stretch"] and layout_config["alignment"] in ("center", "right") else 0
+            for index, widget in enumerate(widgets.get(layout_type, [])):
+                widget.parent_layout_type = layout_type
+                widget.bar_id = self.bar_id
+                widget.monitor_hwnd = self.monitor_hwnd
+                layout.insertWidget(offset + index, widget, 0)
+                widget.show()
+        self._widgets = widgets
+        if self.styleSheet() != self._stylesheet:
+            # New widgets only see the bar's older sheet, scope the latest one for them too.
+            self.update_stylesheet(self._stylesheet)
+        if self._is_auto_width:
+            QTimer.singleShot(0, self._sync_auto_width)
+
+    def shutdown_widgets(self) -> None:
+        """Shut down every widget before the bar itself is closed."""
+        for column in self._widgets.values():
+            for widget in column:
+                self._shutdown_widget(widget)
+
+    @staticmethod
+    def _shutdown_widget(widget: QWidget) -> None:
+        try:
+            widget.shutdown()
+        except Exception:
+            logging.exception("Failed to shut down widget %s", getattr(widget, "widget_name", widget))
+
     def on_geometry_changed(self, geo: QRect) -> None:
         logging.info(
             "Screen geometry changed. Updating position for bar %s on screen %s",
@@ -306,6 +397,7 @@ class Bar(QWidget):
                 layout.addStretch(1)
 
             layout_container.setLayout(layout)
+            self._column_layouts[layout_type] = layout
             bar_layout.addWidget(layout_container, 0, column_num)
 
         self._bar_frame.setLayout(bar_layout)
@@ -329,6 +421,7 @@ class Bar(QWidget):
                 self.show_bar()
 
     def closeEvent(self, event):
+        self._event_service.unregister_event("handle_bar_cli", self.handle_bar_management)
         if self._hide_on_fullscreen and self.app_bar_manager:
             AppBarManager().unregister_bar(int(self.winId()))
 
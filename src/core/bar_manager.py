@@ -11,6 +11,7 @@ from core.bar_helper import ThemeState
 from core.config import get_config, get_stylesheet
 from core.event_service import EventService
 from core.utils.controller import reload_application
+from core.utils.startup_timeline import startup_timeline
 from core.utils.utilities import get_screen_by_name
 from core.utils.widget_builder import WidgetBuilder
 from core.utils.win32.hotkeys import (
@@ -22,6 +23,12 @@ from core.utils.win32.hotkeys import (
 from core.validation.bar import BarConfig
 from core.validation.config import YasbConfig
 
+# Bar settings that can be applied to a running bar; any other change recreates it
+_BAR_GEOMETRY_FIELDS = {"alignment", "dimensions", "padding"}
+_BAR_LIVE_FIELDS = _BAR_GEOMETRY_FIELDS | {"widgets", "context_menu"}
+# Top-level settings that the in-place reload knows how to apply
+_LIVE_CONFIG_FIELDS = {"watch_config", "watch_stylesheet", "watch_delay", "bars", "widgets"}
+
 
 class BarManager(QObject):
     styles_modified = pyqtSignal()
@@ -65,7 +72,7 @@ class BarManager(QObject):
             self.stylesheet = stylesheet
             ThemeState.set_stylesheet(stylesheet)
             for bar in self.bars:
-                bar.setStyleSheet(self.stylesheet)
+                bar.update_stylesheet(self.stylesheet)
 
     @pyqtSlot()
     def on_config_modified(self):
@@ -76,17 +83,146 @@ class BarManager(QObject):
             return
         if config and (config != self.config):
             # Fields that don't trigger a full application reload
-            exclude = {"watch_config", "watch_stylesheet"}
+            exclude = {"watch_config", "watch_stylesheet", "watch_delay"}
 
             if config.model_dump(exclude=exclude) != self.config.model_dump(exclude=exclude):
-                self.config = config
-                self._disconnect_reload_signals()
-                reload_application("Reloading Application because of config change.")
+                if self._reload_in_place(config):
+                    logging.info("Applied config change without restarting.")
+                else:
+                    self.config = config
+                    self._disconnect_reload_signals()
+                    reload_application("Reloading Application because of config change.")
             else:
                 self.config = config
                 logging.info("Configuration updated (no reload required).")
             logging.info("Successfully loaded updated config and re-initialised all bars.")
 
+    def _reload_in_place(self, config: YasbConfig) -> bool:
+        """Apply *config* to the running bars, returning False if a full restart is needed.
+
+        Only widgets whose validated config changed are rebuilt, bars whose
+        geometry changed are repositioned, and event listeners are started or
+        stopped as the widgets that need them come and go. Adding or removing
+        bars, changing their screens or any other top-level setting still
+        restarts the application.
+        """
+        config.bars = {n: bar for n, bar in config.bars.items() if bar.enabled}
+        if config.model_dump(exclude=_LIVE_CONFIG_FIELDS) != self.config.model_dump(exclude=_LIVE_CONFIG_FIELDS):
+            return False
+        if config.bars.keys() != self.config.bars.keys():
+            return False
+        if any(bar.screens != self.config.bars[name].screens for name, bar in config.bars.items()):
+            return False
+        try:
+            self._apply_config(config)
+        except Exception:
+            logging.exception("Failed to apply config change in place.")
+            return False
+        return True
+
+    def _apply_config(self, config: YasbConfig) -> None:
+        old_config = self.config
+        old_builder = self._widget_builder
+        builder = WidgetBuilder(config.widgets)
+        changed = {
+            name
+            for name in old_config.widgets.keys() | config.widgets.keys()
+            if old_builder.normalized_config(name) != builder.normalized_config(name)
+        }
+        changed |= self._groupers_containing(config, changed)
+        self.config = config
+        self._widget_builder = builder
+
+        for bar in list(self.bars):
+            old_bar_config = old_config.bars[bar.bar_name]
+            bar_config = config.bars[bar.bar_name]
+            diff = {
+                field
+                for field in BarConfig.model_fields
+                if getattr(old_bar_config, field) != getattr(bar_config, field)
+            }
+            if diff - _BAR_LIVE_FIELDS:
+                logging.info("Recreating bar %s on screen %s.", bar.bar_name, bar.screen_name)
+                screen = bar.screen()
+                self.bars.remove(bar)
+                bar.shutdown_widgets()
+                bar.close()
+                self.create_bar(bar_config, bar.bar_name, screen)
+                continue
+            if diff & _BAR_GEOMETRY_FIELDS:
+                bar.apply_geometry_config(bar_config)
+            names = {name for column in bar_config.widgets.model_dump().values() for name in column}
+            if "widgets" in diff or "context_menu" in diff or changed & names:
+                self._update_bar_widgets(bar, bar_config, changed)
+
+        self._assign_hotkey_handlers()
+        old_bindings = list(self._collected_keybindings)
+        self._collect_keybindings()
+        if self._collected_keybindings != old_bindings:
+            self._stop_hotkey_listener()
+            self._start_hotkey_listener()
+
+        bar_widget_names = [
+            name
+            for bar_config in config.bars.values()
+            for column in bar_config.widgets.model_dump().values()
+            for name in column
+        ]
+        needed = builder.collect_event_listeners(bar_widget_names)
+        running = set(self._threads)
+        for listener in running - needed:
+            self._stop_listener(listener)
+        for listener in needed - running:
+            self._start_listener(listener)
+        self.widget_event_listeners = needed
+        builder.raise_alerts_if_errors_present()
+
+    @staticmethod
+    def _groupers_containing(config: YasbConfig, names: set[str]) -> set[str]:
+        """Return the groupers that contain any of *names*, directly or through other groupers."""
+        groupers = {
+            name: set(cfg.get("options", {}).get("widgets", []) or [])
+            for name, cfg in config.widgets.items()
+            if cfg.get("type", "").endswith("GrouperWidget")
+        }
+        found: set[str] = set()
+        pending = set(names)
+        while pending:
+            pending = {name for name, children in groupers.items() if children & pending and name not in found}
+            found |= pending
+        return found
+
+    def _update_bar_widgets(self, bar: Bar, bar_config: BarConfig, changed: set[str]) -> None:
+        """Rebuild the changed widgets of *bar* and move the rest into their new places."""
+        reusable: dict[str, list] = {}
+        for widgets in bar.widgets.values():
+            for widget in widgets:
+                if widget.widget_name not in changed:
+                    reusable.setdefault(widget.widget_name, []).append(widget)
+
+        bar_widgets = {}
+        for column, widget_names in bar_config.widgets.model_dump().items():
+            bar_widgets[column] = []
+            for widget_name in widget_names:
+                if reusable.get(widget_name):
+                    bar_widgets[column].append(reusable[widget_name].pop(0))
+                    continue
+                widget = self._widget_builder._build_widget(widget_name)
+                if widget is not None:
+                    widget.screen_name = bar.screen_name
+                    bar_widgets[column].append(widget)
+        bar.set_widgets(bar_widgets, bar_config)
+
+    def _assign_hotkey_handlers(self) -> None:
+        """Let only the first instance of each widget on a screen handle its hotkeys."""
+        self._registered_hotkey_widgets.clear()
+        for bar in self.bars:
+            for widget_list in bar.widgets.values():
+                for widget in widget_list:
+                    key = (widget.widget_name, widget.screen_name)
+                    widget._hotkey_enabled = key not in self._registered_hotkey_widgets
+                    self._registered_hotkey_widgets.add(key)
+
     @pyqtSlot(QScreen)
     def on_screens_update(self, _screen: QScreen) -> None:
         logging.info("Screens updated. Re-initialising all bars.")
@@ -95,13 +231,32 @@ class BarManager(QObject):
 
     def run_listeners_in_threads(self):
         for listener in self.widget_event_listeners:
-            logging.info("Starting %s...", listener.__name__)
+            self._start_listener(listener)
+
+    def _start_listener(self, listener) -> None:
+        logging.info("Starting %s...", listener.__name__)
+        with startup_timeline.phase(listener.__name__, "listener"):
             thread = listener()
             thread.start()
-            self._threads[listener] = thread
+        self._threads[listener] = thread
 
-    def stop_listener_threads(self):
-        # Stop hotkey listener first
+    def _stop_listener(self, listener) -> None:
+        logging.info("Stopping %s...", listener.__name__)
+        with suppress(KeyError):
+            thread = self._threads.pop(listener)
+            if hasattr(thread, "stop"):
+                try:
+                    thread.stop()
+                except Exception as e:
+                    logging.debug("Thread stop() raised for %s: %s", listener.__name__, e)
+            if hasattr(thread, "quit"):
+                try:
+                    thread.quit()
+                except Exception:
+                    pass
+            thread.wait(1000)
+
+    def _stop_hotkey_listener(self) -> None:
         if self._hotkey_listener is not None:
             logging.info("Stopping HotkeyListener...")
             with suppress(Exception):
@@ -110,21 +265,12 @@ class BarManager(QObject):
             self._hotkey_listener = None
             self._hotkey_dispatcher = None
 
+    def stop_listener_threads(self):
+        # Stop hotkey listener first
+        self._stop_hotkey_listener()
+
         for listener in self.widget_event_listeners:
-            logging.info("Stopping %s...", listener.__name__)
-            with suppress(KeyError):
-                thread = self._threads[listener]
-                if hasattr(thread, "stop"):
-                    try:
-                        thread.stop()
-                    except Exception as e:
-                        logging.debug("Thread stop() raised for %s: %s", listener.__name__, e)
-                if hasattr(thread, "quit"):
-                    try:
-                        thread.quit()
-                    except Exception:
-                        pass
-                thread.wait(1000)
+            self._stop_listener(listener)
         self._threads.clear()
         self.widget_event_listeners.clear()
 
@@ -172,9 +318,11 @@ class BarManager(QObject):
                         initialized_screens.add(screen.name())
 
         self._initialized_screens = initialized_screens
-        self._collect_keybindings()
-        self._start_hotkey_listener()
-        self.run_listeners_in_threads()
+        with startup_timeline.phase("register hotkeys"):
+            self._collect_keybindings()
+            self._start_hotkey_listener()
+        with startup_timeline.phase("run_listeners_in_threads"):
+            self.run_listeners_in_threads()
         self._widget_builder.raise_alerts_if_errors_present()
 
     def _collect_keybindings(self) -> None:
@@ -226,7 +374,8 @@ class BarManager(QObject):
     def create_bar(self, config: BarConfig, name: str, screen: QScreen, init: bool = False) -> None:
         screen_name = screen.name().replace("\\", "").replace(".", "")
         bar_id = f"{name}_{screen_name}_{str(uuid.uuid4())[:8]}"
-        bar_widgets, widget_event_listeners = self._widget_builder.build_widgets(config.widgets.model_dump())
+        with startup_timeline.phase("build widgets", bar=name, screen=screen.name()):
+            bar_widgets, widget_event_listeners = self._widget_builder.build_widgets(config.widgets.model_dump())
 
         # Set screen_name on all widgets and disable duplicate hotkey handlers
         widgets_with_keybindings = {
@@ -248,8 +397,8 @@ class BarManager(QObject):
                         self._registered_hotkey_widgets.add(key)
 
         self.widget_event_listeners = self.widget_event_listeners.union(widget_event_listeners)
-        self.bars.append(
-            Bar(
+        with startup_timeline.phase("create bar", bar=name, screen=screen.name()):
+            bar = Bar(
                 bar_id=bar_id,
                 bar_name=name,
                 bar_screen=screen,
@@ -258,4 +407,7 @@ class BarManager(QObject):
                 config=config,
                 init=init,
             )
-        )
+        self.bars.append(bar)
+        for widget_list in bar_widgets.values():
+            for widget in widget_list:
+                startup_timeline.watch_first_paint(widget, widget.widget_name)
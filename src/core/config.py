@@ -3,7 +3,7 @@ import os
 import re
 import sys
 from os import makedirs, path
-from typing import Any, cast
+from typing import cast
 from xml.dom import SyntaxErr
 
 from pydantic import ValidationError
@@ -14,7 +14,9 @@ from core.defaults.config import get_default_config
 from core.defaults.styles import get_default_styles
 from core.utils.alert_dialog import raise_info_alert
 from core.utils.css_processor import CSSProcessor
+from core.utils.startup_timeline import startup_timeline
 from core.utils.utilities import format_pydantic_errors_to_yaml
+from core.utils.validation_cache import validation_cache
 from core.validation.config import YasbConfig
 from settings import DEFAULT_CONFIG_DIRECTORY, DEFAULT_CONFIG_FILENAME, DEFAULT_STYLES_FILENAME, GITHUB_URL
 
@@ -97,7 +99,7 @@ def get_config(show_error_dialog: bool = False) -> YasbConfig | None:
     config_path = get_config_path()
 
     try:
-        with open(config_path, encoding="utf-8") as yaml_stream:
+        with startup_timeline.phase("config: parse yaml"), open(config_path, encoding="utf-8") as yaml_stream:
             config = safe_load(yaml_stream)
 
         if config is None:
@@ -108,7 +110,10 @@ def get_config(show_error_dialog: bool = False) -> YasbConfig | None:
             config = parse_env(config)
 
             # Validate and normalize with Pydantic
-            validated_config = YasbConfig(**cast(dict[str, Any], config if isinstance(config, dict) else {}))
+            with startup_timeline.phase("config: validate"):
+                validated_config = cast(
+                    YasbConfig, validation_cache.validate(YasbConfig, config if isinstance(config, dict) else {})
+                )
 
             # Return as dict for compatibility with the rest of the app
             return validated_config
@@ -139,8 +144,9 @@ def get_config(show_error_dialog: bool = False) -> YasbConfig | None:
 def get_stylesheet(show_error_dialog: bool = False) -> str | None:
     styles_path = get_stylesheet_path()
     try:
-        css_processor = CSSProcessor(styles_path)
-        css_content = css_processor.process()
+        with startup_timeline.phase("stylesheet: process"):
+            css_processor = CSSProcessor(styles_path)
+            css_content = css_processor.process()
         return css_content
 
     except SyntaxErr as e:
@@ -1,13 +1,54 @@
 import functools
+import heapq
 import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from threading import RLock
-from typing import Any
+from typing import Any, Literal
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from core.event_enums import Event
 
 
+@dataclass(frozen=True)
+class CoalescePolicy:
+    """
+    How bursts of one event type are reduced before they reach listeners.
+
+    ``latest``: the first event starts a window of ``interval_ms``; only the
+    last event of the window is delivered when it closes.
+    ``throttle``: an event is delivered at once if none was delivered in the
+    last ``interval_ms``; otherwise the last one is delivered when the
+    interval has passed.
+
+    With ``key``, events are coalesced separately per key, computed from the
+    emitted arguments (for example per window handle), so events about
+    different objects never replace each other.
+    """
+
+    mode: Literal["latest", "throttle"]
+    interval_ms: int
+    key: Callable[..., Any] | None = None
+
+
+class _EventStats:
+    __slots__ = ("emits", "dispatches", "coalesced", "dispatch_ns", "max_dispatch_ns")
+
+    def __init__(self):
+        self.emits = 0
+        self.dispatches = 0
+        self.coalesced = 0
+        self.dispatch_ns = 0
+        self.max_dispatch_ns = 0
+
+
+def _event_name(event_type: Event | str) -> str:
+    return event_type.name if isinstance(event_type, Event) else str(event_type)
+
+
 @functools.lru_cache()
 class EventService(QObject):
     def __init__(self) -> None:
@@ -15,6 +56,15 @@ class EventService(QObject):
         self._registered_event_signals: dict[Event, list[pyqtSignal]] = {}
         self._mutex = RLock()
         self._is_shutdown: bool = False
+        self._policies: dict[Event | str, CoalescePolicy] = {}
+        # (event type, key) -> latest arguments waiting for their window to close
+        self._pending: dict[tuple, tuple] = {}
+        self._last_dispatch: dict[tuple, float] = {}
+        self._schedule: list[tuple[float, int, tuple]] = []
+        self._schedule_seq = 0
+        self._schedule_cond = threading.Condition(self._mutex)
+        self._scheduler: threading.Thread | None = None
+        self._stats: dict[Event | str, _EventStats] = {}
 
     def register_event(self, event_type: Event, event_signal: pyqtSignal):
         with self._mutex:
@@ -41,9 +91,31 @@ class EventService(QObject):
             if not signals:
                 self._registered_event_signals.pop(event_type, None)
 
+    def set_coalescing(self, event_type: Event | str, policy: CoalescePolicy | None) -> None:
+        """Coalesce bursts of *event_type* according to *policy*, or deliver every event if None."""
+        with self._mutex:
+            if policy is None:
+                self._policies.pop(event_type, None)
+            else:
+                self._policies[event_type] = policy
+
     def emit_event(self, event_type: Event, *args: Any):
         if self._is_shutdown:
             return
+        with self._mutex:
+            stats = self._stats.get(event_type)
+            if stats is None:
+                stats = self._stats[event_type] = _EventStats()
+            stats.emits += 1
+            if event_type not in self._registered_event_signals:
+                return
+            policy = self._policies.get(event_type)
+            if policy is not None and self._defer(event_type, policy, args, stats):
+                return
+            self._dispatch(event_type, args, stats)
+
+    def _dispatch(self, event_type: Event, args: tuple, stats: _EventStats) -> None:
+        started = time.perf_counter_ns()
         with self._mutex:
             event_signals = self._registered_event_signals.get(event_type, [])
             # Iterate over a shallow copy so we can modify the original list safely
@@ -55,13 +127,128 @@ class EventService(QObject):
                     with self._mutex:
                         if event_signal in event_signals:
                             event_signals.remove(event_signal)
+            elapsed = time.perf_counter_ns() - started
+            stats.dispatches += 1
+            stats.dispatch_ns += elapsed
+            stats.max_dispatch_ns = max(stats.max_dispatch_ns, elapsed)
+
+    def _defer(self, event_type: Event, policy: CoalescePolicy, args: tuple, stats: _EventStats) -> bool:
+        """Apply *policy* to an event; returns False if it should be dispatched right away. Holds the mutex."""
+        try:
+            slot = (event_type, policy.key(*args) if policy.key else None)
+        except Exception:
+            logging.debug("Coalescing key failed for %s; dispatching directly", event_type)
+            return False
+        if slot in self._pending:
+            self._pending[slot] = args
+            stats.coalesced += 1
+            return True
+
+        interval = policy.interval_ms / 1000
+        now = time.monotonic()
+        if policy.mode == "throttle":
+            elapsed = now - self._last_dispatch.get(slot, float("-inf"))
+            if elapsed >= interval:
+                self._last_dispatch[slot] = now
+                self._prune_last_dispatch(now, interval)
+                return False
+            interval -= elapsed
+        self._pending[slot] = args
+        self._schedule_seq += 1
+        heapq.heappush(self._schedule, (now + interval, self._schedule_seq, slot))
+        if self._scheduler is None:
+            self._scheduler = threading.Thread(target=self._run_scheduler, name="EventService", daemon=True)
+            self._scheduler.start()
+        self._schedule_cond.notify()
+        return True
+
+    def _prune_last_dispatch(self, now: float, interval: float) -> None:
+        # Keyed throttles (one entry per window, say) would otherwise grow without bound
+        if len(self._last_dispatch) > 1024:
+            self._last_dispatch = {slot: t for slot, t in self._last_dispatch.items() if now - t < interval}
+
+    def _run_scheduler(self) -> None:
+        """Deliver deferred events when their window closes."""
+        while True:
+            with self._schedule_cond:
+                while not self._schedule and not self._is_shutdown:
+                    self._schedule_cond.wait()
+                if self._is_shutdown:
+                    return
+                due, _, slot = self._schedule[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._schedule_cond.wait(delay)
+                    continue
+                heapq.heappop(self._schedule)
+                args = self._pending.pop(slot, None)
+                if args is None:
+                    continue
+                event_type = slot[0]
+                policy = self._policies.get(event_type)
+                if policy is not None and policy.mode == "throttle":
+                    self._last_dispatch[slot] = time.monotonic()
+                self._dispatch(event_type, args, self._stats[event_type])
+
+    def stats(self) -> dict[str, dict]:
+        """Per event type: emits, dispatches, events dropped by coalescing, listeners and dispatch time."""
+        with self._mutex:
+            result = {}
+            for event_type, stats in self._stats.items():
+                result[_event_name(event_type)] = {
+                    "emits": stats.emits,
+                    "dispatches": stats.dispatches,
+                    "coalesced": stats.coalesced,
+                    "listeners": len(self._registered_event_signals.get(event_type, [])),
+                    "dispatch_ms": round(stats.dispatch_ns / 1e6, 3),
+                    "max_dispatch_ms": round(stats.max_dispatch_ns / 1e6, 3),
+                    "policy": self._policies.get(event_type),
+                }
+            return result
+
+    def log_registry(self) -> None:
+        """Log every registered listener and the per-event counters, busiest events first."""
+        with self._mutex:
+            registry = {event_type: list(signals) for event_type, signals in self._registered_event_signals.items()}
+        stats = self.stats()
+        logging.info("EventService: %d event types with listeners", len(registry))
+        for event_type, signals in sorted(registry.items(), key=lambda item: _event_name(item[0])):
+            logging.info("  %s: %d listener(s)", _event_name(event_type), len(signals))
+            for event_signal in signals:
+                logging.info("    %r", event_signal)
+        logging.info(
+            "  %-40s %10s %10s %10s %9s %12s %12s",
+            "event",
+            "emits",
+            "dispatches",
+            "coalesced",
+            "listeners",
+            "total ms",
+            "max ms",
+        )
+        for name, entry in sorted(stats.items(), key=lambda item: item[1]["emits"], reverse=True):
+            if not entry["dispatches"] and not entry["listeners"]:
+                continue
+            logging.info(
+                "  %-40s %10d %10d %10d %9d %12.3f %12.3f",
+                name,
+                entry["emits"],
+                entry["dispatches"],
+                entry["coalesced"],
+                entry["listeners"],
+                entry["dispatch_ms"],
+                entry["max_dispatch_ms"],
+            )
 
     def clear(self):
         with self._mutex:
             self._registered_event_signals.clear()
+            self._pending.clear()
 
     def shutdown(self):
         """Suppress future emits and clear registry during application shutdown."""
         with self._mutex:
             self._is_shutdown = True
             self._registered_event_signals.clear()
+            self._pending.clear()
+            self._schedule_cond.notify_all()
@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import QApplication
 from core.application import YASBApplication
 from core.event_service import EventService
 from core.utils.cli_server import CliPipeHandler
+from core.utils.startup_timeline import STARTUP_PROFILE_FORMATS, startup_timeline
 
 _reload_lock = threading.Lock()
 
@@ -83,6 +84,28 @@ def process_cli_command(command: str):
         action = base_command.split("-")[0]
         EventService().emit_event("handle_bar_cli", action, screen_name)
 
+    elif base_command == "startup-profile":
+        # startup-profile <json|chrome> <output path, may contain spaces>
+        args = command.strip().split(maxsplit=2)
+        if len(args) != 3 or args[1] not in STARTUP_PROFILE_FORMATS:
+            logging.error("Invalid startup-profile command: %s", command.strip())
+            return
+        _, fmt, output_path = args
+        if not os.path.isabs(output_path) or os.path.splitext(output_path)[1].lower() != ".json":
+            logging.error("Startup timeline path must be an absolute path to a .json file: %s", output_path)
+            return
+        try:
+            startup_timeline.dump(output_path, fmt)
+        except OSError as e:
+            logging.error("Failed to write startup timeline to %s: %s", output_path, e)
+
+    elif base_command == "event-stats":
+        # core.watcher imports the bar manager, which imports this module
+        from core.watcher import log_watcher_stats
+
+        EventService().log_registry()
+        log_watcher_stats()
+
 
 def start_cli_server():
     handler = CliPipeHandler(process_cli_command)
@@ -1,15 +1,135 @@
+import hashlib
 import logging
 import os
 import re
+from collections import OrderedDict
+from threading import Lock
+
+# One pass over a file finds every construct the processor cares about; the
+# text between matches is copied through unchanged. The lookahead lets the
+# scanner skip positions that cannot start a token without trying each branch.
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?=[/"'@u:v\#])
+    (?:
+    (?P<comment>/\*.*?(?:\*/|\Z))
+    | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    | (?P<import>(?i:@import)\s+(?:(?i:url)\((?P<q1>["']?)(?P<p1>[^)]+?)(?P=q1)\)|(?P<q2>["'])(?P<p2>.+?)(?P=q2))\s*;)
+    | (?P<url>url\([^)"']*\))
+    | (?P<line_comment>//[^\n]*)
+    | (?P<root>:root\s*\{(?P<root_body>[^}]*)\})
+    | (?P<var>var\((?P<var_name>--[\w-]+)\))
+    | (?P<hex>\#(?P<hex_digits>[0-9a-fA-F]{8})\b)
+    )
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+_COMMENT_PATTERN = re.compile(r"/\*.*?(?:\*/|\Z)|//[^\n]*", re.DOTALL)
+_DECLARATION_PATTERN = re.compile(r"--([\w-]+)\s*:\s*([^;]+);")
+
+# A tokenized file is a list of parts: literal text, or a tuple of
+#   ("import", path)             an @import statement
+#   ("var", name)                a var(--name) reference
+#   ("root", [(name, parts)])    the variable declarations of a :root block
+Part = str | tuple
+
+_MAX_PARSED_FILES = 64
+_MAX_COMPILED = 8
+
+
+def _digest(content: str) -> str:
+    return hashlib.sha1(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _qt_hex_alpha(digits: str) -> str:
+    """Convert the digits of a CSS ``#RRGGBBAA`` color to Qt's ``#AARRGGBB``."""
+    return f"#{digits[6:8]}{digits[0:6]}"
+
+
+def _tokenize(css: str) -> list[Part]:
+    parts: list[Part] = []
+    text_start = 0
+    for match in _TOKEN_PATTERN.finditer(css):
+        kind = match.lastgroup
+        if kind in ("string", "url"):
+            continue
+        if match.start() > text_start:
+            parts.append(css[text_start : match.start()])
+        text_start = match.end()
+        if kind == "import":
+            parts.append(("import", (match.group("p1") or match.group("p2")).strip("'\"")))
+        elif kind == "var":
+            parts.append(("var", match.group("var_name")))
+        elif kind == "hex":
+            parts.append(_qt_hex_alpha(match.group("hex_digits")))
+        elif kind == "root":
+            body = _COMMENT_PATTERN.sub("", match.group("root_body"))
+            declarations = [
+                (f"--{decl.group(1).strip()}", _tokenize(decl.group(2).strip()))
+                for decl in _DECLARATION_PATTERN.finditer(body)
+            ]
+            parts.append(("root", declarations))
+        # comments are dropped
+    if text_start < len(css):
+        parts.append(css[text_start:])
+    return parts
+
+
+def _topological_order(definitions: dict[str, list[Part]]) -> list[str]:
+    """Order variables so each comes after the variables its value references.
+
+    References that close a cycle are logged and left unresolved.
+    """
+    order: list[str] = []
+    state: dict[str, int] = {}  # 1 = on the current path, 2 = done
+    for start in definitions:
+        if start in state:
+            continue
+        state[start] = 1
+        stack = [(start, iter(definitions[start]))]
+        while stack:
+            name, parts = stack[-1]
+            for part in parts:
+                if isinstance(part, str) or part[1] not in definitions:
+                    continue
+                ref = part[1]
+                if state.get(ref) == 1:
+                    logging.warning("CSSProcessor: circular variable reference %s -> %s", name, ref)
+                elif ref not in state:
+                    state[ref] = 1
+                    stack.append((ref, iter(definitions[ref])))
+                    break
+            else:
+                stack.pop()
+                state[name] = 2
+                order.append(name)
+    return order
+
+
+def _resolve_variables(definitions: dict[str, list[Part]]) -> dict[str, str]:
+    resolved: dict[str, str] = {}
+    for name in _topological_order(definitions):
+        resolved[name] = "".join(
+            part if isinstance(part, str) else resolved.get(part[1], f"var({part[1]})") for part in definitions[name]
+        )
+    return resolved
 
 
 class CSSProcessor:
     """
     Processes CSS files: handles @import, CSS variables, and removes comments.
+
+    Each file is tokenized once per content hash, and the compiled stylesheet
+    is cached per import graph, keyed by the content hash of every file in it,
+    so an unchanged graph is never processed twice.
     """
 
     _localdata_initialized = False
 
+    _lock = Lock()
+    _parsed: OrderedDict[str, list[Part]] = OrderedDict()
+    _compiled: OrderedDict[tuple, str] = OrderedDict()
+
     def __init__(self, css_path: str):
         self.css_path = css_path
         self.base_path = os.path.dirname(css_path)
@@ -22,17 +142,31 @@ class CSSProcessor:
         """
         if not self.css_content:
             return ""
-        self.imported_files = set()
-        # Remove comments from the CSS content
-        css = self._remove_comments(self.css_content)
-        # Process @import statements and CSS variables
-        css = self._process_imports(css)
-        # Remove comments again after processing imports
-        css = self._remove_comments(css)
-        # Extract and replace CSS variables
-        css = self._extract_and_replace_variables(css)
+        graph_key, parts = self._link()
+        with self._lock:
+            css = self._compiled.get(graph_key)
+            if css is not None:
+                self._compiled.move_to_end(graph_key)
+                return css
+        css = self._render(parts)
+        with self._lock:
+            self._compiled[graph_key] = css
+            while len(self._compiled) > _MAX_COMPILED:
+                self._compiled.popitem(last=False)
         return css
 
+    def collect_imports(self) -> set[str]:
+        """Return every file imported by the stylesheet, directly or indirectly, without compiling it."""
+        if self.css_content:
+            self._link()
+        return self.imported_files
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._lock:
+            cls._parsed.clear()
+            cls._compiled.clear()
+
     def _read_css_file(self, file_path: str) -> str:
         try:
             with open(file_path, encoding="utf-8") as file:
@@ -41,93 +175,69 @@ class CSSProcessor:
             logging.error("CSSProcessor Error '%s': %s", file_path, e)
         return ""
 
-    def _remove_comments(self, css: str) -> str:
-        # Remove /* ... */ and // ... comments
-        css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
-        css = re.sub(r"//.*", "", css)
-        return css
-
-    def _process_imports(self, css: str) -> str:
-        # Handle @import url("..."); and @import "...";
-        import_pattern = re.compile(r'@import\s+(?:url\((["\']?)([^)]+?)\1\)|(["\'])(.+?)\3)\s*;', re.IGNORECASE)
-
-        def import_replacer(match):
-            path = match.group(2) or match.group(4)
-            import_path = path.strip("'\"")
-            full_import_path = os.path.normpath(os.path.join(self.base_path, import_path))
-            if full_import_path in self.imported_files:
-                logging.warning("Circular import detected: %s", full_import_path)
-                return ""
-            self.imported_files.add(full_import_path)
-            imported_css = self._read_css_file(full_import_path)
-            if imported_css:
-                return self._process_imports(imported_css)
-            return ""
-
-        return import_pattern.sub(import_replacer, css)
-
-    def _extract_and_replace_variables(self, css: str) -> str:
-        # Extract variables from :root
-        root_vars: dict[str, str] = {}
-
-        def root_replacer(match):
-            content = match.group(1)
-            for var_match in re.finditer(r"--([\w-]+)\s*:\s*([^;]+);", content):
-                var_name = f"--{var_match.group(1).strip()}"
-                var_value = var_match.group(2).strip()
-                root_vars[var_name] = var_value
-            return ""  # Remove :root block
-
-        css = re.sub(r":root\s*{([^}]*)}", root_replacer, css, flags=re.DOTALL)
-
-        # Resolve variables recursively
-        resolved_vars = root_vars.copy()
-        max_iterations = 10  # Make sure we never get stuck in a loop.
-        for iteration in range(max_iterations):
-            changed = False
-
-            for var_name, var_value in resolved_vars.items():
-
-                def var_replacer(match):
-                    nonlocal changed
-                    nested_var_name = match.group(1).strip()
-                    if nested_var_name in resolved_vars:
-                        changed = True
-                        return resolved_vars[nested_var_name]
-                    return match.group(0)
-
-                # Replace var(--name) with their value until it's no longer another variable
-                new_value = re.sub(r"var\((--[\w-]+)\)", var_replacer, var_value)
-                if new_value != var_value:
-                    resolved_vars[var_name] = new_value
-                    changed = True
-            if not changed:
-                break  # No more changes, resolution complete
-
-        def final_var_replacer(match):
-            var_name = match.group(1).strip()
-            return resolved_vars.get(var_name, match.group(0))
-
-        # Replace final var(--name) with resolved CSS value
-        css = re.sub(r"var\((--[\w-]+)\)", final_var_replacer, css)
-        css = self._css_to_qt_hex_alpha(css)
-
-        return css
-
-    def _css_to_qt_hex_alpha(self, css: str) -> str:
-        """
-        Converts CSS hex colors with alpha (#RRGGBBAA) to Qt format (#AARRGGBB).
+    def _parse(self, content: str) -> tuple[str, list[Part]]:
+        digest = _digest(content)
+        with self._lock:
+            parts = self._parsed.get(digest)
+            if parts is not None:
+                self._parsed.move_to_end(digest)
+                return digest, parts
+        parts = _tokenize(content)
+        with self._lock:
+            self._parsed[digest] = parts
+            while len(self._parsed) > _MAX_PARSED_FILES:
+                self._parsed.popitem(last=False)
+        return digest, parts
+
+    def _link(self) -> tuple[tuple, list[Part]]:
+        """Inline the import graph into one list of parts.
+
+        Import paths are relative to the main stylesheet. A file is included
+        once, at its first import. Returns the graph key, the ``(path, digest)``
+        of every included file in order, along with the parts.
         """
-
-        def hex_alpha_replacer(match):
-            hex_color = match.group(1)
-            if len(hex_color) == 8:
-                rr = hex_color[0:2]
-                gg = hex_color[2:4]
-                bb = hex_color[4:6]
-                aa = hex_color[6:8]
-                return f"#{aa}{rr}{gg}{bb}"
-            return match.group(0)
-
-        # Match hex colors with # followed by exactly 8 hex digits
-        return re.sub(r"#([0-9a-fA-F]{8})\b", hex_alpha_replacer, css)
+        self.imported_files = set()
+        root = os.path.normpath(self.css_path)
+        digest, parts = self._parse(self.css_content)
+        graph_key = [(root, digest)]
+        linked: list[Part] = []
+        path_stack = [root]
+        stack = [iter(parts)]
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, str) or part[0] != "import":
+                    linked.append(part)
+                    continue
+                full_import_path = os.path.normpath(os.path.join(self.base_path, part[1]))
+                if full_import_path in path_stack:
+                    logging.warning("Circular import detected: %s", full_import_path)
+                    continue
+                if full_import_path in self.imported_files:
+                    continue
+                self.imported_files.add(full_import_path)
+                imported_css = self._read_css_file(full_import_path)
+                if not imported_css:
+                    continue
+                digest, imported_parts = self._parse(imported_css)
+                graph_key.append((full_import_path, digest))
+                path_stack.append(full_import_path)
+                stack.append(iter(imported_parts))
+                break
+            else:
+                stack.pop()
+                path_stack.pop()
+        return tuple(graph_key), linked
+
+    def _render(self, parts: list[Part]) -> str:
+        definitions: dict[str, list[Part]] = {}
+        for part in parts:
+            if isinstance(part, tuple) and part[0] == "root":
+                definitions.update(part[1])
+        resolved = _resolve_variables(definitions)
+        output = []
+        for part in parts:
+            if isinstance(part, str):
+                output.append(part)
+            elif part[0] == "var":
+                output.append(resolved.get(part[1], f"var({part[1]})"))
+        return "".join(output)
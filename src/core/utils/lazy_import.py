@@ -0,0 +1,53 @@
+import importlib
+import sys
+import types
+from threading import RLock
+
+_lock = RLock()
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that is imported on first attribute access.
+
+    Use it for heavy dependencies (PIL, winrt namespaces, COM shell modules)
+    that a module only needs on some code paths::
+
+        Image = lazy_import("PIL.Image")
+        ...
+        Image.open(path)  # PIL is imported here
+
+    Only attribute access triggers the import, so annotations and
+    ``isinstance`` checks must go through an attribute (``Image.Image``).
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_target"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_lazy_target"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return module *name*, or a ``LazyModule`` for it if it has not been imported yet."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
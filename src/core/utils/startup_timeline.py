@@ -0,0 +1,206 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from PyQt6.QtCore import QEvent, QObject
+from PyQt6.QtWidgets import QWidget
+
+# All timestamps are milliseconds since this module was first imported,
+# which happens while the config module loads, before any bar exists.
+_ORIGIN_NS = time.perf_counter_ns()
+
+# Formats of StartupTimeline.dump; both are written as .json files
+STARTUP_PROFILE_FORMATS = ("json", "chrome")
+
+
+def _ms(ns: int) -> float:
+    return round((ns - _ORIGIN_NS) / 1e6, 3)
+
+
+class _FirstPaintFilter(QObject):
+    """Records the first paint event of each watched widget, then stops watching it."""
+
+    def __init__(self, timeline: StartupTimeline):
+        super().__init__()
+        self._timeline = timeline
+        self._names: dict[int, str] = {}
+
+    def watch(self, widget: QWidget, widget_name: str) -> None:
+        self._names[id(widget)] = widget_name
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            widget_name = self._names.pop(id(obj), None)
+            if widget_name is not None:
+                obj.removeEventFilter(self)
+                self._timeline.record_first_paint(widget_name)
+        return False
+
+
+class StartupTimeline:
+    """In-memory timeline of application startup.
+
+    Records startup phases and, for every widget, how long its module import,
+    option validation and constructor took and when it was first painted.
+    Recording stops at ``finish``, except for first paints still to come, so
+    widgets rebuilt by later config reloads do not grow the timeline.
+    The timeline can be written as plain JSON or in Chrome trace format
+    (load it in ``chrome://tracing`` or https://ui.perfetto.dev).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: list[dict] = []
+        self._widgets: dict[str, dict] = {}
+        self._finished_ns: int | None = None
+        self._paint_filter: _FirstPaintFilter | None = None
+
+    @property
+    def recording(self) -> bool:
+        return self._finished_ns is None
+
+    def _add_event(self, name: str, category: str, start_ns: int, end_ns: int, args: dict) -> None:
+        event = {
+            "name": name,
+            "category": category,
+            "start_ms": _ms(start_ns),
+            "duration_ms": round((end_ns - start_ns) / 1e6, 3),
+            "thread": threading.current_thread().name,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def phase(self, name: str, category: str = "startup", **args):
+        """Time the enclosed block as one phase of the timeline."""
+        if not self.recording:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._add_event(name, category, start, time.perf_counter_ns(), args)
+
+    def record_widget(self, widget_name: str, widget_type: str, start_ns: int, marks: dict[str, int]) -> None:
+        """Record one widget build; *marks* maps each step (import, validate, construct) to its end time."""
+        if not self.recording:
+            return
+        previous = start_ns
+        for step, end in marks.items():
+            self._add_event(f"{widget_name}: {step}", "widget", previous, end, {"type": widget_type})
+            previous = end
+        with self._lock:
+            entry = self._widgets.setdefault(
+                widget_name,
+                {"type": widget_type, "instances": 0, "import_ms": 0.0, "validate_ms": 0.0, "construct_ms": 0.0},
+            )
+            entry["instances"] += 1
+            previous = start_ns
+            for step, end in marks.items():
+                entry[f"{step}_ms"] = round(entry.get(f"{step}_ms", 0.0) + (end - previous) / 1e6, 3)
+                previous = end
+
+    def watch_first_paint(self, widget: QWidget, widget_name: str) -> None:
+        if not self.recording:
+            return
+        if self._paint_filter is None:
+            self._paint_filter = _FirstPaintFilter(self)
+        self._paint_filter.watch(widget, widget_name)
+
+    def record_first_paint(self, widget_name: str) -> None:
+        now = _ms(time.perf_counter_ns())
+        with self._lock:
+            entry = self._widgets.get(widget_name)
+            if entry is not None and "first_paint_ms" not in entry:
+                entry["first_paint_ms"] = now
+
+    def finish(self) -> None:
+        """Mark the end of startup and stop recording new phases."""
+        if self.recording:
+            self._finished_ns = time.perf_counter_ns()
+
+    def slowest_widgets(self, limit: int = 10) -> list[tuple[str, dict]]:
+        with self._lock:
+            widgets = [(name, dict(entry)) for name, entry in self._widgets.items()]
+        widgets.sort(key=lambda item: item[1]["import_ms"] + item[1]["validate_ms"] + item[1]["construct_ms"])
+        return widgets[::-1][:limit]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            events = list(self._events)
+            widgets = {name: dict(entry) for name, entry in self._widgets.items()}
+        return {
+            "startup_ms": _ms(self._finished_ns) if self._finished_ns else None,
+            "phases": events,
+            "widgets": widgets,
+        }
+
+    def to_chrome_trace(self) -> dict:
+        pid = os.getpid()
+        data = self.to_dict()
+        thread_ids: dict[str, int] = {"MainThread": 0}
+        trace = []
+        for event in data["phases"]:
+            tid = thread_ids.setdefault(event["thread"], len(thread_ids))
+            trace.append(
+                {
+                    "name": event["name"],
+                    "cat": event["category"],
+                    "ph": "X",
+                    "ts": event["start_ms"] * 1000,
+                    "dur": event["duration_ms"] * 1000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": event.get("args", {}),
+                }
+            )
+        for name, entry in data["widgets"].items():
+            if "first_paint_ms" in entry:
+                trace.append(
+                    {
+                        "name": f"{name}: first paint",
+                        "cat": "paint",
+                        "ph": "i",
+                        "s": "t",
+                        "ts": entry["first_paint_ms"] * 1000,
+                        "pid": pid,
+                        "tid": 0,
+                    }
+                )
+        for thread_name, tid in thread_ids.items():
+            trace.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str, fmt: str = "json") -> None:
+        data = self.to_chrome_trace() if fmt == "chrome" else self.to_dict()
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, path)
+        logging.info("Startup timeline written to %s", path)
+
+    def log_summary(self, limit: int = 10) -> None:
+        data = self.to_dict()
+        phases = [e for e in data["phases"] if e["category"] == "startup"]
+        logging.info("Startup finished in %.1f ms", data["startup_ms"] or 0.0)
+        for event in phases:
+            logging.info("  %-40s %8.1f ms", event["name"], event["duration_ms"])
+        for name, entry in self.slowest_widgets(limit):
+            logging.info(
+                "  widget %-33s import %6.1f  validate %6.1f  construct %6.1f ms  first paint %s",
+                name,
+                entry["import_ms"],
+                entry["validate_ms"],
+                entry["construct_ms"],
+                f"{entry['first_paint_ms']:.1f} ms" if "first_paint_ms" in entry else "-",
+            )
+
+
+startup_timeline = StartupTimeline()
@@ -0,0 +1,146 @@
+import functools
+import re
+
+from PyQt6.QtWidgets import QWidget
+
+_RULE_PATTERN = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_COMBINATOR_PATTERN = re.compile(r"\s*[>+~]\s*|\s+")
+_TOKEN_PATTERN = re.compile(r"([.#]?)([\w-]+)")
+# Above this share of affected widgets a full reload is cheaper than scoping
+_MAX_SCOPED_FRACTION = 0.5
+
+
+@functools.lru_cache(maxsize=8)
+def parse_rules(css: str) -> tuple[tuple[str, str], ...]:
+    """Split a processed stylesheet into ``(selector, body)`` blocks with whitespace collapsed."""
+    return tuple((" ".join(selector.split()), " ".join(body.split())) for selector, body in _RULE_PATTERN.findall(css))
+
+
+def _rule_map(rules: tuple[tuple[str, str], ...]) -> dict[tuple[str, int], str]:
+    """Key each rule by its selector and occurrence, so repeated selectors stay distinct."""
+    seen: dict[str, int] = {}
+    keyed = {}
+    for selector, body in rules:
+        index = seen.get(selector, 0)
+        seen[selector] = index + 1
+        keyed[(selector, index)] = body
+    return keyed
+
+
+def _properties(body: str) -> set[str]:
+    return {decl.split(":", 1)[0].strip().lower() for decl in body.split(";") if ":" in decl}
+
+
+def _compound_tokens(compound: str) -> frozenset[str]:
+    # Drop sub-controls, pseudo-states and attribute selectors
+    compound = re.split(r"[:\[]", compound, maxsplit=1)[0]
+    return frozenset(prefix + name for prefix, name in _TOKEN_PATTERN.findall(compound))
+
+
+Target = tuple[frozenset[str], frozenset[str]]
+
+
+@functools.lru_cache(maxsize=4096)
+def _targets(selector: str) -> tuple[Target, ...] | None:
+    """Return, per comma-separated selector, the type, ``.class`` and ``#id`` tokens it needs.
+
+    Each target holds the tokens of the styled element and those of the whole
+    selector, ancestors included. Returns None if any selector can style every
+    widget, like ``*`` or ``:hover``.
+    """
+    targets = []
+    for part in selector.split(","):
+        compounds = [_compound_tokens(compound) for compound in _COMBINATOR_PATTERN.split(part.strip())]
+        if not compounds[-1]:
+            return None
+        targets.append((compounds[-1], frozenset().union(*compounds)))
+    return tuple(targets)
+
+
+def _widget_tokens(widget: QWidget) -> set[str]:
+    tokens = {f".{name}" for name in str(widget.property("class") or "").split()}
+    if widget.objectName():
+        tokens.add(f"#{widget.objectName()}")
+    meta = widget.metaObject()
+    while meta is not None:
+        tokens.add(meta.className())
+        meta = meta.superClass()
+    return tokens
+
+
+def _scope_tokens(widget: QWidget) -> tuple[set[str], set[str]]:
+    """Return the tokens found inside *widget* and those found inside it or on its ancestors."""
+    inner: set[str] = set()
+    for child in [widget, *widget.findChildren(QWidget)]:
+        inner |= _widget_tokens(child)
+    outer = set(inner)
+    parent = widget.parentWidget()
+    while parent is not None:
+        outer |= _widget_tokens(parent)
+        parent = parent.parentWidget()
+    return inner, outer
+
+
+def _matches(targets: tuple[Target, ...] | None, scope: tuple[set[str], set[str]]) -> bool:
+    """Whether a rule with *targets* can style anything inside a widget with *scope* tokens."""
+    inner, outer = scope
+    return targets is None or any(element <= inner and full <= outer for element, full in targets)
+
+
+def apply_scoped_stylesheet(base: str, stylesheet: str, widgets: list[QWidget]) -> bool:
+    """Restyle only the widgets that the changes from *base* to *stylesheet* can reach.
+
+    The parent keeps *base*; each affected widget gets the rules of the new
+    stylesheet that can match inside it, which take precedence over its
+    parent's sheet. Returns False, having changed nothing, when that cannot
+    reproduce the new stylesheet (removed rules or properties, rules without
+    a class, id or type to scope them by, changed rules that reach none of
+    *widgets* and may be meant for the parent or for widgets created later,
+    such as popups, widgets with their own stylesheet) or when so many
+    widgets are affected that a full reload is cheaper.
+    """
+    base_rules = _rule_map(parse_rules(base))
+    new_rules = _rule_map(parse_rules(stylesheet))
+    if base_rules.keys() - new_rules.keys():
+        return False
+    changed: list[tuple[Target, ...]] = []
+    for key, body in new_rules.items():
+        old_body = base_rules.get(key)
+        if old_body == body:
+            continue
+        if old_body is not None and not _properties(old_body) <= _properties(body):
+            return False
+        targets = _targets(key[0])
+        if targets is None:
+            return False
+        changed.append(targets)
+
+    if any(widget.styleSheet() != getattr(widget, "_scoped_stylesheet", "") for widget in widgets):
+        return False
+    scopes = {id(widget): _scope_tokens(widget) for widget in widgets}
+    if not all(any(_matches(targets, scope) for scope in scopes.values()) for targets in changed):
+        return False
+    affected = {id(widget) for widget in widgets if any(_matches(targets, scopes[id(widget)]) for targets in changed)}
+    if len(affected) > len(widgets) * _MAX_SCOPED_FRACTION:
+        return False
+
+    rules = parse_rules(stylesheet)
+    for widget in widgets:
+        sheet = ""
+        if id(widget) in affected:
+            scope = scopes[id(widget)]
+            sheet = "\n".join(
+                f"{selector} {{{body}}}" for selector, body in rules if _matches(_targets(selector), scope)
+            )
+        if sheet != getattr(widget, "_scoped_stylesheet", ""):
+            widget._scoped_stylesheet = sheet
+            widget.setStyleSheet(sheet)
+    return True
+
+
+def clear_scoped_stylesheets(widgets: list[QWidget]) -> None:
+    """Drop the scoped rules set by ``apply_scoped_stylesheet`` after the parent got the full stylesheet."""
+    for widget in widgets:
+        if getattr(widget, "_scoped_stylesheet", ""):
+            widget._scoped_stylesheet = ""
+            widget.setStyleSheet("")
@@ -39,14 +39,17 @@ from PyQt6.QtGui import (
     QTransform,
 )
 from PyQt6.QtWidgets import QApplication, QDialog, QFrame, QGraphicsDropShadowEffect, QLabel, QMenu, QWidget
-from winrt.windows.data.xml.dom import XmlDocument
-from winrt.windows.ui.notifications import ToastNotification, ToastNotificationManager
 
+from core.utils.lazy_import import lazy_import
 from core.utils.win32.bindings.kernel32 import kernel32
 from core.utils.win32.constants import TH32CS_SNAPPROCESS
 from core.utils.win32.structs import PROCESSENTRY32
 from core.utils.win32.win32_accent import Blur
 
+# Only needed to show toast notifications
+xml_dom = lazy_import("winrt.windows.data.xml.dom")
+notifications = lazy_import("winrt.windows.ui.notifications")
+
 
 def is_valid_qobject[T](obj: T | None) -> TypeGuard[T]:
     """Check if the object is a valid QObject with specific type"""
@@ -797,7 +800,7 @@ class ToastNotifier:
     """
 
     def __init__(self):
-        self.manager = ToastNotificationManager.get_default()
+        self.manager = notifications.ToastNotificationManager.get_default()
         self.toaster = self.manager.create_toast_notifier_with_id(get_app_identifier())
 
     def show(
@@ -823,7 +826,7 @@ class ToastNotifier:
             if launch_url
             else ""
         )
-        xml = XmlDocument()
+        xml = xml_dom.XmlDocument()
         xml.load_xml(f"""
         <toast activationType="protocol" duration="{duration}"{scenario}>
             <visual>
@@ -836,7 +839,7 @@ class ToastNotifier:
             {actions}
         </toast>
         """)
-        notification = ToastNotification(xml)
+        notification = notifications.ToastNotification(xml)
         self.toaster.show(notification)
 
 
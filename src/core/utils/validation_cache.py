@@ -0,0 +1,61 @@
+import hashlib
+import json
+import logging
+import pickle
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+_MAX_ENTRIES = 512
+
+
+def _fingerprint(data) -> str:
+    """Hash of raw config options in their input order, which ``PreserveOrderMixin`` models keep."""
+    encoded = json.dumps(data, separators=(",", ":"), default=repr)
+    return hashlib.sha1(encoded.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class ValidationCache:
+    """
+    Caches validated pydantic models by schema and a hash of the raw data.
+
+    Identical options, such as the same widget on several screens, or a
+    config saved without changes, are validated once. Entries are stored
+    pickled, so every lookup returns a new model that its widget is free to
+    modify. The cache lives in memory only.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    def validate(self, schema: type[BaseModel], data) -> BaseModel:
+        """Return ``schema.model_validate(data)``, from the cache when the same data was validated before.
+
+        Validation errors are raised as usual and never cached.
+        """
+        key = (f"{schema.__module__}.{schema.__qualname__}", _fingerprint(data))
+        cached = self._entries.get(key)
+        if cached is not None:
+            try:
+                model = pickle.loads(cached)
+            except Exception:
+                logging.debug("Dropping unreadable validation cache entry for %s", key[0])
+                del self._entries[key]
+            else:
+                if type(model) is schema:
+                    self._entries.move_to_end(key)
+                    return model
+                del self._entries[key]
+
+        model = schema.model_validate(data)
+        try:
+            self._entries[key] = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            logging.debug("Validated %s cannot be cached", key[0])
+            return model
+        while len(self._entries) > _MAX_ENTRIES:
+            self._entries.popitem(last=False)
+        return model
+
+
+validation_cache = ValidationCache()
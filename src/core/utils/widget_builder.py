@@ -1,4 +1,5 @@
 import logging
+import time
 from importlib import import_module
 
 from pydantic import BaseModel, ValidationError
@@ -6,7 +7,9 @@ from PyQt6.QtCore import QObject
 from PyQt6.QtWidgets import QWidget
 
 from core.utils.alert_dialog import raise_info_alert
+from core.utils.startup_timeline import startup_timeline
 from core.utils.utilities import format_pydantic_errors_to_yaml
+from core.utils.validation_cache import validation_cache
 from settings import DEFAULT_CONFIG_FILENAME
 
 
@@ -39,9 +42,11 @@ class WidgetBuilder(QObject):
             logging.warning("No widget config could be found for widget '%s", widget_name)
         else:
             try:
+                build_started = time.perf_counter_ns()
                 widget_module_str, widget_class_str = widget_config["type"].rsplit(".", 1)
                 widget_module = import_module(f"core.widgets.{widget_module_str}")
                 widget_cls = getattr(widget_module, widget_class_str)
+                imported = time.perf_counter_ns()
                 widget_schema = getattr(widget_cls, "validation_schema")
                 widget_event_listener = getattr(widget_cls, "event_listener")
 
@@ -59,25 +64,30 @@ class WidgetBuilder(QObject):
                     )
 
                 try:
-                    normalized_instance = widget_schema.model_validate(widget_options)
-                    normalized_options = normalized_instance.model_dump()
-                    pydantic_config = normalized_instance
+                    pydantic_config = validation_cache.validate(widget_schema, widget_options)
                 except ValidationError as e:
                     validation_errors = format_pydantic_errors_to_yaml(e)
                     indented_validation_errors = f"\n{validation_errors}".replace("\n", "\n      ")
                     self._invalid_widget_options[widget_name] = indented_validation_errors
                     return None
+                validated = time.perf_counter_ns()
 
                 # If this widget is a Grouper, proactively collect child listeners so BarManager can manage them
                 try:
                     if widget_cls.__name__ == "GrouperWidget" and widget_module.__name__.endswith("yasb.grouper"):
-                        child_names = normalized_options.get("widgets", []) or []
+                        child_names = getattr(pydantic_config, "widgets", None) or []
                         self._collect_nested_listeners(child_names)
                 except Exception:
                     logging.debug("WidgetBuilder failed to collect nested listeners for Grouper")
 
                 widget = widget_cls(config=pydantic_config)
                 widget.widget_name = widget_name
+                startup_timeline.record_widget(
+                    widget_name,
+                    widget_config["type"],
+                    build_started,
+                    {"import": imported, "validate": validated, "construct": time.perf_counter_ns()},
+                )
                 return widget
             except AttributeError, ValueError, ModuleNotFoundError:
                 logging.exception("Failed to import widget with type %s", widget_config["type"])
@@ -139,8 +149,33 @@ class WidgetBuilder(QObject):
                 additional_details=f"The following widget(s) have no widget type defined:\n{widget_names}",
             )
 
-    def _collect_nested_listeners(self, widget_names: list[str]) -> None:
+    def collect_event_listeners(self, widget_names: list[str]) -> set:
+        """Return the event listeners needed by the given widgets, including widgets nested in groupers."""
+        listeners = set()
+        self._collect_nested_listeners(widget_names, listeners)
+        return listeners
+
+    def normalized_config(self, widget_name: str) -> dict | None:
+        """Return the widget type and its validated options, or the raw config if it does not validate.
+
+        Used to tell whether a config edit actually changes a widget, so options
+        spelled differently but validating to the same values are not rebuilt.
+        """
+        widget_config = self._widget_configurations.get(widget_name)
+        if not widget_config:
+            return None
+        try:
+            module_str, class_str = widget_config["type"].rsplit(".", 1)
+            widget_cls = getattr(import_module(f"core.widgets.{module_str}"), class_str)
+            options = validation_cache.validate(widget_cls.validation_schema, widget_config.get("options", {}))
+            return {"type": widget_config["type"], "options": options.model_dump()}
+        except Exception:
+            return widget_config
+
+    def _collect_nested_listeners(self, widget_names: list[str], listeners: set | None = None) -> None:
         """Recursively collect event listeners from nested widgets."""
+        if listeners is None:
+            listeners = self._widget_event_listeners
         for name in widget_names:
             try:
                 cfg = self._widget_configurations.get(name)
@@ -151,12 +186,12 @@ class WidgetBuilder(QObject):
                 cls = getattr(mod, class_str)
                 listener = getattr(cls, "event_listener", None)
                 if listener:
-                    self._widget_event_listeners.add(listener)
+                    listeners.add(listener)
                 # If nested grouper, recurse into its configured child names
                 if cls.__name__ == "GrouperWidget" and mod.__name__.endswith("yasb.grouper"):
                     child_opts = cfg.get("options", {})
                     child_names = child_opts.get("widgets", []) or []
                     if child_names:
-                        self._collect_nested_listeners(child_names)
+                        self._collect_nested_listeners(child_names, listeners)
             except Exception:
                 logging.debug("WidgetBuilder skipped collecting listener for nested widget '%s'", name)
@@ -0,0 +1,244 @@
+"""
+Shared command execution for custom widgets.
+
+Identical commands (same command line, shell, encoding, format and timeout)
+run once for every widget that uses them: a poll started while the same
+command is still running joins that run, and a result younger than half the
+widget's interval is reused. Stream commands run as one long-lived process
+per command, whatever the number of widgets showing it. All commands run on
+bounded thread pools instead of a new thread per timer tick.
+"""
+
+import json
+import logging
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+_MAX_POLL_WORKERS = 4
+# Each stream holds a worker for as long as it runs
+_MAX_STREAMS = 8
+
+
+class CommandSpec(NamedTuple):
+    cmd: str
+    use_shell: bool
+    encoding: str | None
+    return_format: str
+    timeout_ms: int
+
+
+def parse_output(raw: bytes, spec: CommandSpec) -> Any:
+    text = raw.decode(spec.encoding or "utf-8", errors="replace")
+    if spec.return_format == "json":
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return None
+    return text.strip()
+
+
+def _popen(spec: CommandSpec) -> subprocess.Popen:
+    return subprocess.Popen(
+        spec.cmd.split(" "),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        creationflags=subprocess.CREATE_NO_WINDOW,
+        shell=spec.use_shell,
+    )
+
+
+def _kill_tree(proc: subprocess.Popen) -> None:
+    # With use_shell the command runs under cmd.exe, and killing only the shell
+    # would leave the command running with our stdout pipe open
+    try:
+        subprocess.run(
+            ["taskkill", "/f", "/t", "/pid", str(proc.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW,
+        )
+    except OSError:
+        proc.kill()
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    if proc.poll() is None:
+        _kill_tree(proc)
+    try:
+        proc.communicate(timeout=1)
+    except Exception:
+        pass
+
+
+class _Stream:
+    def __init__(self, spec: CommandSpec, restart_delay_ms: int):
+        self.spec = spec
+        self.restart_delay = restart_delay_ms / 1000
+        self.subscribers = 0
+        self.proc: subprocess.Popen | None = None
+        self.stopped = threading.Event()
+        self.has_data = False
+        self.last_data: Any = None
+
+
+class CommandRunner(QObject):
+    """Runs custom widget commands on shared worker pools and broadcasts their results."""
+
+    # (CommandSpec, data); widgets pick the results of their own command
+    result_ready = pyqtSignal(object, object)
+
+    _instance: CommandRunner | None = None
+
+    @classmethod
+    def instance(cls) -> CommandRunner:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=_MAX_POLL_WORKERS, thread_name_prefix="custom_widget")
+        self._stream_pool = ThreadPoolExecutor(max_workers=_MAX_STREAMS, thread_name_prefix="custom_widget_stream")
+        self._in_flight: dict[CommandSpec, subprocess.Popen | None] = {}
+        self._results: dict[CommandSpec, tuple[float, Any]] = {}
+        self._streams: dict[CommandSpec, _Stream] = {}
+        self._shutdown = False
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def run(self, spec: CommandSpec, max_age_ms: int) -> None:
+        """Run *spec*, unless it is already running or has a result younger than *max_age_ms*.
+
+        The result is delivered through ``result_ready``.
+        """
+        with self._lock:
+            if self._shutdown or spec in self._in_flight:
+                return
+            cached = self._results.get(spec)
+            if cached is None or time.monotonic() - cached[0] >= max_age_ms / 1000:
+                self._in_flight[spec] = None
+                cached = None
+        if cached is not None:
+            self.result_ready.emit(spec, cached[1])
+            return
+        self._pool.submit(self._run, spec)
+
+    def _run(self, spec: CommandSpec) -> None:
+        data = None
+        try:
+            proc = _popen(spec)
+            with self._lock:
+                self._in_flight[spec] = proc
+            try:
+                output, _ = proc.communicate(timeout=spec.timeout_ms / 1000)
+            except subprocess.TimeoutExpired:
+                _kill(proc)
+                logging.warning("Custom widget command timed out after %d ms: %s", spec.timeout_ms, spec.cmd)
+                return
+            data = parse_output(output, spec)
+            with self._lock:
+                self._results[spec] = (time.monotonic(), data)
+        except Exception:
+            logging.exception("Custom widget command failed: %s", spec.cmd)
+            return
+        finally:
+            with self._lock:
+                self._in_flight.pop(spec, None)
+        try:
+            self.result_ready.emit(spec, data)
+        except RuntimeError:
+            pass
+
+    def subscribe(self, spec: CommandSpec, restart_delay_ms: int) -> None:
+        """Start streaming *spec*, or join the stream already running it.
+
+        Each line the command writes is parsed as one record and delivered
+        through ``result_ready``; a new subscriber first gets the latest
+        record. The command is restarted after *restart_delay_ms* if it exits.
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            stream = self._streams.get(spec)
+            if stream is None:
+                stream = self._streams[spec] = _Stream(spec, restart_delay_ms)
+                self._stream_pool.submit(self._read_stream, stream)
+                if len(self._streams) > _MAX_STREAMS:
+                    logging.warning(
+                        "More than %d custom widget streams; %s waits for one to stop", _MAX_STREAMS, spec.cmd
+                    )
+            stream.subscribers += 1
+            has_data, data = stream.has_data, stream.last_data
+        if has_data:
+            self.result_ready.emit(spec, data)
+
+    def unsubscribe(self, spec: CommandSpec) -> None:
+        """Leave the stream for *spec*; the command is stopped when its last subscriber leaves."""
+        with self._lock:
+            stream = self._streams.get(spec)
+            if stream is None:
+                return
+            stream.subscribers -= 1
+            if stream.subscribers > 0:
+                return
+            del self._streams[spec]
+        self._stop_stream(stream)
+
+    def _stop_stream(self, stream: _Stream) -> None:
+        # Killing the process ends the reader's blocking read; the reader reaps it
+        stream.stopped.set()
+        if stream.proc is not None and stream.proc.poll() is None:
+            _kill_tree(stream.proc)
+
+    def _read_stream(self, stream: _Stream) -> None:
+        spec = stream.spec
+        while not stream.stopped.is_set():
+            try:
+                stream.proc = _popen(spec)
+                if stream.stopped.is_set():
+                    break
+                for line in stream.proc.stdout:
+                    if stream.stopped.is_set():
+                        break
+                    if not line.strip():
+                        continue
+                    data = parse_output(line, spec)
+                    if data is None and spec.return_format == "json":
+                        logging.debug("Skipping malformed JSON record from %s", spec.cmd)
+                        continue
+                    stream.has_data, stream.last_data = True, data
+                    try:
+                        self.result_ready.emit(spec, data)
+                    except RuntimeError:
+                        return
+            except Exception:
+                logging.exception("Custom widget stream failed: %s", spec.cmd)
+            finally:
+                if stream.proc is not None:
+                    _kill(stream.proc)
+            if stream.stopped.is_set():
+                break
+            logging.warning("Custom widget stream exited, restarting in %.0f s: %s", stream.restart_delay, spec.cmd)
+            stream.stopped.wait(stream.restart_delay)
+
+    def shutdown(self) -> None:
+        """Stop all streams and running commands; called when the application quits."""
+        with self._lock:
+            self._shutdown = True
+            streams = list(self._streams.values())
+            self._streams.clear()
+            running = [proc for proc in self._in_flight.values() if proc is not None]
+        for stream in streams:
+            self._stop_stream(stream)
+        for proc in running:
+            _kill(proc)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._stream_pool.shutdown(wait=False, cancel_futures=True)
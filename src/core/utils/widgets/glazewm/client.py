@@ -1,5 +1,6 @@
 import json
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from typing import Any, cast
@@ -61,20 +62,165 @@ class TilingDirection(StrEnum):
     VERTICAL = auto()
 
 
+@dataclass(frozen=True)
+class WorkspaceAdded:
+    monitor_hwnd: int
+    workspace: Workspace
+
+
+@dataclass(frozen=True)
+class WorkspaceRemoved:
+    monitor_hwnd: int
+    name: str
+
+
+@dataclass(frozen=True)
+class WorkspaceUpdated:
+    """The display name, displayed state or window count of a workspace changed."""
+
+    monitor_hwnd: int
+    workspace: Workspace
+
+
+@dataclass(frozen=True)
+class WorkspaceFocused:
+    name: str | None
+    previous: str | None
+
+
+@dataclass(frozen=True)
+class WindowAdded:
+    workspace: str
+    window: Window
+
+
+@dataclass(frozen=True)
+class WindowRemoved:
+    workspace: str
+    window: Window
+
+
+@dataclass(frozen=True)
+class WindowMoved:
+    window: Window
+    source: str
+    target: str
+
+
+@dataclass(frozen=True)
+class WindowUpdated:
+    workspace: str
+    window: Window
+
+
+type WorkspaceDelta = (
+    WorkspaceAdded
+    | WorkspaceRemoved
+    | WorkspaceUpdated
+    | WorkspaceFocused
+    | WindowAdded
+    | WindowRemoved
+    | WindowMoved
+    | WindowUpdated
+)
+
+
+def _index(monitors: list[Monitor]) -> tuple[dict[str, tuple[int, Workspace]], dict[str | int, tuple[str, Window]]]:
+    workspaces: dict[str, tuple[int, Workspace]] = {}
+    windows: dict[str | int, tuple[str, Window]] = {}
+    for monitor in monitors:
+        for workspace in monitor.workspaces:
+            workspaces[workspace.name] = (monitor.hwnd, workspace)
+            for window in workspace.windows:
+                windows[window.id or window.handle] = (workspace.name, window)
+    return workspaces, windows
+
+
+def diff_monitors(old: list[Monitor] | None, new: list[Monitor]) -> list[WorkspaceDelta]:
+    """The changes that turn the workspace model *old* into *new*; every workspace is added if *old* is None.
+
+    A workspace that moved to another monitor is reported as removed and added.
+    """
+    old_workspaces, old_windows = _index(old or [])
+    new_workspaces, new_windows = _index(new)
+    deltas: list[WorkspaceDelta] = []
+
+    for name, (hwnd, workspace) in old_workspaces.items():
+        if name not in new_workspaces or new_workspaces[name][0] != hwnd:
+            deltas.append(WorkspaceRemoved(hwnd, name))
+    for name, (hwnd, workspace) in new_workspaces.items():
+        previous = old_workspaces.get(name)
+        if previous is None or previous[0] != hwnd:
+            deltas.append(WorkspaceAdded(hwnd, workspace))
+        elif (previous[1].display_name, previous[1].is_displayed, previous[1].num_windows) != (
+            workspace.display_name,
+            workspace.is_displayed,
+            workspace.num_windows,
+        ):
+            deltas.append(WorkspaceUpdated(hwnd, workspace))
+
+    old_focus = next((name for name, (_, ws) in old_workspaces.items() if ws.focus), None)
+    new_focus = next((name for name, (_, ws) in new_workspaces.items() if ws.focus), None)
+    if old_focus != new_focus:
+        deltas.append(WorkspaceFocused(new_focus, old_focus))
+
+    for key, (workspace, window) in old_windows.items():
+        if key not in new_windows:
+            deltas.append(WindowRemoved(workspace, window))
+    for key, (workspace, window) in new_windows.items():
+        previous = old_windows.get(key)
+        if previous is None:
+            deltas.append(WindowAdded(workspace, window))
+        elif previous[0] != workspace:
+            deltas.append(WindowMoved(window, previous[0], workspace))
+        elif previous[1] != window:
+            deltas.append(WindowUpdated(workspace, window))
+    return deltas
+
+
 class GlazewmClient(QObject):
-    workspaces_data_processed = pyqtSignal(list)
+    """
+    The connection to one GlazeWM IPC server, shared by every GlazeWM widget.
+
+    Widgets register the events they need with ``subscribe`` and the queries
+    those events should refresh; the client sends one subscription for the
+    union of all events and, per event, only the queries mapped to it. Bursts
+    of events are coalesced into one query of each type, and a query is never
+    sent again while the previous one is unanswered. The latest monitors,
+    tiling direction and binding mode are cached, and workspace changes are
+    published as deltas against the cached model.
+    """
+
+    # (monitors, deltas): the full model and what changed since the last one
+    workspaces_changed = pyqtSignal(list, list)
     tiling_direction_processed = pyqtSignal(TilingDirection)
     binding_mode_changed = pyqtSignal(BindingMode)
     glazewm_connection_status = pyqtSignal(bool)
 
-    def __init__(
-        self,
-        uri: str,
-        initial_messages: list[str] | None = None,
-        reconnect_interval: int = 4000,
-    ):
+    _instances: dict[str, GlazewmClient] = {}
+
+    @classmethod
+    def get(cls, uri: str) -> GlazewmClient:
+        """The client for *uri*, created and connected on first use."""
+        client = cls._instances.get(uri)
+        if client is None:
+            client = cls._instances[uri] = cls(uri)
+            client.connect()
+        return client
+
+    def __init__(self, uri: str, reconnect_interval: int = 4000):
         super().__init__()
-        self.initial_messages = initial_messages if initial_messages else []
+        self.monitors: list[Monitor] | None = None
+        self.tiling_direction: TilingDirection | None = None
+        self.binding_mode: BindingMode | None = None
+        self.stats: Counter[str] = Counter()
+
+        # Event -> the queries to refresh when it fires, for all widgets
+        self._event_queries: dict[str, set[QueryType]] = {}
+        self._subscribed: set[str] = set()
+        self._pending: set[QueryType] = set()
+        self._in_flight: set[QueryType] = set()
+        self._flush_scheduled = False
 
         self._uri = QUrl(uri)
         self._websocket = QWebSocket()
@@ -87,6 +233,21 @@ class GlazewmClient(QObject):
         self._reconnect_timer.setInterval(reconnect_interval)
         self._reconnect_timer.timeout.connect(self.connect)  # type: ignore
 
+    @property
+    def is_connected(self) -> bool:
+        return self._websocket.state() == QAbstractSocket.SocketState.ConnectedState
+
+    def subscribe(self, events: list[str], queries: list[QueryType]) -> None:
+        """Refresh *queries* whenever one of *events* fires; queries with no cached result are sent right away."""
+        for event in events:
+            self._event_queries.setdefault(event, set()).update(queries)
+        if not self.is_connected:
+            return
+        new_events = [event for event in events if event not in self._subscribed]
+        if new_events:
+            self._send_subscription(new_events)
+        self._refresh(query for query in queries if self._cached(query) is None)
+
     def activate_workspace(self, workspace_name: str):
         self._websocket.sendTextMessage(f"command focus --workspace {workspace_name}")
 
@@ -112,22 +273,58 @@ class GlazewmClient(QObject):
         self._websocket.sendTextMessage("command focus --prev-active-workspace")
 
     def connect(self):
-        if self._websocket.state() == QAbstractSocket.SocketState.ConnectedState:
+        if self._websocket.state() in (
+            QAbstractSocket.SocketState.ConnectedState,
+            QAbstractSocket.SocketState.ConnectingState,
+        ):
             return
         logger.debug("Connecting to %s", self._uri.toString())
         self._websocket.open(self._uri)
 
+    def _cached(self, query: QueryType) -> Any:
+        if query == QueryType.MONITORS:
+            return self.monitors
+        if query == QueryType.TILING_DIRECTION:
+            return self.tiling_direction
+        return self.binding_mode
+
+    def _send_subscription(self, events: list[str]) -> None:
+        message = f"sub -e {' '.join(events)}"
+        logger.debug("Sent subscription: %s", message)
+        self._websocket.sendTextMessage(message)
+        self._subscribed.update(events)
+
+    def _refresh(self, queries) -> None:
+        self._pending.update(queries)
+        if self._pending and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_queries)
+
+    def _flush_queries(self) -> None:
+        self._flush_scheduled = False
+        if not self.is_connected:
+            return
+        # A query still waiting for its answer is sent again once it arrives
+        for query in sorted(self._pending - self._in_flight):
+            self._websocket.sendTextMessage(query)
+            self._pending.discard(query)
+            self._in_flight.add(query)
+            self.stats["queries"] += 1
+
     def _on_connected(self) -> None:
         logger.debug("Connected to %s", self._uri.toString())
-        for message in self.initial_messages:
-            logger.debug("Sent initial message: %s", message)
-            self._websocket.sendTextMessage(message)
+        self._subscribed.clear()
+        if self._event_queries:
+            self._send_subscription(list(self._event_queries))
+        self._refresh(set().union(*self._event_queries.values()))
 
         # Stop reconnect timer
         self._reconnect_timer.stop()
 
     def _on_state_changed(self, state: QAbstractSocket.SocketState):
         logger.debug("WebSocket state changed: %s", state)
+        if state == QAbstractSocket.SocketState.UnconnectedState:
+            self._in_flight.clear()
         self.glazewm_connection_status.emit(state == QAbstractSocket.SocketState.ConnectedState)
 
     def _on_error(self, error: QAbstractSocket.SocketError) -> None:
@@ -142,30 +339,51 @@ class GlazewmClient(QObject):
             return
 
         if response.get("messageType") == MessageType.EVENT_SUBSCRIPTION:
-            self._websocket.sendTextMessage(QueryType.MONITORS)
-            self._websocket.sendTextMessage(QueryType.TILING_DIRECTION)
-            self._websocket.sendTextMessage(QueryType.BINDING_MODES)
+            self.stats["events"] += 1
+            event = response.get("data") or {}
+            queries = self._event_queries.get(event.get("eventType")) if isinstance(event, dict) else None
+            if queries is None:
+                queries = set().union(*self._event_queries.values())
+            self._refresh(queries)
         elif response.get("messageType") == MessageType.CLIENT_RESPONSE:
+            try:
+                query = QueryType(response.get("clientMessage"))
+            except ValueError:
+                # Replies to subscriptions and commands
+                return
+            self._in_flight.discard(query)
+            if query in self._pending:
+                self._refresh(())
             raw_data: Any = response.get("data")
             if not isinstance(raw_data, dict):
                 logger.warning("Expected 'data' to be a dict, got %s", type(raw_data).__name__)
                 return
             data = cast(dict[str, Any], raw_data)
-            if response.get("clientMessage") == QueryType.MONITORS:
+            if query == QueryType.MONITORS:
                 monitors = data.get("monitors", [])
                 if monitors is None:
                     logger.warning("Expected 'monitors' to be a list, got None")
                     return
-                self.workspaces_data_processed.emit(self._process_workspaces(monitors))
-            elif response.get("clientMessage") == QueryType.TILING_DIRECTION:
+                processed = self._process_workspaces(monitors)
+                deltas = diff_monitors(self.monitors, processed)
+                self.monitors = processed
+                if deltas:
+                    self.stats["deltas"] += len(deltas)
+                    self.workspaces_changed.emit(processed, deltas)
+            elif query == QueryType.TILING_DIRECTION:
                 tiling_direction = TilingDirection(data.get("tilingDirection", TilingDirection.HORIZONTAL))
-                self.tiling_direction_processed.emit(tiling_direction)
-            elif response.get("clientMessage") == QueryType.BINDING_MODES:
+                if tiling_direction != self.tiling_direction:
+                    self.tiling_direction = tiling_direction
+                    self.tiling_direction_processed.emit(tiling_direction)
+            elif query == QueryType.BINDING_MODES:
                 binding_modes = data.get("bindingModes", [])
                 if binding_modes is None:
                     logger.warning("Expected 'bindingModes' to be a list, got %s", type(binding_modes).__name__)
                     return
-                self.binding_mode_changed.emit(self._process_binding_modes(binding_modes))
+                binding_mode = self._process_binding_modes(binding_modes)
+                if binding_mode != self.binding_mode:
+                    self.binding_mode = binding_mode
+                    self.binding_mode_changed.emit(binding_mode)
 
     def _process_workspaces(self, data: list[dict[str, Any]]) -> list[Monitor]:
         monitors: list[Monitor] = []
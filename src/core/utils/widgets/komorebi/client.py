@@ -2,10 +2,19 @@ import json
 import logging
 import subprocess
 
+from core.utils.widgets.komorebi.command_socket import KomorebiCommandSocket
+
 
 def add_index(dictionary: dict, dictionary_index: int) -> dict:
-    dictionary["index"] = dictionary_index
-    return dictionary
+    # A copy, so the state the widgets share (and the state store diffs against) is left as received
+    return {**dictionary, "index": dictionary_index}
+
+
+def _variant_name(value: str) -> str:
+    # komorebic takes kebab-case values, the socket the serialized enum variant (DefaultLayout, Axis)
+    if value == "bsp":
+        return "BSP"
+    return "".join(part.capitalize() for part in value.replace("_", "-").split("-"))
 
 
 class KomorebiClient:
@@ -26,8 +35,35 @@ class KomorebiClient:
         self._komorebic_path = komorebic_path
         self._previous_poll_offline = False
         self._previous_mouse_follows_focus = False
+        self._command_socket = KomorebiCommandSocket(timeout_secs=timeout_secs)
+
+    def _send(self, messages: list[dict], komorebic_args: list[str] | str, error: str, wait: bool = False) -> None:
+        """
+        Send *messages* over komorebi's command socket, or run komorebic with *komorebic_args* if that fails.
+        Every command goes through here, with both forms.
+        """
+
+        def run_komorebic():
+            try:
+                if wait:
+                    subprocess.run(
+                        komorebic_args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, shell=True, check=True
+                    )
+                else:
+                    subprocess.Popen(komorebic_args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=True)
+            except subprocess.SubprocessError, FileNotFoundError:
+                logging.exception(error)
+
+        if not self._command_socket.send(*messages, fallback=run_komorebic, wait=wait):
+            run_komorebic()
 
     def query_state(self) -> dict | None:
+        output = self._command_socket.query({"type": "State"})
+        if output:
+            try:
+                return json.loads(output)
+            except json.JSONDecodeError:
+                logging.debug("Invalid komorebi state from the command socket, querying komorebic")
         try:
             # Capture stderr to avoid raw komorebic panics leaking to console
             output = subprocess.check_output(
@@ -105,72 +141,47 @@ class KomorebiClient:
                         return add_index(workspace, i)
 
     def activate_workspace(self, m_idx: int, ws_idx: int, wait: bool = False) -> None:
-        args = [self._komorebic_path, "focus-monitor-workspace", str(m_idx), str(ws_idx)]
-        if wait:
-            try:
-                subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, shell=True)
-            except subprocess.SubprocessError, FileNotFoundError:
-                logging.exception("Failed to activate komorebi workspace")
-        else:
-            try:
-                subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=True)
-            except subprocess.SubprocessError, FileNotFoundError:
-                logging.exception("Failed to activate komorebi workspace (spawn)")
+        self._send(
+            [{"type": "FocusMonitorWorkspaceNumber", "content": [m_idx, ws_idx]}],
+            [self._komorebic_path, "focus-monitor-workspace", str(m_idx), str(ws_idx)],
+            "Failed to activate komorebi workspace",
+            wait=wait,
+        )
 
     def next_workspace(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "cycle-workspace", "next"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to cycle komorebi workspace")
+        self._send(
+            [{"type": "CycleFocusWorkspace", "content": "Next"}],
+            [self._komorebic_path, "cycle-workspace", "next"],
+            "Failed to cycle komorebi workspace",
+        )
 
     def prev_workspace(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "cycle-workspace", "prev"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to cycle komorebi workspace")
+        self._send(
+            [{"type": "CycleFocusWorkspace", "content": "Previous"}],
+            [self._komorebic_path, "cycle-workspace", "prev"],
+            "Failed to cycle komorebi workspace",
+        )
 
     def toggle_focus_mouse(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "toggle-focus-follows-mouse"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to toggle focus-follows-mouse")
+        self._send(
+            [{"type": "ToggleFocusFollowsMouse", "content": "Windows"}],
+            [self._komorebic_path, "toggle-focus-follows-mouse"],
+            "Failed to toggle focus-follows-mouse",
+        )
 
     def change_layout(self, m_idx: int, ws_idx: int, layout: str) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "workspace-layout", str(m_idx), str(ws_idx), layout],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to change layout of currently active workspace to %s", layout)
+        self._send(
+            [{"type": "WorkspaceLayout", "content": [m_idx, ws_idx, _variant_name(layout)]}],
+            [self._komorebic_path, "workspace-layout", str(m_idx), str(ws_idx), layout],
+            f"Failed to change layout of currently active workspace to {layout}",
+        )
 
     def flip_layout(self, direction: str) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "flip-layout", direction],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            pass
+        self._send(
+            [{"type": "FlipLayout", "content": _variant_name(direction)}],
+            [self._komorebic_path, "flip-layout", direction],
+            f"Failed to flip layout {direction}",
+        )
 
     def flip_layout_horizontal(self) -> None:
         self.flip_layout("horizontal")
@@ -182,16 +193,12 @@ class KomorebiClient:
         self.flip_layout("horizontal-and-vertical")
 
     def toggle(self, toggle_type: str, wait: bool = False) -> None:
-        try:
-            command = (
-                f'"{self._komorebic_path}" focus-monitor-at-cursor && "{self._komorebic_path}" toggle-{toggle_type}'
-            )
-            if wait:
-                subprocess.run(command, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
-            else:
-                subprocess.Popen(command, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to toggle %s for currently active workspace", toggle_type)
+        self._send(
+            [{"type": "FocusMonitorAtCursor"}, {"type": f"Toggle{toggle_type.capitalize()}"}],
+            f'"{self._komorebic_path}" focus-monitor-at-cursor && "{self._komorebic_path}" toggle-{toggle_type}',
+            f"Failed to toggle {toggle_type} for currently active workspace",
+            wait=wait,
+        )
 
     def wait_until_subscribed_to_pipe(self, pipe_name: str):
         proc = subprocess.Popen(
@@ -277,34 +284,22 @@ class KomorebiClient:
             return None
 
     def focus_stack_window(self, w_idx: int) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "focus-stack-window", str(w_idx)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to focus stack window")
+        self._send(
+            [{"type": "FocusStackWindow", "content": w_idx}],
+            [self._komorebic_path, "focus-stack-window", str(w_idx)],
+            "Failed to focus stack window",
+        )
 
     def next_stack_window(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "cycle-stack", "next"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to cycle komorebi stack")
+        self._send(
+            [{"type": "CycleStack", "content": "Next"}],
+            [self._komorebic_path, "cycle-stack", "next"],
+            "Failed to cycle komorebi stack",
+        )
 
     def prev_stack_window(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "cycle-stack", "prev"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True,
-            )
-        except subprocess.SubprocessError, FileNotFoundError:
-            logging.exception("Failed to cycle komorebi stack")
+        self._send(
+            [{"type": "CycleStack", "content": "Previous"}],
+            [self._komorebic_path, "cycle-stack", "prev"],
+            "Failed to cycle komorebi stack",
+        )
@@ -0,0 +1,197 @@
+"""
+Batched writes to komorebi's command socket.
+
+komorebic is a thin client: every command it runs is one JSON
+``SocketMessage`` written to the Unix domain socket komorebi listens on
+(``%LOCALAPPDATA%\\komorebi\\komorebi.sock``). Writing those messages
+directly saves starting a shell and a komorebic process per action.
+Windows has supported Unix domain sockets since Windows 10 1803, but
+CPython's socket module there has no ``AF_UNIX`` and cannot connect one,
+so ``connect_unix_socket`` creates the socket through CPython and connects
+it through Winsock directly.
+
+Commands are queued and written by one background thread, newline
+separated, so the commands of a burst (scrolling across workspaces) that
+queue up while one batch is written go out together in the next write.
+komorebi serves command socket clients one at a time, reading each
+connection to its end, so the connection is closed as soon as the queue is
+drained; holding it open would keep komorebic and other clients waiting.
+A write that fails is retried once on a fresh connection. The writer thread
+itself exits after ``idle_secs`` without commands. Callers fall back to
+komorebic when the socket is unavailable or the write fails.
+"""
+
+import ctypes
+import errno
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+KOMOREBI_SOCKET_PATH = Path(os.environ.get("LOCALAPPDATA", "~")).expanduser() / "komorebi" / "komorebi.sock"
+
+
+# CPython on Windows doesn't define it; the value is the same
+AF_UNIX = getattr(socket, "AF_UNIX", 1)
+
+
+def winsock_address(path: str):
+    """The Winsock ``SOCKADDR_UN`` of *path*."""
+    from core.utils.win32.structs import SOCKADDR_UN
+
+    encoded = os.fsencode(path)
+    if len(encoded) >= SOCKADDR_UN.sun_path.size:
+        raise OSError(errno.ENAMETOOLONG, "Socket path too long", path)
+    return SOCKADDR_UN(AF_UNIX, encoded)
+
+
+def connect_unix_socket(path: str, timeout_secs: float) -> socket.socket:
+    """Open a stream connection to the Unix domain socket at *path*."""
+    connection = socket.socket(AF_UNIX, socket.SOCK_STREAM)
+    try:
+        if hasattr(socket, "AF_UNIX"):
+            connection.settimeout(timeout_secs)
+            connection.connect(path)
+        else:
+            from core.utils.win32.bindings.ws2_32 import connect
+
+            # Connected while the socket is still blocking; local connects don't wait
+            address = winsock_address(path)
+            if connect(connection.fileno(), ctypes.byref(address), ctypes.sizeof(address)) != 0:
+                raise ctypes.WinError(ctypes.get_last_error())
+            connection.settimeout(timeout_secs)
+    except BaseException:
+        connection.close()
+        raise
+    return connection
+
+
+def encode_messages(messages) -> bytes:
+    return b"".join(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n" for message in messages)
+
+
+class _Command(NamedTuple):
+    messages: tuple[dict, ...]
+    fallback: Callable[[], None] | None
+    done: threading.Event | None
+
+
+class KomorebiCommandSocket:
+    def __init__(self, path: str | os.PathLike = KOMOREBI_SOCKET_PATH, timeout_secs: float = 0.5, idle_secs: float = 2):
+        self.path = os.fspath(path)
+        self._timeout_secs = timeout_secs
+        self._idle_secs = idle_secs
+        self._queue: queue.SimpleQueue[_Command] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._connection: socket.socket | None = None
+        self.stats = Counter()
+
+    @property
+    def available(self) -> bool:
+        """Whether komorebi's socket exists."""
+        # The socket file is a reparse point on Windows; lexists does not try to follow it
+        return os.path.lexists(self.path)
+
+    def send(self, *messages: dict, fallback: Callable[[], None] | None = None, wait: bool = False) -> bool:
+        """
+        Queue *messages* for komorebi, in order. Returns False, without queueing, if the socket is
+        unavailable; otherwise *fallback* is called (on the writer thread) if they can't be written.
+        With *wait*, blocks until they were written or the fallback ran.
+        """
+        if not self.available:
+            return False
+        done = threading.Event() if wait else None
+        self._queue.put(_Command(messages, fallback, done))
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._run, name="KomorebiCommandSocket", daemon=True)
+                self._writer.start()
+        if done is not None:
+            done.wait(self._timeout_secs * 4)
+        return True
+
+    def query(self, message: dict) -> bytes | None:
+        """Send a query such as ``{"type": "State"}`` on a connection of its own and return the reply."""
+        if not self.available:
+            return None
+        try:
+            with connect_unix_socket(self.path, self._timeout_secs) as connection:
+                connection.sendall(encode_messages([message]))
+                # komorebi replies and closes the connection once it has read everything we send
+                connection.shutdown(socket.SHUT_WR)
+                chunks = []
+                while chunk := connection.recv(64 * 1024):
+                    chunks.append(chunk)
+        except OSError as e:
+            logging.debug("Komorebi socket query failed: %s", e)
+            return None
+        self.stats["queries"] += 1
+        return b"".join(chunks) or None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except OSError:
+                pass
+            self._connection = None
+
+    def _write(self, payload: bytes) -> bool:
+        # A connection komorebi has closed only fails on the next write; try a fresh one once
+        for attempt in range(2):
+            try:
+                if self._connection is None:
+                    self._connection = connect_unix_socket(self.path, self._timeout_secs)
+                    self.stats["connects"] += 1
+                self._connection.sendall(payload)
+                return True
+            except OSError as e:
+                self._close()
+                if attempt:
+                    logging.debug("Failed to write to the komorebi socket: %s", e)
+        return False
+
+    def _run(self) -> None:
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self._idle_secs)]
+            except queue.Empty:
+                with self._lock:
+                    self._close()
+                    if self._queue.empty():
+                        self._writer = None
+                        return
+                continue
+            # Everything queued while the last batch was written goes out in one write
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            with self._lock:
+                written = self._write(encode_messages(message for command in batch for message in command.messages))
+                # komorebi reads one connection at a time; free it unless more is already waiting
+                if self._queue.empty():
+                    self._close()
+            self.stats["writes"] += 1
+            self.stats["commands"] += len(batch)
+            for command in batch:
+                if not written and command.fallback is not None:
+                    self.stats["fallbacks"] += 1
+                    try:
+                        command.fallback()
+                    except Exception:
+                        logging.exception("Komorebi command fallback failed")
+                if command.done is not None:
+                    command.done.set()
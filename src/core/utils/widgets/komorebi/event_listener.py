@@ -11,9 +11,12 @@ from PyQt6.QtCore import QThread
 from core.event_enums import KomorebiEvent
 from core.event_service import EventService
 from core.utils.widgets.komorebi.client import KomorebiClient
+from core.utils.widgets.komorebi.state_store import KomorebiStateStore
 
 KOMOREBI_PIPE_BUFF_SIZE = 64 * 1024
 KOMOREBI_PIPE_NAME = "yasb"
+# Sent to active window widgets whether or not the komorebi state changed
+WORKSPACE_UPDATE_EVENTS = frozenset({"MoveWindow", "Show", "Hide", "Destroy"})
 
 
 class KomorebiEventListener(QThread):
@@ -24,6 +27,7 @@ class KomorebiEventListener(QThread):
         self.pipe_name = f"{pipe_name}-{uuid.uuid1()}"
         self.buffer_size = buffer_size
         self.event_service = EventService()
+        self.state_store = KomorebiStateStore()
         self.pipe = None
 
     def __str__(self):
@@ -100,6 +104,7 @@ class KomorebiEventListener(QThread):
                 logging.exception("Komorebi has disconnected from the named pipe %s", self.pipe_name)
             finally:
                 self._close_pipe()
+                self.state_store.reset()
                 self.event_service.emit_event(KomorebiEvent.KomorebiDisconnect)
                 if not self._app_running:
                     should_reconnect = False
@@ -117,7 +122,14 @@ class KomorebiEventListener(QThread):
     def _emit_event(self, event: dict, state: dict) -> None:
         if isinstance(event, str):
             return
-        self.event_service.emit_event(KomorebiEvent.KomorebiUpdate, event, state)
+        if event["type"] in WORKSPACE_UPDATE_EVENTS:
+            self.event_service.emit_event("workspace_update", event["type"])
+
+        diff = self.state_store.apply(state)
+        if diff.is_empty:
+            # Nothing any widget renders changed
+            return
+        self.event_service.emit_event(KomorebiEvent.KomorebiUpdate, event, state, diff)
 
         if event["type"] in KomorebiEvent:
             self.event_service.emit_event(KomorebiEvent[event["type"]], event, state)
@@ -156,4 +168,6 @@ class KomorebiEventListener(QThread):
                 return
             state = self._komorebic.query_state()
 
+        self.state_store.reset()
+        self.state_store.apply(state)
         self.event_service.emit_event(KomorebiEvent.KomorebiConnect, state)
@@ -0,0 +1,144 @@
+"""
+Structural diffing of the komorebi state.
+
+komorebi sends its whole state with every event, and most events (window
+moves, retiles, cloaking) leave everything the widgets show untouched. The
+store compares each monitor, workspace and container with the last state it
+saw, so the event listener can tell widgets which parts of a new state
+changed and drop the messages that changed nothing they render. The diff is
+emitted with ``KomorebiUpdate``; widgets return early unless
+``diff.touches(monitor_hwnd)``.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+# Recomputed on every retile; no widget shows them
+_IGNORED_WORKSPACE_KEYS = frozenset({"latest_layout", "resize_dimensions"})
+_IGNORED_MONITOR_KEYS = frozenset({"workspaces", "last_focused_workspace"})
+_IGNORED_STATE_KEYS = frozenset({"monitors"})
+
+
+def _elements(ring) -> list:
+    if isinstance(ring, dict) and isinstance(ring.get("elements"), list):
+        return ring["elements"]
+    return []
+
+
+def _same(new: dict, old: dict | None, ignored: frozenset[str]) -> bool:
+    if old is None or new.keys() != old.keys():
+        return False
+    for key, value in new.items():
+        if key not in ignored and value != old[key]:
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class KomorebiStateDiff:
+    """What changed between two komorebi states. Monitors are identified by their ``id`` (the monitor handle)."""
+
+    # Monitors whose own fields or workspaces changed, including added and removed ones
+    monitors: frozenset[int] = frozenset()
+    # (monitor id, workspace index)
+    workspaces: frozenset[tuple[int, int]] = frozenset()
+    # (monitor id, workspace index, container id)
+    containers: frozenset[tuple[int, int, str]] = frozenset()
+    # The focused monitor changed
+    focus_changed: bool = False
+    # A top-level field such as is_paused or float_override changed
+    global_changed: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.monitors or self.focus_changed or self.global_changed)
+
+    def touches(self, monitor_id: int | None, global_state: bool = False) -> bool:
+        """Whether a widget showing *monitor_id* (and, with *global_state*, top-level fields) needs to update."""
+        if monitor_id is None:
+            return not self.is_empty
+        return monitor_id in self.monitors or (global_state and self.global_changed)
+
+
+class KomorebiStateStore:
+    """Keeps the last komorebi state and diffs each new state against it.
+
+    States are compared with ``==`` rather than serialized, so a diff costs a fraction of the parse that
+    produced the state. Widgets must not modify the states they receive; the client helpers return copies.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: dict | None = None
+        self.stats = {"messages": 0, "dropped": 0, "diff_ns": 0}
+
+    def reset(self) -> None:
+        """Forget the last state; the next one is reported as entirely changed."""
+        with self._lock:
+            self._state = None
+
+    def apply(self, state: dict) -> KomorebiStateDiff:
+        """Diff *state* against the previous one and remember it."""
+        started = time.perf_counter_ns()
+        with self._lock:
+            diff = self._apply(state)
+            self.stats["messages"] += 1
+            if diff.is_empty:
+                self.stats["dropped"] += 1
+            self.stats["diff_ns"] += time.perf_counter_ns() - started
+        return diff
+
+    def _apply(self, state: dict) -> KomorebiStateDiff:
+        previous = self._state
+        previous_monitors = {monitor.get("id"): monitor for monitor in _elements((previous or {}).get("monitors"))}
+        monitors = _elements(state.get("monitors"))
+        changed_monitors: set[int] = set()
+        changed_workspaces: set[tuple[int, int]] = set()
+        changed_containers: set[tuple[int, int, str]] = set()
+
+        for monitor in monitors:
+            monitor_id = monitor.get("id")
+            old = previous_monitors.pop(monitor_id, None)
+            if monitor == old:
+                continue
+
+            workspaces = _elements(monitor.get("workspaces"))
+            old_workspaces = _elements(old.get("workspaces")) if old else []
+            workspaces_changed = False
+            for position, workspace in enumerate(workspaces):
+                old_workspace = old_workspaces[position] if position < len(old_workspaces) else None
+                if workspace == old_workspace or _same(workspace, old_workspace, _IGNORED_WORKSPACE_KEYS):
+                    continue
+                workspaces_changed = True
+                changed_workspaces.add((monitor_id, position))
+                old_containers = {
+                    str(container.get("id", index)): container
+                    for index, container in enumerate(_elements((old_workspace or {}).get("containers")))
+                }
+                for index, container in enumerate(_elements(workspace.get("containers"))):
+                    container_id = str(container.get("id", index))
+                    if old_containers.pop(container_id, None) != container:
+                        changed_containers.add((monitor_id, position, container_id))
+                changed_containers.update((monitor_id, position, container_id) for container_id in old_containers)
+
+            if (
+                old is None
+                or len(workspaces) != len(old_workspaces)
+                or workspaces_changed
+                or (monitor.get("workspaces") or {}).get("focused") != (old.get("workspaces") or {}).get("focused")
+                or not _same(monitor, old, _IGNORED_MONITOR_KEYS)
+            ):
+                changed_monitors.add(monitor_id)
+
+        # Whatever is left was unplugged
+        changed_monitors.update(previous_monitors)
+        self._state = state
+        return KomorebiStateDiff(
+            monitors=frozenset(changed_monitors),
+            workspaces=frozenset(changed_workspaces),
+            containers=frozenset(changed_containers),
+            focus_changed=previous is None
+            or (state.get("monitors") or {}).get("focused") != (previous.get("monitors") or {}).get("focused"),
+            global_changed=not _same(state, previous, _IGNORED_STATE_KEYS),
+        )
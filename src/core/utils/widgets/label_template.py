@@ -0,0 +1,121 @@
+"""
+Compiled label templates for widgets that refresh their label on a timer.
+
+A label such as ``<span>\\uf4bc</span> {info[percent][total]}%`` is split into
+its icon and text parts once, when the widget is built. Each update then only
+formats the parts that contain placeholders, calls ``setText`` on the labels
+whose text changed, and re-polishes a label only when its status class
+changed, instead of re-parsing the label and restyling every part each tick.
+
+``build_widget_label`` compiles the labels of a widget into
+``self._label_template`` and ``self._label_alt_template``; timer updates
+should go through those.
+"""
+
+import functools
+import re
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+from PyQt6.QtWidgets import QLabel
+
+from core.utils.utilities import refresh_widget_style
+
+_SPAN_PATTERN = re.compile(r"(<span.*?>.*?</span>)")
+_SPAN_CLASS_PATTERN = re.compile(r'class=(["\'])([^"\']+?)\1')
+_SPAN_TAG_PATTERN = re.compile(r"<span.*?>|</span>")
+_OPTION_PATTERN = re.compile(r"(\{[^{}]+\})")
+
+
+class LabelPart(NamedTuple):
+    # Icon text for spans, the raw format string for text parts
+    text: str
+    is_icon: bool
+    # Class of a span part, "icon" if it has none
+    class_name: str
+    # Whether text needs str.format at all
+    has_fields: bool
+    # text split around "{option}" placeholders, for substitution
+    tokens: tuple[str, ...]
+
+
+def _has_fields(text: str) -> bool:
+    # Escaped braces need format() too, and malformed ones must raise as before
+    return "{" in text or "}" in text
+
+
+@functools.lru_cache(maxsize=256)
+def compile_label(content: str) -> tuple[LabelPart, ...]:
+    """Split label content into its non-empty parts, in the order their QLabels are created."""
+    parts = []
+    for part in _SPAN_PATTERN.split(content or ""):
+        part = part.strip()
+        if not part:
+            continue
+        if "<span" in part and "</span>" in part:
+            class_name = _SPAN_CLASS_PATTERN.search(part)
+            text = _SPAN_TAG_PATTERN.sub("", part).strip()
+            parts.append(
+                LabelPart(
+                    text,
+                    True,
+                    class_name.group(2) if class_name else "icon",
+                    _has_fields(text),
+                    tuple(_OPTION_PATTERN.split(text)),
+                )
+            )
+        else:
+            parts.append(LabelPart(part, False, "", _has_fields(part), tuple(_OPTION_PATTERN.split(part))))
+    return tuple(parts)
+
+
+class LabelTemplate:
+    """
+    The compiled parts of one label bound to the QLabels built for them.
+
+    The last text and class applied to each QLabel are remembered, so updates
+    that produce the same output leave the labels untouched.
+    """
+
+    def __init__(self, content: str, widgets: list[QLabel], is_alt: bool = False):
+        self.parts = compile_label(content)
+        self.widgets = widgets
+        self.label_class = "label alt" if is_alt else "label"
+        self._texts: list[str | None] = [None] * len(widgets)
+        self._classes: list[str | None] = [None] * len(widgets)
+
+    def format(self, values: Mapping[str, Any], status: str | None = None) -> None:
+        """Fill the text parts with ``str.format(**values)``; icon spans are left as built.
+
+        With *status*, text parts get the class ``label status-<status>``.
+        """
+        texts = [
+            None if part.is_icon else part.text.format(**values) if part.has_fields else part.text
+            for part in self.parts
+        ]
+        self._apply(texts, status)
+
+    def substitute(self, options: Mapping[str, Any], status: str | None = None) -> None:
+        """Replace ``{option}`` placeholders with ``str(options["{option}"])`` in every part.
+
+        Unknown placeholders are kept as written. With *status*, text parts
+        get the class ``label status-<status>``.
+        """
+        texts = []
+        for part in self.parts:
+            if len(part.tokens) == 1:
+                texts.append(part.text)
+                continue
+            texts.append("".join(str(options[token]) if token in options else token for token in part.tokens))
+        self._apply(texts, status)
+
+    def _apply(self, texts: list[str | None], status: str | None) -> None:
+        label_class = f"{self.label_class} status-{status}" if status else None
+        for index, (widget, part, text) in enumerate(zip(self.widgets, self.parts, texts)):
+            if text is not None and text != self._texts[index]:
+                widget.setText(text)
+                self._texts[index] = text
+            if label_class is not None and not part.is_icon and label_class != self._classes[index]:
+                widget.setProperty("class", label_class)
+                self._classes[index] = label_class
+                refresh_widget_style(widget)
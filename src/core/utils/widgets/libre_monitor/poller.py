@@ -0,0 +1,187 @@
+"""
+Shared polling of LibreHardwareMonitor servers.
+
+LibreHardwareMonitor's web server serves its whole sensor tree as
+``data.json``. Every widget and popup reading sensors from the same server
+shares one ``LibreMonitorPoller``, which fetches that tree in a single
+asynchronous request and indexes the values by sensor id, instead of each
+widget posting one ``/Sensor?action=Get`` request per sensor. A poll made
+while a request is in flight joins it, values younger than the caller's
+``max_age_ms`` are reused, and polls back off while the server is
+unreachable. Widgets read sensors only through the poller and never block
+on requests of their own.
+
+Only a finished request emits ``updated`` to every widget; a poll answered
+from recent values returns True and leaves rendering to its caller, so N
+widgets sharing a tick render N times rather than N squared.
+"""
+
+import json
+import logging
+import time
+from collections import Counter
+from enum import StrEnum
+from typing import NamedTuple
+
+from PyQt6.QtCore import QObject, QUrl, pyqtSignal
+from PyQt6.QtNetwork import QAuthenticator, QNetworkAccessManager, QNetworkReply, QNetworkRequest
+
+_REQUEST_TIMEOUT_MS = 5000
+# Delay before the first retry after a failed poll; doubled on every further failure
+_MIN_BACKOFF_SECS = 2
+_MAX_BACKOFF_SECS = 60
+
+
+class SensorReading(NamedTuple):
+    value: float
+    unit: str
+
+
+class PollStatus(StrEnum):
+    OK = "ok"
+    AUTH_ERROR = "auth_error"
+    CONNECTION_ERROR = "connection_error"
+
+
+def parse_reading(text) -> SensorReading | None:
+    """Parse a formatted value such as ``"45.5 °C"``. The server formats numbers in its own locale."""
+    if not isinstance(text, str):
+        return None
+    number, _, unit = text.strip().partition(" ")
+    try:
+        return SensorReading(float(number.replace(",", ".")), unit.strip())
+    except ValueError:
+        return None
+
+
+def _raw_value(node: dict) -> float | None:
+    """The unformatted ``RawValue`` of a sensor node, served by newer server versions."""
+    raw = node.get("RawValue")
+    if isinstance(raw, bool):
+        return None
+    if isinstance(raw, int | float):
+        return float(raw)
+    reading = parse_reading(raw)
+    return reading.value if reading is not None else None
+
+
+def index_sensors(tree: dict) -> dict[str, SensorReading]:
+    """
+    Map the ``SensorId`` of every sensor in a ``data.json`` tree to its current reading.
+    The raw value is used when the node has one, the formatted ``Value`` otherwise.
+    """
+    readings = {}
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        children = node.get("Children")
+        if isinstance(children, list):
+            stack.extend(child for child in children if isinstance(child, dict))
+        sensor_id = node.get("SensorId")
+        if isinstance(sensor_id, str):
+            reading = parse_reading(node.get("Value"))
+            raw = _raw_value(node)
+            if raw is not None:
+                reading = SensorReading(raw, reading.unit if reading is not None else "")
+            if reading is not None:
+                readings[sensor_id] = reading
+    return readings
+
+
+class LibreMonitorPoller(QObject):
+    """Polls one LibreHardwareMonitor server on behalf of every widget that reads from it."""
+
+    # Emitted when a request finished; read status and readings then
+    updated = pyqtSignal()
+
+    _instances: dict[tuple[str, int], LibreMonitorPoller] = {}
+
+    @classmethod
+    def get(cls, host: str, port: int) -> LibreMonitorPoller:
+        """The poller for *host*:*port*, created on first use."""
+        poller = cls._instances.get((host, port))
+        if poller is None:
+            poller = cls._instances[(host, port)] = cls(host, port)
+        return poller
+
+    def __init__(self, host: str, port: int):
+        super().__init__()
+        # None until the first poll finished
+        self.status: PollStatus | None = None
+        self.readings: dict[str, SensorReading] = {}
+        self.stats: Counter[str] = Counter()
+
+        self._credentials: tuple[str, str] | None = None
+        self._reply: QNetworkReply | None = None
+        self._fetched_at = 0.0
+        self._backoff_secs = 0.0
+        self._retry_at = 0.0
+
+        self._manager = QNetworkAccessManager(self)
+        self._manager.authenticationRequired.connect(self._handle_authentication)
+        self._request = QNetworkRequest(QUrl(f"http://{host}:{port}/data.json"))
+        self._request.setTransferTimeout(_REQUEST_TIMEOUT_MS)
+
+    def set_credentials(self, username: str, password: str) -> None:
+        """Credentials to answer the server with if it requests authentication."""
+        self._credentials = (username, password)
+
+    def poll(self, max_age_ms: int) -> bool:
+        """
+        Fetch the sensors, unless a fetch is already in flight, the last one is younger than
+        *max_age_ms* or the server is backed off after a failure. Returns True if the values
+        are already current; otherwise ``updated`` is emitted once the fetch finished.
+        """
+        if self._reply is not None:
+            self.stats["joined"] += 1
+            return False
+        now = time.monotonic()
+        if self.status is PollStatus.OK:
+            fresh = now - self._fetched_at < max_age_ms / 1000
+        else:
+            fresh = self.status is not None and now < self._retry_at
+        if fresh:
+            self.stats["reused"] += 1
+            return True
+        self.stats["requests"] += 1
+        self._reply = self._manager.get(self._request)
+        self._reply.finished.connect(self._handle_reply)
+        return False
+
+    def _handle_reply(self) -> None:
+        reply, self._reply = self._reply, None
+        if reply is None:
+            return
+        error = reply.error()
+        tree = None
+        if error == QNetworkReply.NetworkError.NoError:
+            try:
+                tree = json.loads(reply.readAll().data())
+            except ValueError:
+                pass
+        if isinstance(tree, dict):
+            self.readings = index_sensors(tree)
+            self.status = PollStatus.OK
+            self._fetched_at = time.monotonic()
+            self._backoff_secs = 0.0
+        else:
+            if self.status in (None, PollStatus.OK):
+                logging.warning(
+                    "LibreHardwareMonitor poll of %s failed: %s", reply.url().toString(), reply.errorString()
+                )
+            if error == QNetworkReply.NetworkError.AuthenticationRequiredError:
+                self.status = PollStatus.AUTH_ERROR
+            else:
+                self.status = PollStatus.CONNECTION_ERROR
+            self.readings = {}
+            self._backoff_secs = min(max(self._backoff_secs * 2, _MIN_BACKOFF_SECS), _MAX_BACKOFF_SECS)
+            self._retry_at = time.monotonic() + self._backoff_secs
+            self.stats["failures"] += 1
+        reply.deleteLater()
+        self.updated.emit()
+
+    def _handle_authentication(self, _: QNetworkReply, auth: QAuthenticator) -> None:
+        """If the server requests auth, answer with the credentials of the widgets, if any"""
+        if self._credentials is not None:
+            auth.setUser(self._credentials[0])
+            auth.setPassword(self._credentials[1])
@@ -45,6 +45,13 @@ class BaseProvider(ABC):
     display_name: str = ""
     icon: str = ""
     input_placeholder: str = "Type to search..."
+    # Seconds a non-prefixed provider may take before parallel queries stop waiting for it.
+    query_timeout: float = 2.0
+    # Seconds the service may reuse results of a query without calling the provider again.
+    # 0 disables caching, for providers whose results change on their own (clocks, clipboard).
+    cache_ttl: float = 0.0
+    # Drop cached results when the popup closes, so the next open starts fresh.
+    clear_cache_on_deactivate: bool = True
 
     def __init__(self, config: dict | None = None):
         self.config = config or {}
@@ -53,7 +60,12 @@ class BaseProvider(ABC):
         self.priority: int = self.config.get("priority", 0)
         self.max_results: int = self.config.get("_max_results", 50)
         self.show_preview: bool = self.config.get("show_preview", True)
+        # Options that override the class defaults above when set in the config
+        for option in ("query_timeout", "cache_ttl", "clear_cache_on_deactivate"):
+            if self.config.get(option) is not None:
+                setattr(self, option, self.config[option])
         self.request_refresh: Callable[[], None] | None = None
+        self.invalidate_cache: Callable[[], None] | None = None
 
     def match(self, text: str) -> bool:
         """Return True if this provider should handle the query."""
@@ -87,6 +99,9 @@ class BaseProvider(ABC):
     def on_deactivate(self) -> None:
         """Called when the popup is closed. Override to clear caches or state."""
 
+    def shutdown(self) -> None:
+        """Called when the provider is replaced, e.g. after a config change. Override to stop background work."""
+
     def get_query_text(self, text: str) -> str:
         """Strip prefix from query text."""
         if self.prefix and text.startswith(self.prefix):
@@ -0,0 +1,480 @@
+"""Persistent local file index used by the file search provider.
+
+The index is a single SQLite database with a deduplicated directory table,
+a file table and, when the SQLite build supports it, an FTS5 trigram index
+over file names. A background crawler fills it with ``os.scandir`` and a
+watchdog observer keeps it current from filesystem change notifications.
+Nothing in this module is Windows specific.
+"""
+
+import fnmatch
+import logging
+import os
+import re
+import sqlite3
+import stat
+import threading
+import time
+from collections.abc import Callable, Iterable
+from queue import Empty, SimpleQueue
+
+_SCHEMA_VERSION = "1"
+
+# Rows written per transaction while crawling.
+_BATCH_SIZE = 5000
+
+# Seconds of quiet before queued change notifications are applied.
+_CHANGE_DELAY = 1.0
+# A watched drive is rarely quiet for long, so a batch is applied anyway
+# after this many seconds or changes.
+_CHANGE_MAX_WAIT = 5.0
+_CHANGE_MAX_BATCH = 1000
+# Changes beyond this many queued ones (a long first crawl, a mass copy) are
+# dropped and the roots are crawled again instead.
+_CHANGE_QUEUE_LIMIT = 100_000
+
+# Candidate rows fetched per query before exact filtering and ranking.
+_CANDIDATE_LIMIT = 500
+
+_CHAR_CLASS_RE = re.compile(r"\[[^\]]*\]")
+
+_FILE_ATTRIBUTE_HIDDEN = 0x2
+_FILE_ATTRIBUTE_SYSTEM = 0x4
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _glob_to_like(pattern: str) -> str:
+    """Translate a glob into a LIKE pattern matching a superset of its names."""
+    return _CHAR_CLASS_RE.sub("_", pattern).replace("*", "%").replace("?", "_")
+
+
+class FileIndex:
+    """SQLite-backed name index answering substring and glob queries.
+
+    Writes happen on a single writer thread (the crawler); every reader
+    thread gets its own connection, and WAL mode lets them read while the
+    crawler writes.
+    """
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._dir_ids: dict[str, int] = {}
+        self.has_trigram = False
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+            if row and row[0] != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS names")
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute("DROP TABLE IF EXISTS dirs")
+                conn.execute("DELETE FROM meta")
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)", (_SCHEMA_VERSION,))
+            conn.execute("CREATE TABLE IF NOT EXISTS dirs (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "id INTEGER PRIMARY KEY, dir_id INTEGER NOT NULL, name TEXT NOT NULL, "
+                "is_folder INTEGER NOT NULL, size INTEGER NOT NULL, gen INTEGER NOT NULL, "
+                "UNIQUE (dir_id, name))"
+            )
+            # Answers the exact and prefix lookups that rank first.
+            conn.execute("CREATE INDEX IF NOT EXISTS files_name ON files (name COLLATE NOCASE)")
+            try:
+                conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS names USING fts5("
+                    "name, content='files', content_rowid='id', tokenize='trigram case_sensitive 0')"
+                )
+                conn.executescript(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+                        INSERT INTO names (rowid, name) VALUES (new.id, new.name);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+                        INSERT INTO names (names, rowid, name) VALUES ('delete', old.id, old.name);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS files_au AFTER UPDATE OF name ON files BEGIN
+                        INSERT INTO names (names, rowid, name) VALUES ('delete', old.id, old.name);
+                        INSERT INTO names (rowid, name) VALUES (new.id, new.name);
+                    END;
+                    """
+                )
+                self.has_trigram = True
+            except sqlite3.OperationalError as e:
+                logging.debug("File index: FTS5 trigram tokenizer unavailable, using table scans: %s", e)
+
+    # Metadata
+
+    def get_meta(self, key: str) -> str | None:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._write_lock, self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def clear(self):
+        with self._write_lock, self._connect() as conn:
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM dirs")
+            self._dir_ids.clear()
+
+    # Writes
+
+    def _dir_id(self, conn: sqlite3.Connection, path: str) -> int:
+        dir_id = self._dir_ids.get(path)
+        if dir_id is None:
+            conn.execute("INSERT OR IGNORE INTO dirs (path) VALUES (?)", (path,))
+            dir_id = conn.execute("SELECT id FROM dirs WHERE path = ?", (path,)).fetchone()[0]
+            self._dir_ids[path] = dir_id
+        return dir_id
+
+    def upsert(self, entries: Iterable[tuple[str, str, bool, int]], gen: int = 0):
+        """Insert or refresh ``(parent_dir, name, is_folder, size)`` rows."""
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO files (dir_id, name, is_folder, size, gen) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (dir_id, name) DO UPDATE SET "
+                "is_folder = excluded.is_folder, size = excluded.size, gen = excluded.gen",
+                [
+                    (self._dir_id(conn, parent), name, int(is_folder), size, gen)
+                    for parent, name, is_folder, size in entries
+                ],
+            )
+
+    def remove(self, path: str):
+        """Remove *path* and, if it is a folder, everything below it."""
+        parent, name = os.path.split(path)
+        with self._write_lock, self._connect() as conn:
+            row = conn.execute("SELECT id FROM dirs WHERE path = ?", (parent,)).fetchone()
+            if row:
+                conn.execute("DELETE FROM files WHERE dir_id = ? AND name = ?", (row[0], name))
+            self._remove_subtree(conn, path)
+
+    @staticmethod
+    def _subtree_range(path: str) -> tuple[str, str, str]:
+        """Return ``(path, low, high)`` bounds selecting *path* and every dir below it via the path index."""
+        path = path.rstrip("\\/")
+        return path, path + os.sep, path + chr(ord(os.sep) + 1)
+
+    def _remove_subtree(self, conn: sqlite3.Connection, path: str):
+        ids = [
+            r[0]
+            for r in conn.execute(
+                "SELECT id FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", self._subtree_range(path)
+            )
+        ]
+        for dir_id in ids:
+            conn.execute("DELETE FROM files WHERE dir_id = ?", (dir_id,))
+            conn.execute("DELETE FROM dirs WHERE id = ?", (dir_id,))
+        if ids:
+            removed = set(ids)
+            self._dir_ids = {p: i for p, i in self._dir_ids.items() if i not in removed}
+
+    def sweep(self, root: str, gen: int):
+        """Delete rows below *root* that were not seen by crawl generation *gen*."""
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "DELETE FROM files WHERE gen < ? AND dir_id IN "
+                "(SELECT id FROM dirs WHERE path = ? OR (path >= ? AND path < ?))",
+                (gen, *self._subtree_range(root)),
+            )
+
+    # Queries
+
+    def search(self, query: str, max_results: int = 20, search_dir: str | None = None) -> list[dict]:
+        """Return entries whose name contains *query*, or matches it when it is a glob.
+
+        For plain queries exact names come first, then names starting with the query.
+        Both are looked up on their own before the candidate limit applies, so
+        they are found however many other names contain the query.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+        limit = max(max_results * 20, _CANDIDATE_LIMIT)
+
+        if any(c in query for c in "*?[]"):
+            rows = self._select("f.name LIKE ?", [_glob_to_like(query)], search_dir, limit)
+            return [r for r in rows if fnmatch.fnmatchcase(r["name"].lower(), query)][:max_results]
+
+        following = query[:-1] + chr(ord(query[-1]) + 1)
+        rows = self._select("f.name = ? COLLATE NOCASE", [query], search_dir, max_results, fts=False)
+        rows += self._select(
+            "f.name >= ? COLLATE NOCASE AND f.name < ? COLLATE NOCASE", [query, following], search_dir, limit, fts=False
+        )
+        if self.has_trigram and len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows += self._select("names MATCH ?", [phrase], search_dir, limit)
+        else:
+            rows += self._select("f.name LIKE ?", [f"%{query}%"], search_dir, limit)
+        seen: set[str] = set()
+        matches = []
+        for row in rows:
+            if row["path"] not in seen and query in row["name"].lower():
+                seen.add(row["path"])
+                matches.append(row)
+        matches.sort(key=lambda r: (r["name"].lower() != query, not r["name"].lower().startswith(query)))
+        return matches[:max_results]
+
+    def _select(
+        self, where: str, params: list, search_dir: str | None, limit: int, fts: bool | None = None
+    ) -> list[dict]:
+        """Run a name query, through the trigram table when *fts* (by default: when available)."""
+        # LIKE patterns are left without ESCAPE so the trigram index can answer
+        # them; callers re-check every candidate, so stray % and _ are harmless.
+        params = list(params)
+        if search_dir:
+            search_dir = search_dir.rstrip("\\/")
+            where += " AND (d.path LIKE ? ESCAPE '\\' OR d.path LIKE ? ESCAPE '\\')"
+            params += [_escape_like(search_dir), _escape_like(search_dir + os.sep) + "%"]
+        if self.has_trigram if fts is None else fts:
+            sql = (
+                "SELECT d.path, f.name, f.is_folder, f.size FROM names "
+                "JOIN files f ON f.id = names.rowid JOIN dirs d ON d.id = f.dir_id "
+                f"WHERE {where.replace('f.name LIKE', 'names.name LIKE')} LIMIT ?"
+            )
+        else:
+            sql = (
+                "SELECT d.path, f.name, f.is_folder, f.size FROM files f "
+                f"JOIN dirs d ON d.id = f.dir_id WHERE {where} LIMIT ?"
+            )
+        try:
+            rows = self._connect().execute(sql, (*params, limit)).fetchall()
+        except sqlite3.Error as e:
+            logging.debug("File index query error: %s", e)
+            return []
+        return [
+            {"path": os.path.join(parent, name), "name": name, "is_folder": bool(is_folder), "size": size}
+            for parent, name, is_folder, size in rows
+        ]
+
+
+class FileIndexCrawler:
+    """Fills a `FileIndex` from *roots* and keeps it current.
+
+    On start every root is crawled once in the background (rows that
+    disappeared since the last run are swept away afterwards), then
+    filesystem change notifications are applied incrementally.
+    The index is queryable the whole time.
+    """
+
+    def __init__(
+        self,
+        index: FileIndex,
+        roots: list[str],
+        skip_folder: Callable[[str], bool] | None = None,
+        skip_file: Callable[[str], bool] | None = None,
+    ):
+        self._index = index
+        self._roots = [os.path.normpath(r) for r in roots]
+        self._skip_folder = skip_folder or (lambda name: False)
+        self._skip_file = skip_file or (lambda name: False)
+        self._changes: SimpleQueue[tuple[str, str, str | None]] = SimpleQueue()
+        self._changes_dropped = threading.Event()
+        self._stop = threading.Event()
+        self._crawled = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._observer = None
+
+    @property
+    def is_crawling(self) -> bool:
+        return self._thread is not None and not self._crawled.is_set()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        roots_key = "\n".join(sorted(self._roots))
+        if self._index.get_meta("roots") != roots_key:
+            self._index.clear()
+            self._index.set_meta("roots", roots_key)
+        self._start_watching()
+        self._thread = threading.Thread(target=self._run, name="yasb_file_index", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+            except Exception:
+                pass
+            self._observer = None
+
+    def wait_crawled(self, timeout: float | None = None) -> bool:
+        return self._crawled.wait(timeout)
+
+    def notify(self, kind: str, path: str, dest: str | None = None):
+        """Queue a change: ``created``, ``deleted``, ``modified`` or ``moved`` (with *dest*)."""
+        if self._changes.qsize() >= _CHANGE_QUEUE_LIMIT:
+            self._changes_dropped.set()
+            return
+        self._changes.put((kind, path, dest))
+
+    def _run(self):
+        if not self._crawl_roots():
+            return
+        self._crawled.set()
+        while not self._stop.is_set():
+            if self._changes_dropped.is_set():
+                logging.info("File index: too many changes queued, crawling again")
+                self._changes_dropped.clear()
+                # The crawl sees everything the queued changes describe.
+                while not self._changes.empty():
+                    self._changes.get_nowait()
+                self._crawl_roots()
+            else:
+                self._apply_changes()
+
+    def _crawl_roots(self) -> bool:
+        """Crawl every root as a new generation and sweep what it no longer found. False if stopped."""
+        gen = int(self._index.get_meta("gen") or 0) + 1
+        started = time.monotonic()
+        for root in self._roots:
+            if self._stop.is_set():
+                return False
+            self.crawl(root, gen)
+            if not self._stop.is_set():
+                self._index.sweep(root, gen)
+        self._index.set_meta("gen", str(gen))
+        logging.info("File index: crawled %d entries in %.1fs", self._index.count(), time.monotonic() - started)
+        return True
+
+    def crawl(self, root: str, gen: int = 0):
+        """Walk *root* with ``os.scandir`` and write every visible entry to the index."""
+        batch: list[tuple[str, str, bool, int]] = []
+        stack = [root]
+        while stack:
+            if self._stop.is_set():
+                return
+            path = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        item = self._scan_entry(entry)
+                        if item is None:
+                            continue
+                        batch.append((path, entry.name, item[0], item[1]))
+                        if item[0]:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+            if len(batch) >= _BATCH_SIZE:
+                self._index.upsert(batch, gen)
+                batch = []
+        if batch:
+            self._index.upsert(batch, gen)
+
+    def _scan_entry(self, entry: os.DirEntry) -> tuple[bool, int] | None:
+        try:
+            if entry.is_symlink():
+                return None
+            return self._classify(entry.name, entry.stat(follow_symlinks=False))
+        except OSError:
+            return None
+
+    def _classify(self, name: str, st: os.stat_result) -> tuple[bool, int] | None:
+        """Return ``(is_folder, size)`` for an entry worth indexing, else None."""
+        attrs = getattr(st, "st_file_attributes", 0)
+        low = name.lower()
+        if stat.S_ISDIR(st.st_mode):
+            if attrs & (_FILE_ATTRIBUTE_HIDDEN | _FILE_ATTRIBUTE_SYSTEM) or self._skip_folder(low):
+                return None
+            return True, 0
+        if not stat.S_ISREG(st.st_mode) or attrs & _FILE_ATTRIBUTE_SYSTEM or self._skip_file(low):
+            return None
+        return False, st.st_size
+
+    def _apply_changes(self):
+        try:
+            changes = [self._changes.get(timeout=0.5)]
+        except Empty:
+            return
+        # Editors and installers fire bursts of events; wait for quiet, then apply once.
+        deadline = time.monotonic() + _CHANGE_MAX_WAIT
+        while not self._stop.is_set() and len(changes) < _CHANGE_MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                changes.append(self._changes.get(timeout=min(_CHANGE_DELAY, remaining)))
+            except Empty:
+                break
+        for kind, path, dest in changes:
+            try:
+                if kind in ("deleted", "moved"):
+                    self._index.remove(path)
+                if kind == "moved" and dest:
+                    self._add_path(dest, recurse=True)
+                elif kind in ("created", "modified"):
+                    self._add_path(path, recurse=kind == "created")
+            except Exception as e:
+                logging.debug("File index: failed to apply %s %s: %s", kind, path, e)
+
+    def _add_path(self, path: str, recurse: bool):
+        if not any(path.startswith(root.rstrip("\\/") + os.sep) for root in self._roots):
+            return
+        parent, name = os.path.split(path)
+        if self._is_skipped(parent):
+            return
+        try:
+            item = self._classify(name, os.lstat(path))
+        except OSError:
+            return
+        if item is None:
+            return
+        self._index.upsert([(parent, name, item[0], item[1])])
+        if item[0] and recurse:
+            self.crawl(path)
+
+    def _is_skipped(self, path: str) -> bool:
+        for root in self._roots:
+            if path.startswith(root):
+                rel = path[len(root) :].strip("\\/")
+                return any(self._skip_folder(part.lower()) for part in rel.split(os.sep) if part)
+        return True
+
+    def _start_watching(self):
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logging.debug("File index: watchdog unavailable, index will refresh on next start")
+            return
+
+        crawler = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type in ("created", "deleted", "modified", "moved"):
+                    crawler.notify(event.event_type, event.src_path, getattr(event, "dest_path", None))
+
+        try:
+            observer = Observer()
+            for root in self._roots:
+                if os.path.isdir(root):
+                    observer.schedule(_Handler(), root, recursive=True)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            logging.debug("File index: failed to watch roots: %s", e)
@@ -43,11 +43,20 @@ def fuzzy_score(query: str, target: str) -> int | None:
     if not query or not target:
         return 0 if not query else None
 
-    q = query.lower()
-    t = target.lower()
+    return score_prepared(query.lower(), target.lower(), _get_initials(target))
+
+
+def score_prepared(q: str, t: str, initials: str, words: tuple[str, ...] | None = None) -> int | None:
+    """Tier-score an already lowercased query against precomputed target data.
+
+    Same tiers as `fuzzy_score`, but *t*, *initials* and optionally the
+    whitespace-split *words* of the target are supplied by the caller so
+    they can be computed once and reused across queries.
+    """
+    if not t:
+        return None
 
     # Initials match (highest priority)
-    initials = _get_initials(target)
     if initials.startswith(q):
         return 6 if q == initials else 5
 
@@ -56,7 +65,7 @@ def fuzzy_score(query: str, target: str) -> int | None:
         return 4
 
     # Word prefix match
-    for word in t.split():
+    for word in t.split() if words is None else words:
         if word.startswith(q):
             return 3
 
@@ -65,11 +74,8 @@ def fuzzy_score(query: str, target: str) -> int | None:
         return 2
 
     # Subsequence match (characters appear in order)
-    qi = 0
-    for ch in t:
-        if qi < len(q) and ch == q[qi]:
-            qi += 1
-    if qi == len(q):
+    remaining = iter(t)
+    if all(ch in remaining for ch in q):
         return 1
 
     return None
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from threading import Lock
+
+# (source, icon_index, size, scratch_dir) -> path of an extracted PNG, or None
+IconExtractor = Callable[[str, int, int, str], str | None]
+
+_MANIFEST = "manifest.json"
+_MANIFEST_VERSION = 1
+# Entries not used for this long are dropped on save
+_STALE_AFTER = 30 * 24 * 3600
+# Failed extractions are retried after this long even if the source is unchanged
+_RETRY_FAILED_AFTER = 24 * 3600
+
+
+class IconCache:
+    """Persistent, content-addressed cache of extracted app icons.
+
+    Entries are keyed by source path, source mtime, icon index and size.
+    The manifest maps each key to the SHA-1 of the extracted PNG, so a hit
+    costs one ``stat`` of the source and never opens it, and icons shared by
+    many shortcuts are stored once. Failed extractions are remembered for a
+    day, so sources without an icon are not re-opened on every start.
+
+    Extraction is delegated to the *extractor* callable, which writes into
+    a scratch directory of its own for every call, since extractors name
+    their output after the source and ``resolve`` runs on several threads;
+    the cache moves the result into place. Files are
+    pruned least-recently-used once they exceed ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str, extractor: IconExtractor, scratch_dir: str, max_bytes: int = 64 * 1024 * 1024):
+        self._dir = cache_dir
+        self._extractor = extractor
+        self._scratch_dir = scratch_dir
+        self._max_bytes = max_bytes
+        self._manifest_path = os.path.join(cache_dir, _MANIFEST)
+        self._lock = Lock()
+        self._dirty = False
+        os.makedirs(cache_dir, exist_ok=True)
+        os.makedirs(scratch_dir, exist_ok=True)
+        # key -> {"hash": sha1 or "", "bytes": file size, "used": last access time}
+        self._entries: dict[str, dict] = self._load()
+
+    @staticmethod
+    def _mtime(source: str) -> int:
+        try:
+            return os.stat(source).st_mtime_ns
+        except OSError:
+            # Virtual sources (UWP::, CPL::) have no file to stat.
+            return 0
+
+    @staticmethod
+    def make_key(source: str, mtime: int, icon_index: int, size: int) -> str:
+        return f"{source.lower()}|{mtime}|{icon_index}|{size}"
+
+    @property
+    def scratch_dir(self) -> str:
+        return self._scratch_dir
+
+    def _file(self, digest: str) -> str:
+        return os.path.join(self._dir, f"{digest}.png")
+
+    def lookup(self, source: str, icon_index: int = 0, size: int = 48) -> tuple[bool, str | None]:
+        """Return ``(hit, png_path)``; a hit with no path means extraction is known to fail."""
+        key = self.make_key(source, self._mtime(source), icon_index, size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            now = time.time()
+            if not entry["hash"]:
+                return now - entry["used"] < _RETRY_FAILED_AFTER, None
+            entry["used"] = now
+            self._dirty = True
+            path = self._file(entry["hash"])
+        if os.path.isfile(path):
+            return True, path
+        with self._lock:
+            self._entries.pop(key, None)
+        return False, None
+
+    def resolve(self, source: str, icon_index: int = 0, size: int = 48, refresh: bool = False) -> str | None:
+        """Return the cached PNG for *source*, extracting and storing it on a miss.
+
+        With *refresh* the icon is always re-extracted, for sources whose
+        changes the mtime does not reflect.
+        """
+        if not refresh:
+            hit, path = self.lookup(source, icon_index, size)
+            if hit:
+                return path
+        key = self.make_key(source, self._mtime(source), icon_index, size)
+        extracted = None
+        scratch = tempfile.mkdtemp(dir=self._scratch_dir)
+        try:
+            extracted = self._extractor(source, icon_index, size, scratch)
+        except Exception as e:
+            logging.debug("Icon extraction failed for %s: %s", source, e)
+        digest, nbytes = "", 0
+        if extracted and os.path.isfile(extracted):
+            try:
+                digest, nbytes = self._store(extracted)
+            except OSError as e:
+                logging.debug("Icon cache store failed for %s: %s", source, e)
+                # The scratch copy is all there is, keep it.
+                return extracted
+        shutil.rmtree(scratch, ignore_errors=True)
+        if not digest and refresh:
+            # Keep serving the previous icon rather than forgetting it.
+            return self.lookup(source, icon_index, size)[1]
+        with self._lock:
+            self._entries[key] = {"hash": digest, "bytes": nbytes, "used": time.time()}
+            self._dirty = True
+        return self._file(digest) if digest else None
+
+    def _store(self, extracted: str) -> tuple[str, int]:
+        with open(extracted, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()
+        target = self._file(digest)
+        if not os.path.isfile(target):
+            fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self._dir)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, target)
+            except OSError:
+                os.remove(tmp)
+                raise
+        return digest, len(data)
+
+    def save(self):
+        """Prune to the size cap and write the manifest if anything changed.
+
+        Call once no ``resolve`` is running, since files stored mid-prune are
+        not in the manifest yet.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            self._prune()
+            entries = dict(self._entries)
+            self._dirty = False
+        tmp = self._manifest_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": _MANIFEST_VERSION, "entries": entries}, f, separators=(",", ":"))
+            os.replace(tmp, self._manifest_path)
+        except OSError as e:
+            logging.debug("Icon cache manifest write failed: %s", e)
+
+    def _prune(self):
+        # Entries of sources that changed or disappeared are never hit again.
+        stale = time.time() - _STALE_AFTER
+        self._entries = {k: e for k, e in self._entries.items() if e["used"] >= stale}
+        # Size and recency of each stored file; a file lives as long as any key uses it.
+        files: dict[str, list[float]] = {}
+        for entry in self._entries.values():
+            digest = entry["hash"]
+            if digest:
+                info = files.setdefault(digest, [entry["bytes"], 0.0])
+                info[1] = max(info[1], entry["used"])
+        total = sum(nbytes for nbytes, _ in files.values())
+        evicted: set[str] = set()
+        for digest, (nbytes, _) in sorted(files.items(), key=lambda item: item[1][1]):
+            if total <= self._max_bytes:
+                break
+            evicted.add(digest)
+            total -= nbytes
+        if evicted:
+            self._entries = {k: e for k, e in self._entries.items() if e["hash"] not in evicted}
+        for name in os.listdir(self._dir):
+            digest, ext = os.path.splitext(name)
+            if ext == ".png" and (digest not in files or digest in evicted):
+                try:
+                    os.remove(os.path.join(self._dir, name))
+                except OSError:
+                    pass
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self._manifest_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == _MANIFEST_VERSION:
+                return data.get("entries", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.debug("Icon cache manifest unreadable, starting empty: %s", e)
+        return {}
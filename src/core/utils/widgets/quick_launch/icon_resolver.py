@@ -1,9 +1,12 @@
 import logging
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import pythoncom
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from core.utils.widgets.quick_launch.icon_cache import IconCache
 from core.utils.win32.icon_extractor import IconExtractorUtil
 
 # Standard icon sizes found in ICO / PE resources.
@@ -27,50 +30,88 @@ def compute_extraction_size(icon_size: int, dpr: float) -> int:
     return _STANDARD_SIZES[-1]
 
 
+def extract_app_icon(path: str, icon_index: int, size: int, icons_dir: str) -> str | None:
+    """Extract the icon of a Quick Launch app path into *icons_dir*."""
+    if path.startswith("UWP::"):
+        appid = path.replace("UWP::", "")
+        return IconExtractorUtil.extract_shell_appid_icon(appid, icons_dir, size=size)
+    if path.startswith("CPL::"):
+        return IconExtractorUtil.extract_cpl_icon(path, icons_dir, size=size)
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".lnk":
+        return IconExtractorUtil.extract_lnk_icon(path, icons_dir, size=size)
+    if ext == ".url":
+        return IconExtractorUtil.extract_url_icon(path, icons_dir, size=size)
+    if os.path.isfile(path):
+        return IconExtractorUtil.extract_icon_with_index(path, icon_index, icons_dir, size=size)
+    return None
+
+
 class IconResolverWorker(QThread):
-    """Background thread that resolves icons for discovered apps."""
+    """Background thread that resolves icons for discovered apps.
+
+    Icons already in the persistent cache are emitted first, in one pass
+    that never opens the source files. Misses are then extracted on a
+    bounded thread pool and emitted as they complete. UWP icons, whose
+    updates don't show in a file mtime, are re-extracted after the cached
+    copy was served and emitted again only if they changed.
+    """
 
     icon_ready = pyqtSignal(str, str)
 
-    def __init__(self, apps: list[tuple[str, str, object]], icons_dir: str, size: int = 48):
+    def __init__(
+        self, apps: list[tuple[str, str, object]], icon_cache: IconCache, size: int = 48, max_workers: int = 4
+    ):
         super().__init__()
         self._apps = apps
-        self._icons_dir = icons_dir
+        self._cache = icon_cache
         self._size = size
+        self._max_workers = max_workers
         self._should_stop = False
 
     def stop(self):
         self._should_stop = True
 
     def run(self):
-        self._default_icon = IconExtractorUtil.extract_default_icon(self._icons_dir, size=self._size)
+        self._default_icon = IconExtractorUtil.extract_default_icon(self._cache.scratch_dir, size=self._size)
+        pending: list[tuple[str, str, str | None]] = []
         for name, path, _ in self._apps:
             if self._should_stop:
-                break
+                return
             app_key = f"{name}::{path}"
-            try:
-                icon_path = self._resolve_icon(path)
-                if not icon_path or not os.path.isfile(icon_path):
-                    icon_path = self._default_icon
-                if icon_path and os.path.isfile(icon_path):
-                    self.icon_ready.emit(app_key, icon_path)
-            except Exception as e:
-                logging.debug("Icon resolve failed for %s: %s", name, e)
-                if self._default_icon:
-                    self.icon_ready.emit(app_key, self._default_icon)
-
-    def _resolve_icon(self, path: str) -> str | None:
-        sz = self._size
-        if path.startswith("UWP::"):
-            appid = path.replace("UWP::", "")
-            return IconExtractorUtil.extract_shell_appid_icon(appid, self._icons_dir, size=sz)
-        if path.startswith("CPL::"):
-            return IconExtractorUtil.extract_cpl_icon(path, self._icons_dir, size=sz)
-        ext = os.path.splitext(path)[1].lower()
-        if ext == ".lnk":
-            return IconExtractorUtil.extract_lnk_icon(path, self._icons_dir, size=sz)
-        if ext == ".url":
-            return IconExtractorUtil.extract_url_icon(path, self._icons_dir, size=sz)
-        if os.path.isfile(path):
-            return IconExtractorUtil.extract_icon_with_index(path, 0, self._icons_dir, size=sz)
-        return None
+            hit, icon_path = self._cache.lookup(path, 0, self._size)
+            if not hit:
+                pending.append((app_key, path, None))
+                continue
+            self._emit(app_key, icon_path)
+            if path.startswith("UWP::"):
+                pending.append((app_key, path, icon_path))
+
+        if pending:
+            # Shortcut and shell icon extraction goes through COM, which every pool thread must initialize.
+            with ThreadPoolExecutor(
+                self._max_workers, "quick_launch_icons", initializer=pythoncom.CoInitialize
+            ) as pool:
+                futures = {
+                    pool.submit(self._cache.resolve, path, 0, self._size, previous is not None): (app_key, previous)
+                    for app_key, path, previous in pending
+                }
+                for future in as_completed(futures):
+                    if self._should_stop:
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        break
+                    app_key, previous = futures[future]
+                    try:
+                        icon_path = future.result()
+                    except Exception as e:
+                        logging.debug("Icon resolve failed for %s: %s", app_key, e)
+                        icon_path = None
+                    if previous is None or (icon_path and icon_path != previous):
+                        self._emit(app_key, icon_path)
+        self._cache.save()
+
+    def _emit(self, app_key: str, icon_path: str | None):
+        if not icon_path or not os.path.isfile(icon_path):
+            icon_path = self._default_icon
+        if icon_path:
+            self.icon_ready.emit(app_key, icon_path)
@@ -1,14 +1,50 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+
 from PyQt6.QtCore import QSize, Qt
 from PyQt6.QtGui import QPainter, QPixmap
 from PyQt6.QtSvg import QSvgRenderer
 
-_ICON_CACHE: dict[str, QPixmap] = {}
+
+class PixmapCache:
+    """Bounded LRU cache of rendered pixmaps.
+
+    Keys are tuples like ``(kind, path_or_char, size, dpr)``. A null pixmap
+    can be stored to remember that rendering failed.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._items: OrderedDict[Hashable, QPixmap] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable) -> QPixmap | None:
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+        return pixmap
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> QPixmap:
+        self._items[key] = pixmap
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_entries:
+            self._items.popitem(last=False)
+        return pixmap
+
+    def clear(self):
+        self._items.clear()
+
+
+PIXMAP_CACHE = PixmapCache()
 
 
 def load_and_scale_icon(icon_path: str, size: int, dpr: float = 1.0) -> QPixmap:
-    key = f"{icon_path}_{size}_{dpr}"
-    if key in _ICON_CACHE:
-        return _ICON_CACHE[key]
+    key = ("file", icon_path, size, dpr)
+    cached = PIXMAP_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
         target = int(size * dpr)
         pixmap = QPixmap(icon_path)
@@ -20,17 +56,16 @@ def load_and_scale_icon(icon_path: str, size: int, dpr: float = 1.0) -> QPixmap:
             Qt.TransformationMode.SmoothTransformation,
         )
         scaled.setDevicePixelRatio(dpr)
-        _ICON_CACHE[key] = scaled
-        return scaled
+        return PIXMAP_CACHE.put(key, scaled)
     except Exception:
         return QPixmap()
 
 
 def svg_to_pixmap(svg_text: str, size: int, dpr: float = 1.0) -> QPixmap:
-
-    key = f"svg_{hash(svg_text)}_{size}_{dpr}"
-    if key in _ICON_CACHE:
-        return _ICON_CACHE[key]
+    key = ("svg", svg_text, size, dpr)
+    cached = PIXMAP_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
         renderer = QSvgRenderer(svg_text.encode("utf-8"))
         if not renderer.isValid():
@@ -57,7 +92,6 @@ def svg_to_pixmap(svg_text: str, size: int, dpr: float = 1.0) -> QPixmap:
             renderer.render(painter)
         painter.end()
         pixmap.setDevicePixelRatio(dpr)
-        _ICON_CACHE[key] = pixmap
-        return pixmap
+        return PIXMAP_CACHE.put(key, pixmap)
     except Exception:
         return QPixmap()
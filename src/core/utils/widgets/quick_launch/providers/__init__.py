@@ -1,26 +1,45 @@
-from .apps import *
-from .binance import *
-from .bookmarks import *
-from .calculator import *
-from .clipboard_history import *
-from .color import *
-from .currency import *
-from .dev_tools import *
-from .emoji import *
-from .file_search import *
-from .github_notifications import *
-from .hacker_news import *
-from .ip_info import *
-from .kill_process import *
-from .port_viewer import *
-from .settings import *
-from .snippets import *
-from .ssh import *
-from .system_commands import *
-from .unit_converter import *
-from .vscode import *
-from .web_search import *
-from .window_switcher import *
-from .windows_terminal import *
-from .world_clock import *
-from .wsl import *
+"""Quick Launch providers.
+
+Provider modules are imported on first access to one of their classes, so
+importing a single module of this package does not load every provider.
+"""
+
+import importlib
+
+_PROVIDER_MODULES = {
+    "AppsProvider": "apps",
+    "BinanceProvider": "binance",
+    "BookmarksProvider": "bookmarks",
+    "CalculatorProvider": "calculator",
+    "ClipboardHistoryProvider": "clipboard_history",
+    "ColorProvider": "color",
+    "CurrencyProvider": "currency",
+    "DevToolsProvider": "dev_tools",
+    "EmojiProvider": "emoji",
+    "FileSearchProvider": "file_search",
+    "GithubNotificationsProvider": "github_notifications",
+    "HackerNewsProvider": "hacker_news",
+    "IpInfoProvider": "ip_info",
+    "KillProcessProvider": "kill_process",
+    "PortViewerProvider": "port_viewer",
+    "SettingsProvider": "settings",
+    "SnippetsProvider": "snippets",
+    "SshProvider": "ssh",
+    "SystemCommandsProvider": "system_commands",
+    "UnitConverterProvider": "unit_converter",
+    "VSCodeProvider": "vscode",
+    "WebSearchProvider": "web_search",
+    "WindowSwitcherProvider": "window_switcher",
+    "WindowsTerminalProvider": "windows_terminal",
+    "WorldClockProvider": "world_clock",
+    "WslProvider": "wsl",
+}
+
+__all__ = list(_PROVIDER_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
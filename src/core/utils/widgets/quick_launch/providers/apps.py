@@ -3,6 +3,7 @@ import ctypes.wintypes
 import json
 import logging
 import os
+import threading
 import time
 
 import pythoncom
@@ -18,16 +19,45 @@ from core.utils.widgets.quick_launch.base_provider import (
     ProviderMenuActionResult,
     ProviderResult,
 )
-from core.utils.widgets.quick_launch.fuzzy import _split_camel, fuzzy_score
 from core.utils.widgets.quick_launch.providers.resources.icons import ICON_APPS
 
+# Launch weight halves every week, so usage fades continuously instead of in steps
+_FRECENCY_HALF_LIFE = 7 * 24 * 3600
+_FRECENCY_SCALE = 1.5
+_FRECENCY_MAX = 3.0
+# Log entries appended before the snapshot is rewritten in the background
+_COMPACT_AFTER = 64
+
 
 class LaunchHistory:
-    """Manages launch history and frecency scoring for apps."""
+    """Manages launch history and frecency scoring for apps.
+
+    Launches and removals are appended to ``quick_launch_recent.log`` as
+    one JSON line each; a background compaction folds the log into the
+    ``quick_launch_recent.json`` snapshot. Log lines carry a sequence
+    number and the snapshot records the last one it contains, so a log that
+    survived a crash mid-compaction is not applied twice.
+
+    Frecency is an exponentially decayed launch count. Scores are kept
+    relative to a fixed anchor time, which makes updating an app on launch
+    O(1) and turns scoring into a lookup times one shared decay factor.
+    """
 
     def __init__(self):
         self._recent_file = str(app_data_path("quick_launch_recent.json"))
+        self._log_file = str(app_data_path("quick_launch_recent.log"))
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._pending = 0
+        self._compacting = False
+        self._anchor = time.time()
+        self._decay = 1.0
+        self._decay_at = 0.0
+        self._scores: dict[str, float] = {}
         self._history: dict[str, dict] = self._load()
+        self._scores = {key: self._anchored(entry) for key, entry in self._history.items()}
+        if self._pending:
+            self._compact_in_background()
 
     @property
     def data(self) -> dict[str, dict]:
@@ -35,23 +65,10 @@ class LaunchHistory:
 
     def record(self, name: str, path: str):
         key = f"{name}::{path}"
-        now = time.time()
-        entry = self._history.get(key)
-        if entry:
-            entry["count"] += 1
-            entry["last_used"] = now
-        else:
-            self._history[key] = {
-                "name": name,
-                "path": path,
-                "count": 1,
-                "last_used": now,
-            }
-        self.save()
+        self._append({"op": "launch", "key": key, "name": name, "path": path, "ts": time.time()})
 
     def remove(self, key: str):
-        self._history.pop(key, None)
-        self.save()
+        self._append({"op": "remove", "key": key})
 
     def get_frecency_score(self, app_key: str) -> float:
         """Return a frecency boost in range [0.0, 3.0].
@@ -60,52 +77,146 @@ class LaunchHistory:
         apps outrank apps with a slightly better match quality but no usage
         history.
         """
-        entry = self._history.get(app_key)
-        if not entry:
+        score = self._scores.get(app_key)
+        if not score:
             return 0.0
-        count = entry.get("count", 0)
-        hours_ago = (time.time() - entry.get("last_used", 0)) / 3600
-        if hours_ago < 4:
-            recency = 1.0
-        elif hours_ago < 24:
-            recency = 0.8
-        elif hours_ago < 168:
-            recency = 0.6
+        return min(score * self._decay_factor(), _FRECENCY_MAX)
+
+    def _decay_factor(self) -> float:
+        # Shared by every app, refreshed at most once a minute.
+        now = time.time()
+        if now - self._decay_at > 60:
+            self._decay = 2 ** ((self._anchor - now) / _FRECENCY_HALF_LIFE)
+            self._decay_at = now
+        return self._decay
+
+    def _anchored(self, entry: dict) -> float:
+        """Scaled frecency of *entry* as of the anchor time."""
+        return entry["frecency"] * _FRECENCY_SCALE * 2 ** ((entry["last_used"] - self._anchor) / _FRECENCY_HALF_LIFE)
+
+    def _apply(self, event: dict):
+        key = event.get("key", "")
+        if event.get("op") == "remove":
+            self._history.pop(key, None)
+            self._scores.pop(key, None)
+            return
+        ts = event.get("ts", time.time())
+        entry = self._history.get(key)
+        if entry:
+            elapsed = max(ts - entry["last_used"], 0)
+            entry["frecency"] = entry["frecency"] * 2 ** (-elapsed / _FRECENCY_HALF_LIFE) + 1
+            entry["count"] += 1
+            entry["last_used"] = max(ts, entry["last_used"])
         else:
-            recency = 0.4
-        return min(count * recency * 1.5, 3.0)
+            entry = self._history[key] = {
+                "name": event.get("name", ""),
+                "path": event.get("path", ""),
+                "count": 1,
+                "last_used": ts,
+                "frecency": 1.0,
+            }
+        self._scores[key] = self._anchored(entry)
 
-    def save(self):
+    def _append(self, event: dict):
+        with self._lock:
+            self._seq += 1
+            event["seq"] = self._seq
+            self._apply(event)
+            try:
+                with open(self._log_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(event, separators=(",", ":")) + "\n")
+            except Exception:
+                pass
+            self._pending += 1
+            compact = self._pending >= _COMPACT_AFTER
+        if compact:
+            self._compact_in_background()
+
+    def _compact_in_background(self):
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+        threading.Thread(target=self._compact, daemon=True).start()
+
+    def _compact(self):
         try:
-            os.makedirs(os.path.dirname(self._recent_file), exist_ok=True)
-            with open(self._recent_file, "w", encoding="utf-8") as f:
-                json.dump(self._history, f, indent=2)
-        except Exception:
-            pass
+            # Copy under the lock and write outside it, so a launch recorded
+            # meanwhile doesn't wait for the disk.
+            with self._lock:
+                seq, pending = self._seq, self._pending
+                apps = {key: dict(entry) for key, entry in self._history.items()}
+            tmp = self._recent_file + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": 2, "seq": seq, "apps": apps}, f, separators=(",", ":"))
+            os.replace(tmp, self._recent_file)
+            with self._lock:
+                # Entries up to seq are in the snapshot now. If more were logged
+                # during the write the log is kept; loading skips the old ones.
+                if self._seq == seq:
+                    open(self._log_file, "w").close()
+                self._pending -= pending
+        except Exception as e:
+            logging.debug("Quick Launch history compaction failed: %s", e)
+        finally:
+            self._compacting = False
 
     def _load(self) -> dict[str, dict]:
+        history: dict[str, dict] = {}
         try:
             if os.path.isfile(self._recent_file):
                 with open(self._recent_file, encoding="utf-8") as f:
                     data = json.load(f)
-                # Migrate legacy list format
-                if isinstance(data, list):
-                    history: dict[str, dict] = {}
-                    for r in reversed(data):
-                        key = r.get("key", "")
-                        if key:
-                            history[key] = {
-                                "name": r.get("name", ""),
-                                "path": r.get("path", ""),
-                                "count": 1,
-                                "last_used": r.get("timestamp", time.time()),
-                            }
-                    return history
-                if isinstance(data, dict):
-                    return data
+                if isinstance(data, dict) and data.get("version") == 2:
+                    history = data.get("apps", {})
+                    self._seq = data.get("seq", 0)
+                else:
+                    history = self._migrate(data)
+                    # Rewrite legacy files in the current format.
+                    self._pending += bool(history)
         except Exception:
             pass
-        return {}
+        self._history = history
+        try:
+            if os.path.isfile(self._log_file):
+                with open(self._log_file, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            event = json.loads(line)
+                        except ValueError:
+                            # A torn last line from an interrupted append
+                            continue
+                        if event.get("seq", 0) <= self._seq:
+                            continue
+                        self._seq = event["seq"]
+                        self._apply(event)
+                        self._pending += 1
+        except Exception:
+            pass
+        return history
+
+    @staticmethod
+    def _migrate(data) -> dict[str, dict]:
+        """Convert the legacy list and plain dict formats, estimating frecency from count and last use."""
+        history: dict[str, dict] = {}
+        # Legacy list format
+        if isinstance(data, list):
+            for r in reversed(data):
+                key = r.get("key", "")
+                if key:
+                    history[key] = {
+                        "name": r.get("name", ""),
+                        "path": r.get("path", ""),
+                        "count": 1,
+                        "last_used": r.get("timestamp", time.time()),
+                    }
+        elif isinstance(data, dict):
+            history = {key: dict(entry) for key, entry in data.items() if isinstance(entry, dict)}
+        for entry in history.values():
+            entry.setdefault("count", 1)
+            entry.setdefault("last_used", 0)
+            entry["frecency"] = float(entry["count"])
+        return history
 
 
 def _get_exe_description(exe_path: str) -> str | None:
@@ -267,6 +378,8 @@ class AppsProvider(BaseProvider):
     display_name = "Applications"
     input_placeholder = "Search applications..."
     icon = ICON_APPS
+    cache_ttl = 300.0
+    clear_cache_on_deactivate = False
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
@@ -297,6 +410,8 @@ class AppsProvider(BaseProvider):
 
     def _on_descriptions_ready(self, cache: dict):
         self._desc_cache = cache
+        if self.invalidate_cache:
+            self.invalidate_cache()
 
     def get_results(self, text: str, **kwargs) -> list[ProviderResult]:
         svc = self.service
@@ -328,27 +443,13 @@ class AppsProvider(BaseProvider):
         else:
             # Search query fuzzy match by name, fallback to app id
             scored_apps: list[tuple[float, str, str]] = []
-            for n, p, _ in svc.apps:
-                fs = fuzzy_score(text_lower, n)
-                if fs is None and p.startswith("UWP::"):
-                    appid = p[5:].split("!")[0].split("_")[0]
-                    pkg_name = appid.rsplit(".", 1)[-1] if "." in appid else appid
-                    # Split CamelCase (WindowsTerminal -> Windows Terminal)
-                    # and match against the human-readable form.
-                    pkg_words = _split_camel(pkg_name)
-                    pkg_fs = fuzzy_score(text_lower, pkg_words)
-                    if pkg_fs is not None:
-                        # Cap package-name matches between word-prefix (3)
-                        # and prefix (4). Frecency can bridge the gap to
-                        # higher tiers for frequently used apps.
-                        fs = min(pkg_fs, 3.5)
-                if fs is not None:
-                    # Demote apps with default icon (system shortcuts,
-                    # not real apps) so they sink below real app matches.
-                    icon = svc.icon_paths.get(f"{n}::{p}", "")
-                    if icon.endswith("_default_app.png"):
-                        fs = min(fs, 0.5)
-                    scored_apps.append((float(fs), n, p))
+            for fs, n, p in svc.app_index.search(text_lower):
+                # Demote apps with default icon (system shortcuts,
+                # not real apps) so they sink below real app matches.
+                icon = svc.icon_paths.get(f"{n}::{p}", "")
+                if icon.endswith("_default_app.png"):
+                    fs = min(fs, 0.5)
+                scored_apps.append((fs, n, p))
 
             if show_recent:
                 for i, (fs, n, p) in enumerate(scored_apps):
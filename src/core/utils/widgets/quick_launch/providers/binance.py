@@ -19,6 +19,7 @@ class BinanceProvider(BaseProvider):
     display_name = "Binance"
     input_placeholder = "Search crypto prices..."
     icon = ICON_BINANCE
+    cache_ttl = 10.0
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
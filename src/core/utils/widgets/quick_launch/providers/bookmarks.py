@@ -1,11 +1,16 @@
+import hashlib
 import json
 import logging
 import os
 import shutil
 import sqlite3
 import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 from core.utils.shell_utils import shell_open
+from core.utils.utilities import app_data_path
 from core.utils.widgets.quick_launch.base_provider import BaseProvider, ProviderResult
 from core.utils.widgets.quick_launch.providers.resources.icons import ICON_BOOKMARK
 
@@ -25,6 +30,158 @@ _FIREFOX_PATHS: dict[str, str] = {
 }
 
 
+# Most visited candidate rows fetched per query before ranking by match position.
+_CANDIDATE_LIMIT = 500
+
+
+class _BookmarkStore:
+    """Persistent bookmark index with per-source fingerprints.
+
+    Every source file is tracked by a cheap stat signature and a content
+    fingerprint. A source whose signature changed but whose fingerprint did
+    not is left alone, and only sources whose content actually changed are
+    re-ingested. Titles, URLs and folders are indexed with an FTS5 trigram
+    table so substring queries never scan every bookmark.
+    """
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._local = threading.local()
+        self.has_trigram = False
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sources ("
+                "path TEXT PRIMARY KEY, browser TEXT NOT NULL, signature TEXT NOT NULL, fingerprint TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS bookmarks ("
+                "id INTEGER PRIMARY KEY, source TEXT NOT NULL, browser TEXT NOT NULL, "
+                "title TEXT NOT NULL, url TEXT NOT NULL, folder TEXT NOT NULL, visits INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS bookmarks_source ON bookmarks (source)")
+            try:
+                conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS bookmarks_fts USING fts5("
+                    "title, url, folder, content='bookmarks', content_rowid='id', "
+                    "tokenize='trigram case_sensitive 0')"
+                )
+                conn.executescript(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS bookmarks_ai AFTER INSERT ON bookmarks BEGIN
+                        INSERT INTO bookmarks_fts (rowid, title, url, folder)
+                        VALUES (new.id, new.title, new.url, new.folder);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS bookmarks_ad AFTER DELETE ON bookmarks BEGIN
+                        INSERT INTO bookmarks_fts (bookmarks_fts, rowid, title, url, folder)
+                        VALUES ('delete', old.id, old.title, old.url, old.folder);
+                    END;
+                    """
+                )
+                self.has_trigram = True
+            except sqlite3.OperationalError as e:
+                logging.debug("Bookmarks: FTS5 trigram tokenizer unavailable, using table scans: %s", e)
+
+    def sources(self) -> dict[str, tuple[str, str]]:
+        """Return ``{path: (signature, fingerprint)}`` for every ingested source."""
+        rows = self._connect().execute("SELECT path, signature, fingerprint FROM sources").fetchall()
+        return {path: (signature, fingerprint) for path, signature, fingerprint in rows}
+
+    def set_signature(self, path: str, signature: str):
+        with self._connect() as conn:
+            conn.execute("UPDATE sources SET signature = ? WHERE path = ?", (signature, path))
+
+    def replace_source(self, path: str, browser: str, signature: str, fingerprint: str, bookmarks: list[dict]):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM bookmarks WHERE source = ?", (path,))
+            conn.executemany(
+                "INSERT INTO bookmarks (source, browser, title, url, folder, visits) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (path, browser, bm["title"] or "", bm["url"] or "", bm["folder"] or "", bm.get("visits", 0))
+                    for bm in bookmarks
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO sources (path, browser, signature, fingerprint) VALUES (?, ?, ?, ?)",
+                (path, browser, signature, fingerprint),
+            )
+
+    def remove_source(self, path: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM bookmarks WHERE source = ?", (path,))
+            conn.execute("DELETE FROM sources WHERE path = ?", (path,))
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM bookmarks").fetchone()[0]
+
+    def top(self, limit: int) -> list[dict]:
+        rows = self._connect().execute(
+            "SELECT id, title, url, folder, browser, visits FROM bookmarks ORDER BY visits DESC, id LIMIT ?", (limit,)
+        )
+        return [self._row(r) for r in rows]
+
+    def search(self, query: str, limit: int) -> list[dict]:
+        """Return bookmarks whose title, URL or folder contains *query*.
+
+        Ranked by where the match is (title before URL before folder,
+        earlier positions first), then by visit count.
+        """
+        ql = query.lower()
+        if self.has_trigram and len(ql) >= 3:
+            # Title hits first, so a common term matching many URLs cannot
+            # crowd them out of the candidate window.
+            phrase = '"' + ql.replace('"', '""') + '"'
+            rows = self._select("bookmarks_fts MATCH ?", ("{title} : " + phrase,))
+            if len(rows) < limit:
+                # URL and folder hits are often broad (".com", a big folder);
+                # skip ordering them by visits to keep the query cheap.
+                rows += self._select("bookmarks_fts MATCH ?", ("{url folder} : " + phrase,), by_visits=False)
+        else:
+            # LIKE is case-insensitive in SQLite; stray % and _ are filtered by the ranking below.
+            pattern = f"%{ql}%"
+            rows = self._select(
+                "b.title LIKE ? OR b.url LIKE ? OR b.folder LIKE ?", (pattern, pattern, pattern), by_visits=False
+            )
+
+        ranked: dict[int, tuple[int, int, int, dict]] = {}
+        for bm in rows:
+            for field_rank, field in enumerate(("title", "url", "folder")):
+                pos = bm[field].lower().find(ql)
+                if pos != -1:
+                    ranked.setdefault(bm["id"], (field_rank, pos, -bm["visits"], bm))
+                    break
+        return [bm for *_, bm in sorted(ranked.values(), key=lambda r: r[:3])[:limit]]
+
+    def _select(self, where: str, params: tuple, by_visits: bool = True) -> list[dict]:
+        if self.has_trigram and "MATCH" in where:
+            source = "bookmarks_fts JOIN bookmarks b ON b.id = bookmarks_fts.rowid"
+        else:
+            source = "bookmarks b"
+        order = " ORDER BY b.visits DESC" if by_visits else ""
+        sql = f"SELECT b.id, b.title, b.url, b.folder, b.browser, b.visits FROM {source} WHERE {where}{order} LIMIT ?"
+        try:
+            return [self._row(r) for r in self._connect().execute(sql, (*params, _CANDIDATE_LIMIT))]
+        except sqlite3.Error as e:
+            logging.debug("Bookmarks: query error: %s", e)
+            return []
+
+    @staticmethod
+    def _row(row: tuple) -> dict:
+        bm_id, title, url, folder, browser, visits = row
+        return {"id": bm_id, "title": title, "url": url, "folder": folder, "browser": browser, "visits": visits}
+
+
 class BookmarksProvider(BaseProvider):
     """Search and open browser bookmarks."""
 
@@ -32,12 +189,11 @@ class BookmarksProvider(BaseProvider):
     display_name = "Browser Bookmarks"
     input_placeholder = "Search bookmarks..."
     icon = ICON_BOOKMARK
+    cache_ttl = 30.0
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
-        self._bookmarks: list[dict] = []
-        self._last_mtime: dict[str, float] = {}
-        self._loaded = False
+        self._store: _BookmarkStore | None = None
 
     def _get_sources(self) -> list[tuple[str, str]]:
         """Return [(browser_name, filepath), ...] for bookmark files."""
@@ -86,50 +242,67 @@ class BookmarksProvider(BaseProvider):
                     sources.append((browser_name, db))
         return sources
 
-    def _needs_reload(self, sources: list[tuple[str, str]]) -> bool:
-        if not self._loaded:
-            return True
-        for _, fpath in sources:
+    @property
+    def store(self) -> _BookmarkStore:
+        if self._store is None:
+            self._store = _BookmarkStore(str(app_data_path("quick_launch_bookmarks.db")))
+        return self._store
+
+    @staticmethod
+    def _signature(browser_name: str, fpath: str) -> str:
+        """Cheap stat signature; Firefox also writes through its -wal file."""
+        parts = []
+        paths = (fpath, fpath + "-wal") if browser_name in _FIREFOX_PATHS else (fpath,)
+        for path in paths:
             try:
-                if os.path.getmtime(fpath) != self._last_mtime.get(fpath):
-                    return True
+                st = os.stat(path)
+                parts.append(f"{st.st_mtime_ns}:{st.st_size}")
             except OSError:
-                pass
-        return False
+                parts.append("-")
+        return "|".join(parts)
 
     def _load_bookmarks(self) -> None:
+        """Bring the store up to date, re-ingesting only sources whose content changed."""
+        store = self.store
         sources = self._get_sources()
-        if not self._needs_reload(sources):
-            return
+        known = store.sources()
+        for stale in set(known) - {fpath for _, fpath in sources}:
+            store.remove_source(stale)
 
-        bookmarks: list[dict] = []
         for browser_name, fpath in sources:
+            signature = self._signature(browser_name, fpath)
+            previous = known.get(fpath)
+            if previous and previous[0] == signature:
+                continue
             try:
                 if browser_name in _FIREFOX_PATHS:
-                    parsed = self._parse_firefox(fpath)
+                    with self._open_firefox(fpath) as conn:
+                        fingerprint = self._firefox_fingerprint(conn)
+                        if previous and previous[1] == fingerprint:
+                            store.set_signature(fpath, signature)
+                            continue
+                        parsed = self._parse_firefox(conn)
                 else:
-                    parsed = self._parse_chromium(fpath)
-                for bm in parsed:
-                    bm["browser"] = browser_name
-                bookmarks.extend(parsed)
-                self._last_mtime[fpath] = os.path.getmtime(fpath)
-            except OSError:
-                pass
-
-        self._bookmarks = bookmarks
-        self._loaded = True
+                    with open(fpath, "rb") as fh:
+                        raw = fh.read()
+                    fingerprint = hashlib.md5(raw).hexdigest()
+                    if previous and previous[1] == fingerprint:
+                        store.set_signature(fpath, signature)
+                        continue
+                    parsed = self._parse_chromium(raw)
+            except Exception as e:
+                # Keep the previous snapshot of a source that is mid-write or unreadable.
+                logging.debug("Bookmarks: failed to read %s: %s", fpath, e)
+                continue
+            store.replace_source(fpath, browser_name, signature, fingerprint, parsed)
 
-    def _parse_chromium(self, filepath: str) -> list[dict]:
+    def _parse_chromium(self, raw: bytes) -> list[dict]:
         results: list[dict] = []
-        try:
-            with open(filepath, encoding="utf-8") as fh:
-                data = json.load(fh)
-            for root_name in ("bookmark_bar", "other", "synced"):
-                node = data.get("roots", {}).get(root_name)
-                if node:
-                    self._walk_node(node, results, "")
-        except Exception as e:
-            logging.debug("Bookmarks: chromium parse error: %s", e)
+        data = json.loads(raw)
+        for root_name in ("bookmark_bar", "other", "synced"):
+            node = data.get("roots", {}).get(root_name)
+            if node:
+                self._walk_node(node, results, "")
         return results
 
     def _walk_node(self, node: dict, out: list[dict], folder: str) -> None:
@@ -148,40 +321,49 @@ class BookmarksProvider(BaseProvider):
             for child in node.get("children", []):
                 self._walk_node(child, out, sub)
 
-    def _parse_firefox(self, db_path: str) -> list[dict]:
-        results: list[dict] = []
-        tmp: str | None = None
-        try:
-            fd, tmp = tempfile.mkstemp(suffix=".sqlite", prefix="yasb_ff_bm_")
-            os.close(fd)
-            shutil.copy2(db_path, tmp)
-            conn = sqlite3.connect(f"file:{tmp}?mode=ro", uri=True)
+    @staticmethod
+    @contextmanager
+    def _open_firefox(db_path: str) -> Iterator[sqlite3.Connection]:
+        # Firefox keeps places.sqlite locked while running, and its latest changes
+        # sit in the -wal file until a checkpoint. Both are copied and the copy is
+        # opened normally, so SQLite applies the WAL to what is read.
+        with tempfile.TemporaryDirectory(prefix="yasb_places_") as tmp:
+            copy = os.path.join(tmp, "places.sqlite")
+            shutil.copyfile(db_path, copy)
+            if os.path.exists(db_path + "-wal"):
+                shutil.copyfile(db_path + "-wal", copy + "-wal")
+            conn = sqlite3.connect(copy)
             try:
-                rows = conn.execute(
-                    "SELECT b.title, p.url "
-                    "FROM moz_bookmarks b JOIN moz_places p ON b.fk = p.id "
-                    "WHERE b.type = 1 AND p.url NOT LIKE 'place:%'"
-                ).fetchall()
+                yield conn
             finally:
                 conn.close()
-            for title, url in rows:
-                results.append({"title": title or url, "url": url, "folder": ""})
-        except Exception as e:
-            logging.debug("Bookmarks: firefox parse error: %s", e)
-        finally:
-            if tmp:
-                for suffix in ("", "-shm", "-wal"):
-                    try:
-                        os.remove(tmp + suffix)
-                    except OSError:
-                        pass
-        return results
+
+    @staticmethod
+    def _firefox_fingerprint(conn: sqlite3.Connection) -> str:
+        row = conn.execute(
+            "SELECT COUNT(*), MAX(b.lastModified), SUM(p.visit_count) "
+            "FROM moz_bookmarks b JOIN moz_places p ON b.fk = p.id WHERE b.type = 1"
+        ).fetchone()
+        return ":".join(str(v) for v in row)
+
+    @staticmethod
+    def _parse_firefox(conn: sqlite3.Connection) -> list[dict]:
+        rows = conn.execute(
+            "SELECT b.title, p.url, f.title, p.visit_count "
+            "FROM moz_bookmarks b JOIN moz_places p ON b.fk = p.id "
+            "LEFT JOIN moz_bookmarks f ON b.parent = f.id "
+            "WHERE b.type = 1 AND p.url NOT LIKE 'place:%'"
+        ).fetchall()
+        return [
+            {"title": title or url, "url": url, "folder": folder or "", "visits": visits or 0}
+            for title, url, folder, visits in rows
+        ]
 
     def get_results(self, text: str, **kwargs) -> list[ProviderResult]:
         query = self.get_query_text(text)
         self._load_bookmarks()
 
-        if not self._bookmarks:
+        if not self.store.count():
             return [
                 ProviderResult(
                     title="No bookmarks found",
@@ -192,16 +374,9 @@ class BookmarksProvider(BaseProvider):
             ]
 
         if not query:
-            return [self._to_result(bm) for bm in self._bookmarks[:50]]
+            return [self._to_result(bm) for bm in self.store.top(50)]
 
-        ql = query.lower()
-        matches = [
-            bm
-            for bm in self._bookmarks
-            if ql in (bm.get("title") or "").lower()
-            or ql in (bm.get("url") or "").lower()
-            or ql in (bm.get("folder") or "").lower()
-        ]
+        matches = self.store.search(query, self.max_results)
 
         if not matches:
             return [
@@ -65,6 +65,7 @@ class CurrencyProvider(BaseProvider):
     display_name = "Currency Converter"
     input_placeholder = "Convert currency, e.g. 100 usd eur..."
     icon = ICON_CURRENCY
+    cache_ttl = 60.0
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
@@ -2,6 +2,7 @@ import json
 import logging
 import os
 import sys
+import threading
 
 from PyQt6.QtWidgets import QApplication
 
@@ -15,6 +16,8 @@ from core.utils.widgets.quick_launch.base_provider import (
 from core.utils.widgets.quick_launch.providers.resources.icons import ICON_EMOJI
 
 _EMOJI_DATA: list[dict] | None = None
+_EMOJI_INDEX: _EmojiIndex | None = None
+_INDEX_LOCK = threading.Lock()
 from settings import IS_FROZEN
 
 if IS_FROZEN:
@@ -24,6 +27,9 @@ else:
 
 _PINNED_FILE = str(app_data_path("quick_launch_emoji_pins.json"))
 
+# Longest n-gram kept in the inverted index; longer queries intersect their n-grams.
+_GRAM_SIZE = 3
+
 
 def _load_emoji_data() -> list[dict]:
     """Load emoji data from the bundled JSON file."""
@@ -39,6 +45,111 @@ def _load_emoji_data() -> list[dict]:
     return _EMOJI_DATA
 
 
+def _get_emoji_index() -> _EmojiIndex:
+    """Return the shared emoji index, building it on first use."""
+    global _EMOJI_INDEX
+    if _EMOJI_INDEX is None:
+        with _INDEX_LOCK:
+            if _EMOJI_INDEX is None:
+                _EMOJI_INDEX = _EmojiIndex(_load_emoji_data())
+    return _EMOJI_INDEX
+
+
+class _EmojiIndex:
+    """N-gram inverted index over emoji names, aliases and tags.
+
+    Every 1 to 3 character substring of every term maps to the ids of the
+    emojis containing it, so a query only touches emojis holding all of
+    its n-grams. Candidates are verified and ranked: exact name, name
+    prefix, name word prefix, exact alias or tag, alias or tag prefix, then
+    substring, keeping file order within a rank.
+
+    Queries shorter than the n-gram size match most of the set, where ranking
+    every candidate costs more than it saves; with a limit they are answered
+    by scanning in file order until that many emojis matched.
+    """
+
+    def __init__(self, emojis: list[dict]):
+        self.entries: list[tuple[str, str, str]] = []
+        self._names: list[str] = []
+        self._terms: list[tuple[str, ...]] = []
+        # All terms of an emoji in one string, for a cheap substring test while scanning
+        self._haystacks: list[str] = []
+        self._postings: dict[str, set[int]] = {}
+        for i, entry in enumerate(emojis):
+            name = entry.get("name", "")
+            self.entries.append((entry.get("emoji", ""), name, entry.get("group", "")))
+            self._names.append(name.lower())
+            terms = (
+                name.lower(),
+                *(a.lower() for a in entry.get("aliases", [])),
+                *(t.lower() for t in entry.get("tags", [])),
+            )
+            self._terms.append(terms)
+            self._haystacks.append("\n".join(terms))
+            for term in terms:
+                for n in range(1, _GRAM_SIZE + 1):
+                    for j in range(len(term) - n + 1):
+                        self._postings.setdefault(term[j : j + n], set()).add(i)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, query: str, limit: int | None = None) -> list[int]:
+        """Return ids of the emojis matching the lowercased *query*, best first.
+
+        With *limit*, at least that many are returned if there are as many matches.
+        """
+        if not query:
+            return []
+        if limit is not None and len(query) < _GRAM_SIZE:
+            return self._scan(query, limit)
+        n = min(len(query), _GRAM_SIZE)
+        postings = []
+        for gram in {query[j : j + n] for j in range(len(query) - n + 1)}:
+            ids = self._postings.get(gram)
+            if not ids:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+
+        ranked: list[tuple[int, int]] = []
+        for i in candidates:
+            rank = self._rank(query, self._names[i], self._terms[i])
+            if rank is not None:
+                ranked.append((rank, i))
+        ranked.sort()
+        return [i for _, i in ranked]
+
+    def _scan(self, query: str, limit: int) -> list[int]:
+        """Rank the first *limit* matches in file order."""
+        ranked: list[tuple[int, int]] = []
+        for i, haystack in enumerate(self._haystacks):
+            if query in haystack:
+                ranked.append((self._rank(query, self._names[i], self._terms[i]), i))
+                if len(ranked) >= limit:
+                    break
+        ranked.sort()
+        return [i for _, i in ranked]
+
+    @staticmethod
+    def _rank(query: str, name: str, terms: tuple[str, ...]) -> int | None:
+        if name == query:
+            return 0
+        if name.startswith(query):
+            return 1
+        if any(word.startswith(query) for word in name.split()):
+            return 2
+        if query in terms:
+            return 3
+        if any(term.startswith(query) for term in terms):
+            return 4
+        if any(query in term for term in terms):
+            return 5
+        return None
+
+
 class EmojiProvider(BaseProvider):
     """Search and copy emojis to clipboard."""
 
@@ -46,6 +157,8 @@ class EmojiProvider(BaseProvider):
     display_name = "Emoji Search"
     input_placeholder = "Search emojis..."
     icon = ICON_EMOJI
+    cache_ttl = 600.0
+    clear_cache_on_deactivate = False
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
@@ -122,8 +235,8 @@ class EmojiProvider(BaseProvider):
             )
             return results
 
-        emojis = _load_emoji_data()
-        if not emojis:
+        index = _get_emoji_index()
+        if not len(index):
             return [
                 ProviderResult(
                     title="Emoji data not available",
@@ -136,43 +249,26 @@ class EmojiProvider(BaseProvider):
         pinned_results: list[ProviderResult] = []
         regular_results: list[ProviderResult] = []
         limit = self.max_results
-        for entry in emojis:
-            if self._matches(query, entry):
-                emoji_char = entry.get("emoji", "")
-                name = entry.get("name", "")
-                group = entry.get("group", "")
-                pinned = self.is_pinned(emoji_char)
-                result = ProviderResult(
-                    title=name,
-                    description=f"{group}{' - pinned' if pinned else ''} - press Enter to copy",
-                    icon_char=emoji_char,
-                    provider=self.name,
-                    action_data={"emoji": emoji_char, "name": name, "pinned": pinned},
-                    css_class="emoji-result",
-                )
-                if pinned:
-                    pinned_results.append(result)
-                else:
-                    regular_results.append(result)
-                    if len(regular_results) >= limit:
-                        break
+        # Pinned matches don't count towards the limit
+        for i in index.search(query, limit + len(self._pinned)):
+            emoji_char, name, group = index.entries[i]
+            pinned = self.is_pinned(emoji_char)
+            result = ProviderResult(
+                title=name,
+                description=f"{group}{' - pinned' if pinned else ''} - press Enter to copy",
+                icon_char=emoji_char,
+                provider=self.name,
+                action_data={"emoji": emoji_char, "name": name, "pinned": pinned},
+                css_class="emoji-result",
+            )
+            if pinned:
+                pinned_results.append(result)
+            else:
+                regular_results.append(result)
+                if len(regular_results) >= limit:
+                    break
         return (pinned_results + regular_results)[:limit]
 
-    @staticmethod
-    def _matches(query: str, entry: dict) -> bool:
-        name = entry.get("name", "").lower()
-        aliases = entry.get("aliases", [])
-        tags = entry.get("tags", [])
-        if query in name:
-            return True
-        for alias in aliases:
-            if query in alias.lower():
-                return True
-        for tag in tags:
-            if query in tag.lower():
-                return True
-        return False
-
     def execute(self, result: ProviderResult) -> bool:
         emoji = result.action_data.get("emoji", "")
         if emoji:
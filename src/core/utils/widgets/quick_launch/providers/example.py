@@ -12,13 +12,13 @@ How to create your own provider
 3. Implement get_results() and execute().
 4. Register it in three places:
 
-   a) providers/__init__.py - add a wildcard import:
+   a) providers/__init__.py - add the class to _PROVIDER_MODULES:
 
-       from .my_provider import *
+       "MyProvider": "my_provider",
 
-   b) service.py - add the class to PROVIDER_REGISTRY:
+   b) service.py - add the module and class to PROVIDER_REGISTRY:
 
-       "my_provider": MyProvider,
+       "my_provider": "my_provider.MyProvider",
 
    c) core/validation/widgets/yasb/quick_launch.py - add a config model:
 
@@ -52,6 +52,14 @@ What's optional
         display_name       Label shown on the home page shortcut tile.
         icon               Inline SVG string for the home page tile.
         input_placeholder  Placeholder text when the prefix is active.
+        query_timeout      Seconds a non-prefixed provider may take before a
+                           parallel query stops waiting for its results.
+        cache_ttl          Seconds the service may answer a repeated query from
+                           its result cache instead of calling get_results().
+                           0 (default) disables caching. Use it for providers
+                           backed by the network, subprocesses or large scans.
+        clear_cache_on_deactivate
+                           Drop cached results when the popup closes (default True).
 
     After super().__init__() you get:
         self.config        Raw dict from the user's YAML config.
@@ -67,7 +75,10 @@ What's optional
 
     Refresh from outside a query:
         Call self.request_refresh() to re-trigger the current search, for example
-        after loading data in the background.
+        after loading data in the background. This also drops the provider's
+        cached results. Call self.invalidate_cache() instead when state changed
+        but the visible results don't need to refresh right away. Cached results
+        are also dropped after any of the provider's actions run.
 
     Lifecycle hook:
         on_deactivate()   Called when the popup is closed. Override to clear
@@ -14,12 +14,14 @@ from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 
 from core.utils.shell_utils import shell_open
+from core.utils.utilities import app_data_path
 from core.utils.widgets.quick_launch.base_provider import (
     BaseProvider,
     ProviderMenuAction,
     ProviderMenuActionResult,
     ProviderResult,
 )
+from core.utils.widgets.quick_launch.file_index import FileIndex, FileIndexCrawler
 from core.utils.widgets.quick_launch.providers.resources.icons import (
     ICON_ARCHIVE,
     ICON_AUDIO,
@@ -295,6 +297,17 @@ class _EverythingBackend:
             return False
 
 
+def _split_search_dir(query: str) -> tuple[str | None, str]:
+    """Split a drive/path prefix off *query*: "d: foo", "d:\\ foo", "c:\\users\\ bar"."""
+    drive_only = re.match(r"^([a-zA-Z]):[\\/]?\s+(.+)$", query)
+    path_prefix = re.match(r"^([a-zA-Z]:\\(?:[^\\/]+\\)*)\s+(.+)$", query)
+    if path_prefix:
+        return path_prefix.group(1), path_prefix.group(2)
+    if drive_only:
+        return drive_only.group(1) + ":\\", drive_only.group(2)
+    return None, query
+
+
 class _DiskSearchBackend:
     """Backend using Win32 FindFirstFileExW for full-disk search without index."""
 
@@ -420,7 +433,7 @@ class _DiskSearchBackend:
     _DRIVE_CDROM = 5
     _SKIP_DRIVE_TYPES = frozenset({_DRIVE_REMOVABLE, _DRIVE_REMOTE, _DRIVE_CDROM})
 
-    def _get_drives(self) -> list[str]:
+    def get_drives(self) -> list[str]:
         bitmask = ctypes.windll.kernel32.GetLogicalDrives()
         get_type = ctypes.windll.kernel32.GetDriveTypeW
         drives = []
@@ -493,16 +506,7 @@ class _DiskSearchBackend:
     def search(self, query: str, max_results: int = 20, cancel_event=None) -> list[dict]:
         if not self._available:
             return []
-        # Parse drive/path prefix: "d: foo", "d:\ foo", "c:\users\ bar"
-        search_dir = None
-        drive_only = re.match(r"^([a-zA-Z]):[\\/]?\s+(.+)$", query)
-        path_prefix = re.match(r"^([a-zA-Z]:\\(?:[^\\/]+\\)*)\s+(.+)$", query)
-        if path_prefix:
-            search_dir = path_prefix.group(1)
-            query = path_prefix.group(2)
-        elif drive_only:
-            search_dir = drive_only.group(1) + ":\\"
-            query = drive_only.group(2)
+        search_dir, query = _split_search_dir(query)
 
         query_lower = query.lower()
         # Detect glob patterns
@@ -516,7 +520,7 @@ class _DiskSearchBackend:
             if search_dir and os.path.isdir(search_dir):
                 self._recurse(search_dir, match_fn, results, max_results, cancel_event)
             else:
-                for drive in self._get_drives():
+                for drive in self.get_drives():
                     if cancel_event and cancel_event.is_set():
                         break
                     self._recurse(drive, match_fn, results, max_results, cancel_event)
@@ -527,6 +531,66 @@ class _DiskSearchBackend:
         return results
 
 
+class _LocalIndexBackend:
+    """Backend using a persistent local file index kept current by a background crawler.
+
+    The index lives in the YASB data folder, so after the first crawl it
+    answers queries instantly on every start while a background pass
+    catches up with changes made while YASB was not running.
+    """
+
+    def __init__(self, roots: list[str] | None = None):
+        self._roots = roots or []
+        self._index: FileIndex | None = None
+        self._crawler: FileIndexCrawler | None = None
+        self._available: bool | None = None
+
+    @property
+    def available(self) -> bool:
+        if self._available is None:
+            self._available = self._start()
+        return self._available
+
+    @property
+    def is_crawling(self) -> bool:
+        return self._crawler is not None and self._crawler.is_crawling
+
+    def _start(self) -> bool:
+        roots = self._roots or _DiskSearchBackend().get_drives()
+        if not roots:
+            return False
+        try:
+            self._index = FileIndex(str(app_data_path("quick_launch_file_index.db")))
+            self._crawler = FileIndexCrawler(
+                self._index,
+                roots,
+                skip_folder=lambda low: low in _DiskSearchBackend._SKIP_FOLDERS or low.startswith("$"),
+                skip_file=lambda low: low in _DiskSearchBackend._SKIP_FILES,
+            )
+            self._crawler.start()
+            return True
+        except Exception as e:
+            logging.warning("File search: local index unavailable: %s", e)
+            return False
+
+    def shutdown(self):
+        """Stop the crawler and its filesystem watcher."""
+        if self._crawler is not None:
+            self._crawler.stop()
+            self._crawler = None
+        self._available = False
+
+    def search(self, query: str, max_results: int = 20) -> list[dict]:
+        if not self.available:
+            return []
+        search_dir, query = _split_search_dir(query)
+        try:
+            return self._index.search(query, max_results, search_dir=search_dir)
+        except Exception as e:
+            logging.debug("Local index search error: %s", e)
+            return []
+
+
 class _WindowsSearchBackend:
     """Backend using Windows Search indexer via COM (ADODB)."""
 
@@ -621,8 +685,12 @@ class FileSearchProvider(BaseProvider):
         self._everything = _EverythingBackend()
         self._windows_search = _WindowsSearchBackend()
         self._disk_search = _DiskSearchBackend()
+        self._local_index = _LocalIndexBackend((config or {}).get("index_roots") or None)
         self._active_backend = None
 
+    def shutdown(self) -> None:
+        self._local_index.shutdown()
+
     def _get_backend(self):
         if self._active_backend is not None:
             return self._active_backend
@@ -636,6 +704,12 @@ class FileSearchProvider(BaseProvider):
                 self._active_backend = self._windows_search
             else:
                 logging.warning("Index backend requested but not available")
+        elif self._backend_name == "local":
+            if self._local_index.available:
+                self._active_backend = self._local_index
+                logging.info("File search: using local index backend")
+            else:
+                logging.warning("Local index backend not available")
         elif self._backend_name == "disk":
             if self._disk_search.available:
                 self._active_backend = self._disk_search
@@ -649,6 +723,7 @@ class FileSearchProvider(BaseProvider):
             elif self._windows_search.available:
                 self._active_backend = self._windows_search
                 logging.info("File search: using Windows Search backend")
+            # The local index crawls and watches whole drives, so it is only used when asked for.
             elif self._disk_search.available:
                 self._active_backend = self._disk_search
                 logging.info("File search: using disk search backend (fallback)")
@@ -672,6 +747,8 @@ class FileSearchProvider(BaseProvider):
                 if isinstance(backend, _EverythingBackend)
                 else "Windows Search"
                 if isinstance(backend, _WindowsSearchBackend)
+                else ("Local Index (indexing...)" if backend.is_crawling else "Local Index")
+                if isinstance(backend, _LocalIndexBackend)
                 else "Disk Search"
                 if isinstance(backend, _DiskSearchBackend)
                 else "unavailable"
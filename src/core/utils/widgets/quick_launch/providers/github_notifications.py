@@ -81,6 +81,7 @@ class GithubNotificationsProvider(BaseProvider):
     display_name = "GitHub"
     icon = ICON_GITHUB
     input_placeholder = "GitHub Notifications"
+    cache_ttl = 30.0
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
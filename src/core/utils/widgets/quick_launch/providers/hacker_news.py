@@ -84,6 +84,7 @@ class HackerNewsProvider(BaseProvider):
     display_name = "Hacker News"
     icon = ICON_HACKER_NEWS
     input_placeholder = "Search Hacker News..."
+    cache_ttl = 60.0
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
@@ -108,6 +108,7 @@ class IpInfoProvider(BaseProvider):
     display_name = "IP / Network Info"
     icon = ICON_IP_INFO
     input_placeholder = "Pick a tool or type a command..."
+    cache_ttl = 10.0
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
@@ -78,6 +78,7 @@ class KillProcessProvider(BaseProvider):
     display_name = "Process Killer"
     input_placeholder = "Type a process name to kill..."
     icon = ICON_KILL_PROCESS
+    cache_ttl = 3.0
 
     def match(self, text: str) -> bool:
         text = text.strip()
@@ -285,6 +285,7 @@ class PortViewerProvider(BaseProvider):
     display_name = "Port Viewer"
     input_placeholder = "Search open ports..."
     icon = ICON_PORT
+    cache_ttl = 5.0
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
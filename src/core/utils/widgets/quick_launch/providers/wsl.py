@@ -127,6 +127,7 @@ class WslProvider(BaseProvider):
     display_name = "WSL"
     input_placeholder = "Search WSL distributions..."
     icon = ICON_WSL
+    cache_ttl = 10.0
 
     def __init__(self, config: dict | None = None):
         super().__init__(config)
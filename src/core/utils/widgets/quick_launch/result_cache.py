@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from core.utils.widgets.quick_launch.base_provider import ProviderResult
+
+# Rough per-result cost on top of its text, covering the dataclass, dicts and key
+_RESULT_OVERHEAD = 400
+
+
+def normalize_query(text: str) -> str:
+    """Collapse runs of whitespace so ``"kill  chr "`` and ``"kill chr"`` share an entry."""
+    return " ".join(text.split())
+
+
+def _estimate_size(results: list[ProviderResult]) -> int:
+    size = 0
+    for r in results:
+        size += _RESULT_OVERHEAD + len(r.title) + len(r.description) + len(r.icon_path) + len(r.id)
+        for data in (r.action_data, r.preview):
+            for value in data.values():
+                if isinstance(value, str):
+                    size += len(value)
+    return size
+
+
+class ResultCache:
+    """Thread-safe LRU cache of provider results keyed by provider name and query.
+
+    Every entry expires after the TTL given when it was stored, and the least
+    recently used entries are evicted once the estimated size of all cached
+    results exceeds ``max_bytes``.
+
+    Each provider has a generation number that changes on invalidation.
+    Callers read it before running a provider and pass it back to ``put``,
+    so results computed from state that was invalidated mid-query are dropped.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], tuple[float, int, list[ProviderResult]]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._cleared = 0
+        self._counter = 0
+        self._size = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Estimated size of all cached results in bytes."""
+        return self._size
+
+    def generation(self, provider: str) -> int:
+        with self._lock:
+            return self._generation(provider)
+
+    def _generation(self, provider: str) -> int:
+        return max(self._generations.get(provider, 0), self._cleared)
+
+    def get(self, provider: str, query: str) -> list[ProviderResult] | None:
+        key = (provider, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, size, results = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self._size -= size
+                return None
+            self._entries.move_to_end(key)
+            return list(results)
+
+    def put(self, provider: str, query: str, results: list[ProviderResult], ttl: float, generation: int) -> None:
+        size = _estimate_size(results)
+        if ttl <= 0 or size > self._max_bytes:
+            return
+        key = (provider, query)
+        with self._lock:
+            if self._generation(provider) != generation:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (time.monotonic() + ttl, size, list(results))
+            self._size += size
+            while self._size > self._max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def invalidate(self, provider: str) -> None:
+        """Drop every entry of *provider* and reject results still being computed for it."""
+        with self._lock:
+            self._counter += 1
+            self._generations[provider] = self._counter
+            for key in [k for k in self._entries if k[0] == provider]:
+                self._size -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counter += 1
+            self._cleared = self._counter
+            self._entries.clear()
+            self._size = 0
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from threading import Lock
+
+from core.utils.widgets.quick_launch.fuzzy import _get_initials, _split_camel, score_prepared
+
+
+@dataclass(slots=True, frozen=True)
+class IndexedApp:
+    """Normalized, query-independent search data for a single app."""
+
+    name: str
+    path: str
+    lower: str
+    initials: str
+    words: tuple[str, ...]
+    pkg_lower: str = ""
+    pkg_initials: str = ""
+    pkg_words: tuple[str, ...] = ()
+
+
+def _uwp_package_words(path: str) -> str:
+    """Return the human-readable package name of a UWP app id.
+
+    Microsoft.WindowsTerminal_8wekyb3d8bbwe!App -> Windows Terminal
+    """
+    appid = path[5:].split("!")[0].split("_")[0]
+    pkg_name = appid.rsplit(".", 1)[-1] if "." in appid else appid
+    return _split_camel(pkg_name)
+
+
+def _index_app(name: str, path: str) -> IndexedApp:
+    lower = name.lower()
+    pkg_lower = pkg_initials = ""
+    pkg_words: tuple[str, ...] = ()
+    if path.startswith("UWP::"):
+        pkg = _uwp_package_words(path)
+        pkg_lower = pkg.lower()
+        pkg_initials = _get_initials(pkg)
+        pkg_words = tuple(pkg_lower.split())
+    return IndexedApp(
+        name=name,
+        path=path,
+        lower=lower,
+        initials=_get_initials(name),
+        words=tuple(lower.split()),
+        pkg_lower=pkg_lower,
+        pkg_initials=pkg_initials,
+        pkg_words=pkg_words,
+    )
+
+
+class AppSearchIndex:
+    """Precomputed in-memory search index over the Quick Launch app list.
+
+    Built once per app list. Every app is normalized up front (lowercase
+    name, initials, split words and the CamelCase-split UWP package name),
+    and a character -> app map narrows each query to the apps that contain
+    every query character, which is a superset of every fuzzy tier
+    including subsequence matches.
+
+    When a query extends the previous one, only the apps that matched the
+    previous query are re-scored, since a longer query can never match an
+    app the shorter one rejected.
+    """
+
+    def __init__(self, apps: list[tuple[str, str, object]] | None = None):
+        self._entries: list[IndexedApp] = [_index_app(name, path) for name, path, _ in apps or ()]
+        self._char_map: dict[str, set[int]] = {}
+        for i, entry in enumerate(self._entries):
+            for ch in set(entry.lower) | set(entry.pkg_lower):
+                self._char_map.setdefault(ch, set()).add(i)
+        self._lock = Lock()
+        self._last_query = ""
+        self._last_matches: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, query: str) -> list[tuple[float, str, str]]:
+        """Return ``(tier, name, path)`` for every app matching the lowercased *query*.
+
+        Results keep the app list order; callers sort by tier. Package-name
+        matches of UWP apps are capped at 3.5, between word prefix and prefix.
+        """
+        if not query:
+            return []
+        with self._lock:
+            if self._last_query and query.startswith(self._last_query):
+                candidates = self._last_matches
+            else:
+                candidates = self._candidates(query)
+
+            scored: list[tuple[float, str, str]] = []
+            matches: list[int] = []
+            entries = self._entries
+            for i in candidates:
+                entry = entries[i]
+                fs: float | None = score_prepared(query, entry.lower, entry.initials, entry.words)
+                if fs is None and entry.pkg_lower:
+                    pkg_fs = score_prepared(query, entry.pkg_lower, entry.pkg_initials, entry.pkg_words)
+                    if pkg_fs is not None:
+                        fs = min(pkg_fs, 3.5)
+                if fs is not None:
+                    matches.append(i)
+                    scored.append((float(fs), entry.name, entry.path))
+
+            self._last_query = query
+            self._last_matches = matches
+            return scored
+
+    def _candidates(self, query: str) -> list[int]:
+        postings = []
+        for ch in set(query):
+            ids = self._char_map.get(ch)
+            if not ids:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
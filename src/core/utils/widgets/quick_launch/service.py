@@ -1,3 +1,4 @@
+import importlib
 import logging
 import os
 import tempfile
@@ -5,75 +6,65 @@ import tempfile
 from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 
+from core.utils.utilities import app_data_path
 from core.utils.widgets.quick_launch.base_provider import BaseProvider
-from core.utils.widgets.quick_launch.icon_resolver import IconResolverWorker, compute_extraction_size
-from core.utils.widgets.quick_launch.providers import (
-    AppsProvider,
-    BinanceProvider,
-    BookmarksProvider,
-    CalculatorProvider,
-    ClipboardHistoryProvider,
-    ColorProvider,
-    CurrencyProvider,
-    DevToolsProvider,
-    EmojiProvider,
-    FileSearchProvider,
-    GithubNotificationsProvider,
-    HackerNewsProvider,
-    IpInfoProvider,
-    KillProcessProvider,
-    PortViewerProvider,
-    SettingsProvider,
-    SnippetsProvider,
-    SshProvider,
-    SystemCommandsProvider,
-    UnitConverterProvider,
-    VSCodeProvider,
-    WebSearchProvider,
-    WindowsTerminalProvider,
-    WindowSwitcherProvider,
-    WorldClockProvider,
-    WslProvider,
+from core.utils.widgets.quick_launch.icon_cache import IconCache
+from core.utils.widgets.quick_launch.icon_resolver import (
+    IconResolverWorker,
+    compute_extraction_size,
+    extract_app_icon,
 )
+from core.utils.widgets.quick_launch.result_cache import ResultCache
+from core.utils.widgets.quick_launch.search_index import AppSearchIndex
 from core.utils.widgets.quick_launch.workers import QueryWorker, StartMenuWatcherThread
-from core.utils.win32.app_loader import AppListLoader
-
-PROVIDER_REGISTRY: dict[str, type[BaseProvider]] = {
-    "apps": AppsProvider,
-    "bookmarks": BookmarksProvider,
-    "calculator": CalculatorProvider,
-    "clipboard_history": ClipboardHistoryProvider,
-    "color": ColorProvider,
-    "binance": BinanceProvider,
-    "currency": CurrencyProvider,
-    "dev_tools": DevToolsProvider,
-    "emoji": EmojiProvider,
-    "file_search": FileSearchProvider,
-    "hacker_news": HackerNewsProvider,
-    "ip_info": IpInfoProvider,
-    "kill_process": KillProcessProvider,
-    "port_viewer": PortViewerProvider,
-    "settings": SettingsProvider,
-    "snippets": SnippetsProvider,
-    "ssh": SshProvider,
-    "system_commands": SystemCommandsProvider,
-    "unit_converter": UnitConverterProvider,
-    "web_search": WebSearchProvider,
-    "window_switcher": WindowSwitcherProvider,
-    "windows_terminal": WindowsTerminalProvider,
-    "world_clock": WorldClockProvider,
-    "vscode": VSCodeProvider,
-    "github_notifications": GithubNotificationsProvider,
-    "wsl": WslProvider,
+from core.utils.win32.app_loader import AppCatalogDelta, AppListLoader
+
+# Provider classes by config key, as "module.Class" within the providers package.
+# Modules are imported when a provider is first enabled, so disabled providers
+# never load their dependencies.
+PROVIDER_REGISTRY: dict[str, str] = {
+    "apps": "apps.AppsProvider",
+    "bookmarks": "bookmarks.BookmarksProvider",
+    "calculator": "calculator.CalculatorProvider",
+    "clipboard_history": "clipboard_history.ClipboardHistoryProvider",
+    "color": "color.ColorProvider",
+    "binance": "binance.BinanceProvider",
+    "currency": "currency.CurrencyProvider",
+    "dev_tools": "dev_tools.DevToolsProvider",
+    "emoji": "emoji.EmojiProvider",
+    "file_search": "file_search.FileSearchProvider",
+    "hacker_news": "hacker_news.HackerNewsProvider",
+    "ip_info": "ip_info.IpInfoProvider",
+    "kill_process": "kill_process.KillProcessProvider",
+    "port_viewer": "port_viewer.PortViewerProvider",
+    "settings": "settings.SettingsProvider",
+    "snippets": "snippets.SnippetsProvider",
+    "ssh": "ssh.SshProvider",
+    "system_commands": "system_commands.SystemCommandsProvider",
+    "unit_converter": "unit_converter.UnitConverterProvider",
+    "web_search": "web_search.WebSearchProvider",
+    "window_switcher": "window_switcher.WindowSwitcherProvider",
+    "windows_terminal": "windows_terminal.WindowsTerminalProvider",
+    "world_clock": "world_clock.WorldClockProvider",
+    "vscode": "vscode.VSCodeProvider",
+    "github_notifications": "github_notifications.GithubNotificationsProvider",
+    "wsl": "wsl.WslProvider",
 }
 
 
+def load_provider(name: str) -> type[BaseProvider]:
+    """Import and return the provider class registered under *name*."""
+    module_name, class_name = PROVIDER_REGISTRY[name].rsplit(".", 1)
+    module = importlib.import_module(f"core.utils.widgets.quick_launch.providers.{module_name}")
+    return getattr(module, class_name)
+
+
 class QuickLaunchService(QObject):
     """Quick Launch service."""
 
     request_refresh = pyqtSignal()
     icon_ready = pyqtSignal(str, str)
-    query_finished = pyqtSignal(str, list)
+    query_finished = pyqtSignal(str, list, bool)
 
     _instance: QuickLaunchService | None = None
 
@@ -88,6 +79,7 @@ class QuickLaunchService(QObject):
 
         self._apps: list[tuple[str, str, object]] = []
         self._apps_loaded = False
+        self._app_index = AppSearchIndex()
         self._icon_paths: dict[str, str] = {}
         self._providers: list[BaseProvider] = []
         self._providers_config: dict = {}
@@ -95,7 +87,9 @@ class QuickLaunchService(QObject):
 
         self._app_loader: AppListLoader | None = None
         self._icon_worker: IconResolverWorker | None = None
-        self._query_worker = QueryWorker()
+        self._icon_cache: IconCache | None = None
+        self._result_cache = ResultCache()
+        self._query_worker = QueryWorker(self._result_cache)
         self._query_worker.finished.connect(self._on_query_finished)
         self._query_worker.start()
         self._query_counter = 0
@@ -111,6 +105,14 @@ class QuickLaunchService(QObject):
     def apps(self) -> list[tuple[str, str, object]]:
         return self._apps
 
+    @property
+    def app_index(self) -> AppSearchIndex:
+        return self._app_index
+
+    @property
+    def result_cache(self) -> ResultCache:
+        return self._result_cache
+
     @property
     def apps_loaded(self) -> bool:
         return self._apps_loaded
@@ -120,24 +122,37 @@ class QuickLaunchService(QObject):
         return self._icon_paths
 
     def configure_providers(
-        self, providers_config: dict, max_results: int = 50, show_icons: bool = True, icon_size: int = 32
+        self,
+        providers_config: dict,
+        max_results: int = 50,
+        show_icons: bool = True,
+        icon_size: int = 32,
+        parallel_providers: bool = True,
     ):
         self._icon_size = icon_size
+        self._query_worker.parallel = parallel_providers
         if self._providers and self._providers_config == providers_config:
             return
         self._providers_config = providers_config
         self._show_icons = show_icons
+        for provider in self._providers:
+            try:
+                provider.shutdown()
+            except Exception:
+                logging.exception("Quick Launch provider %s failed to shut down", provider.name)
         self._providers.clear()
+        self._result_cache.clear()
         apps_enabled = False
-        for name, cls in PROVIDER_REGISTRY.items():
+        for name in PROVIDER_REGISTRY:
             provider_cfg = providers_config.get(name, {})
             if not provider_cfg.get("enabled", True):
                 continue
             if name == "apps":
                 apps_enabled = True
             provider_cfg["_max_results"] = max_results
-            provider = cls(config=provider_cfg)
-            provider.request_refresh = self.request_refresh.emit
+            provider = load_provider(name)(config=provider_cfg)
+            provider.request_refresh = self._refresh_callback(provider.name)
+            provider.invalidate_cache = self._invalidate_callback(provider.name)
             self._providers.append(provider)
         self._providers.sort(key=lambda p: p.priority)
 
@@ -146,6 +161,32 @@ class QuickLaunchService(QObject):
                 self._setup_fs_watcher()
                 self._start_app_loading()
 
+    def _invalidate_callback(self, provider_name: str):
+        return lambda: self._result_cache.invalidate(provider_name)
+
+    def _refresh_callback(self, provider_name: str):
+        # A provider asks for a refresh when background work changed its results,
+        # so whatever it answered before is stale.
+        def refresh():
+            self._result_cache.invalidate(provider_name)
+            self.request_refresh.emit()
+
+        return refresh
+
+    def invalidate_results(self, provider_name: str):
+        """Drop cached results of a provider, e.g. after one of its actions changed its state."""
+        self._result_cache.invalidate(provider_name)
+
+    def deactivate_providers(self):
+        """Notify providers that the popup closed and drop the cached results of those that ask for it."""
+        for provider in self._providers:
+            if provider.clear_cache_on_deactivate:
+                self._result_cache.invalidate(provider.name)
+            try:
+                provider.on_deactivate()
+            except Exception:
+                pass
+
     def async_query(self, text: str, max_results: int = 50) -> str:
         """Submit an async query. Returns a query_id to match results."""
         self._query_counter += 1
@@ -153,48 +194,80 @@ class QuickLaunchService(QObject):
         self._query_worker.submit(query_id, text, max_results, list(self._providers))
         return query_id
 
-    def _on_query_finished(self, query_id: str, results: list):
-        self.query_finished.emit(query_id, results)
+    def _on_query_finished(self, query_id: str, results: list, final: bool):
+        self.query_finished.emit(query_id, results, final)
 
-    def _start_app_loading(self):
+    def _start_app_loading(self, known_apps: list | None = None):
         if self._app_loader:
             self._app_loader.apps_loaded.disconnect(self._on_apps_loaded)
-        self._app_loader = AppListLoader()
+            self._app_loader.apps_changed.disconnect(self._on_apps_changed)
+        self._app_loader = AppListLoader(known_apps)
         self._app_loader.apps_loaded.connect(self._on_apps_loaded)
+        self._app_loader.apps_changed.connect(self._on_apps_changed)
         self._app_loader.start()
 
     def _on_apps_loaded(self, apps: list):
+        self._app_index = AppSearchIndex(apps)
         self._apps = apps
         self._apps_loaded = True
+        self._result_cache.invalidate("apps")
         if self._show_icons:
             self._start_icon_resolution()
         self._start_description_resolution()
         self.request_refresh.emit()
 
+    def _on_apps_changed(self, apps: list, delta: AppCatalogDelta):
+        if not self._apps_loaded:
+            self._on_apps_loaded(apps)
+            return
+        logging.info(
+            "Quick Launch app list changed: %d added, %d removed, %d renamed",
+            len(delta.added),
+            len(delta.removed),
+            len(delta.renamed),
+        )
+        self._app_index = AppSearchIndex(apps)
+        self._apps = apps
+        for name, path, _ in delta.removed + tuple(old for old, _ in delta.renamed):
+            self._icon_paths.pop(f"{name}::{path}", None)
+        self._result_cache.invalidate("apps")
+        changed = list(delta.added) + [new for _, new in delta.renamed]
+        if changed:
+            if self._show_icons:
+                self._start_icon_resolution(changed)
+            self._start_description_resolution()
+        self.request_refresh.emit()
+
     def _start_description_resolution(self):
         for provider in self._providers:
-            if isinstance(provider, AppsProvider):
+            if provider.name == "apps":
                 if provider.config.get("show_description", False):
                     provider.start_description_resolution(self._apps)
                 break
 
-    def _start_icon_resolution(self):
+    def _start_icon_resolution(self, apps: list | None = None):
+        """Resolve icons for *apps*, or for the whole app list if None."""
         if self._icon_worker and self._icon_worker.isRunning():
             self._icon_worker.icon_ready.disconnect(self._on_icon_ready)
             self._icon_worker.stop()
             self._icon_worker.wait()
+            # The stopped worker may not have reached every app yet
+            apps = None
 
         dpr = 1.0
         screen = QApplication.primaryScreen()
         if screen:
             dpr = screen.devicePixelRatio()
         size = compute_extraction_size(self._icon_size, dpr)
-        self._icon_worker = IconResolverWorker(self._apps, self._icons_dir, size=size)
+        if self._icon_cache is None:
+            self._icon_cache = IconCache(str(app_data_path("quick_launch_icons")), extract_app_icon, self._icons_dir)
+        self._icon_worker = IconResolverWorker(self._apps if apps is None else apps, self._icon_cache, size=size)
         self._icon_worker.icon_ready.connect(self._on_icon_ready)
         self._icon_worker.start()
 
     def _on_icon_ready(self, app_key: str, icon_path: str):
         self._icon_paths[app_key] = icon_path
+        self._result_cache.invalidate("apps")
         self.icon_ready.emit(app_key, icon_path)
 
     def _setup_fs_watcher(self):
@@ -209,6 +282,5 @@ class QuickLaunchService(QObject):
         self._watcher_thread.start()
 
     def _on_fs_change(self):
-        logging.info("Quick Launch rebuilding app list after install/uninstall detected")
-        AppListLoader.clear_cache()
-        self._start_app_loading()
+        logging.info("Quick Launch revalidating app list after install/uninstall detected")
+        self._start_app_loading(self._apps if self._apps_loaded else None)
@@ -1,11 +1,16 @@
 import logging
 import os
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 from queue import Empty, SimpleQueue
-from threading import Event
+from threading import Event, Lock
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from core.utils.widgets.quick_launch.base_provider import ProviderResult
+from core.utils.widgets.quick_launch.result_cache import ResultCache, normalize_query
 
 
 class StartMenuWatcherThread(QThread):
@@ -33,20 +38,48 @@ class StartMenuWatcherThread(QThread):
 
 
 class QueryWorker(QThread):
-    """Persistent single-thread query executor.
+    """Persistent query executor.
 
     A single thread stays alive for the lifetime of the service.
     New queries are submitted via `submit()` which cancels any
     in-progress work and queues the new query. The thread drains
     the queue to only process the latest query, avoiding wasted work.
+
+    In parallel mode the non-prefixed providers of a query run on a
+    bounded thread pool. Every time a provider completes, the results of
+    all completed providers are emitted in priority order, so fast
+    providers show up without waiting for slow ones. A provider that
+    exceeds its `query_timeout` is dropped from that query. The timeout
+    starts once the provider runs: a provider still busy with a call from
+    an earlier query is waited for rather than left out.
+    The last emission of a query is flagged as final.
+
+    Providers with a `cache_ttl` are served from the shared result cache
+    when the same normalized query was answered recently.
     """
 
-    finished = pyqtSignal(str, list)
+    finished = pyqtSignal(str, list, bool)
+
+    # Upper bound for a single wait, so cancellation is noticed promptly.
+    _POLL_INTERVAL = 0.05
 
-    def __init__(self):
+    def __init__(self, cache: ResultCache | None = None, parallel: bool = True, max_workers: int = 4):
         super().__init__()
+        self._cache = cache
         self._queue: SimpleQueue[tuple[str, str, int, list] | None] = SimpleQueue()
         self._cancel = Event()
+        self._parallel = parallel
+        self._max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._provider_locks: dict[int, Lock] = {}
+
+    @property
+    def parallel(self) -> bool:
+        return self._parallel
+
+    @parallel.setter
+    def parallel(self, value: bool):
+        self._parallel = value
 
     def submit(self, query_id: str, text: str, max_results: int, providers: list):
         self._cancel.set()
@@ -55,6 +88,8 @@ class QueryWorker(QThread):
     def shutdown(self):
         self._cancel.set()
         self._queue.put(None)
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
 
     def run(self):
         while True:
@@ -72,34 +107,120 @@ class QueryWorker(QThread):
                     break
 
             query_id, text, max_results, providers = item
-            self._cancel.clear()
-            self._run_query(query_id, text.lstrip(), max_results, providers)
+            # A fresh event per query, so pool threads still finishing a
+            # cancelled query keep seeing their own cancellation.
+            self._cancel = Event()
+            self._run_query(query_id, text.lstrip(), max_results, providers, self._cancel)
 
-    def _run_query(self, query_id: str, text: str, max_results: int, providers: list):
+    def _run_query(self, query_id: str, text: str, max_results: int, providers: list, cancel: Event):
         all_results: list[ProviderResult] = []
         try:
             # Prefixed providers get exclusive handling (require prefix + space)
             for provider in providers:
-                if self._cancel.is_set():
+                if cancel.is_set():
                     return
                 if provider.prefix and text.startswith(provider.prefix + " "):
-                    results = provider.get_results(text, cancel_event=self._cancel)[:max_results]
-                    if not self._cancel.is_set():
-                        self.finished.emit(query_id, results)
+                    results = self._call_provider(provider, text, cancel)[:max_results]
+                    if not cancel.is_set():
+                        self.finished.emit(query_id, results, True)
                     return
 
             # Non-prefixed providers contribute to combined results
-            for provider in providers:
-                if self._cancel.is_set():
+            active = [p for p in providers if not p.prefix and p.match(text)]
+            if self._parallel and len(active) > 1:
+                self._run_parallel(query_id, text, max_results, active, cancel)
+                return
+
+            for provider in active:
+                if cancel.is_set():
                     return
-                if provider.prefix:
-                    continue
-                if provider.match(text):
-                    all_results.extend(provider.get_results(text, cancel_event=self._cancel))
+                all_results.extend(self._call_provider(provider, text, cancel))
 
-            if not self._cancel.is_set():
-                self.finished.emit(query_id, all_results[:max_results])
+            if not cancel.is_set():
+                self.finished.emit(query_id, all_results[:max_results], True)
         except Exception as e:
             logging.debug("Query worker error: %s", e)
-            if not self._cancel.is_set():
-                self.finished.emit(query_id, [])
+            if not cancel.is_set():
+                self.finished.emit(query_id, [], True)
+
+    def _run_parallel(self, query_id: str, text: str, max_results: int, providers: list, cancel: Event):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="quick_launch_query")
+        # When each provider started; one still waiting for its lock has no deadline yet.
+        started: dict[int, float] = {}
+        slots: dict[Future, int] = {}
+        for i, provider in enumerate(providers):
+            future = self._pool.submit(self._call_provider, provider, text, cancel, partial(_mark_started, started, i))
+            slots[future] = i
+
+        completed: list[list[ProviderResult] | None] = [None] * len(providers)
+        pending = set(slots)
+        while pending:
+            if cancel.is_set():
+                return
+            now = time.monotonic()
+            deadlines = {
+                f: started[slots[f]] + providers[slots[f]].query_timeout for f in pending if slots[f] in started
+            }
+            expired = {f for f, deadline in deadlines.items() if deadline <= now}
+            for future in expired:
+                logging.debug("Quick Launch provider %s timed out", providers[slots[future]].name)
+            pending -= expired
+
+            timeout = min((d for f, d in deadlines.items() if f in pending), default=now + self._POLL_INTERVAL) - now
+            done, pending = wait(pending, timeout=min(timeout, self._POLL_INTERVAL), return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    completed[slots[future]] = future.result()
+                except Exception as e:
+                    logging.debug("Quick Launch provider %s failed: %s", providers[slots[future]].name, e)
+                    completed[slots[future]] = []
+            if (done and pending) and not cancel.is_set():
+                self.finished.emit(query_id, self._merge(completed, max_results), False)
+
+        if not cancel.is_set():
+            self.finished.emit(query_id, self._merge(completed, max_results), True)
+
+    def _call_provider(
+        self, provider, text: str, cancel: Event, on_start: Callable[[], None] | None = None
+    ) -> list[ProviderResult]:
+        # Providers are not re-entrant. A call left over from a cancelled query
+        # (e.g. one that timed out) may still be running; wait for it, checking
+        # for cancellation so the next query frees the waiting thread.
+        lock = self._provider_locks.setdefault(id(provider), Lock())
+        while not lock.acquire(timeout=self._POLL_INTERVAL):
+            if cancel.is_set():
+                return []
+        try:
+            if cancel.is_set():
+                return []
+            if on_start is not None:
+                on_start()
+            cache = self._cache if provider.cache_ttl > 0 else None
+            if cache is None:
+                return provider.get_results(text, cancel_event=cancel)
+            key = normalize_query(text)
+            cached = cache.get(provider.name, key)
+            if cached is not None:
+                return cached
+            generation = cache.generation(provider.name)
+            results = provider.get_results(text, cancel_event=cancel)
+            # Cancelled calls may return partial results, and loading
+            # placeholders are replaced once the provider refreshes.
+            if not cancel.is_set() and not any(r.is_loading for r in results):
+                cache.put(provider.name, key, results, provider.cache_ttl, generation)
+            return results
+        finally:
+            lock.release()
+
+    @staticmethod
+    def _merge(completed: list[list[ProviderResult] | None], max_results: int) -> list[ProviderResult]:
+        merged: list[ProviderResult] = []
+        for results in completed:
+            if results:
+                merged.extend(results)
+        return merged[:max_results]
+
+
+def _mark_started(started: dict[int, float], slot: int) -> None:
+    started[slot] = time.monotonic()
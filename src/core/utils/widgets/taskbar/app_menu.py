@@ -10,18 +10,22 @@ import logging
 import os
 from pathlib import Path
 
-import pythoncom
 import win32gui
 from humanize import naturalsize
 from PyQt6.QtCore import QPoint, Qt
 from PyQt6.QtGui import QCursor
 from PyQt6.QtWidgets import QMenu
-from win32comext.shell import shell, shellcon
 
+from core.utils.lazy_import import lazy_import
 from core.utils.win32.constants import KnownCLSID
 from core.utils.win32.utilities import apply_qmenu_style
 from core.utils.win32.window_actions import close_application
 
+# COM shell bindings are only needed once a context menu is opened
+pythoncom = lazy_import("pythoncom")
+shell = lazy_import("win32comext.shell.shell")
+shellcon = lazy_import("win32comext.shell.shellcon")
+
 # Global reference to keep thread alive
 _empty_bin_thread_ref = None
 
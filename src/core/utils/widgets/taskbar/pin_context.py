@@ -9,14 +9,15 @@ from functools import lru_cache
 from typing import Any
 from urllib.parse import unquote
 
-import win32com.client
-
+from core.utils.lazy_import import lazy_import
 from core.utils.win32.aumid import get_aumid_for_window
 from core.utils.win32.bindings.kernel32 import kernel32
 from core.utils.win32.bindings.ntdll import ProcessCommandLineInformation, ntdll
 from core.utils.win32.constants import PROCESS_QUERY_LIMITED_INFORMATION
 from core.utils.win32.structs import UNICODE_STRING
 
+com_client = lazy_import("win32com.client")
+
 
 @dataclass
 class WindowContext:
@@ -46,7 +47,7 @@ class WindowContext:
 @lru_cache(maxsize=1)
 def _get_shell_application():
     """Get the Shell.Application COM automation object."""
-    return win32com.client.Dispatch("Shell.Application")
+    return com_client.Dispatch("Shell.Application")
 
 
 def collect_window_context(hwnd: int, window_data: dict[str, Any]) -> WindowContext | None:
@@ -89,7 +90,7 @@ def collect_window_context(hwnd: int, window_data: dict[str, Any]) -> WindowCont
         if explorer_path is None and hwnd:
             try:
                 # Try to get the folder CLSID/GUID for special folders via Document interface
-                shell_windows = win32com.client.Dispatch("Shell.Application").Windows()
+                shell_windows = com_client.Dispatch("Shell.Application").Windows()
                 for window in shell_windows:
                     try:
                         if window.HWND == hwnd:
@@ -157,7 +158,7 @@ def _get_process_command_line(pid: int) -> str | None:
 
     # Fallback to WMI if NtQueryInformationProcess fails
     try:
-        wmi = win32com.client.GetObject("winmgmts:")
+        wmi = com_client.GetObject("winmgmts:")
         processes = wmi.ExecQuery(f"SELECT CommandLine FROM Win32_Process WHERE ProcessId = {pid}")
         for process in processes:
             if process.CommandLine:
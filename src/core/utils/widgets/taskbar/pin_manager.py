@@ -18,10 +18,10 @@ from pathlib import Path
 
 import win32gui
 import win32process
-from PIL import Image
 from PyQt6.QtCore import QObject, Qt, pyqtSignal
 from PyQt6.QtGui import QPixmap
 
+from core.utils.lazy_import import lazy_import
 from core.utils.utilities import app_data_path
 from core.utils.widgets.taskbar.pin_context import (
     WindowContext,
@@ -39,6 +39,8 @@ from core.utils.widgets.taskbar.shortcut_resolver import (
 )
 from core.utils.win32.utilities import get_app_name_from_aumid
 
+Image = lazy_import("PIL.Image")
+
 
 class TaskbarSignalBus(QObject):
     """Signal bus for coordinating pinned app changes across multiple taskbar instances."""
@@ -7,15 +7,16 @@ from collections.abc import Iterable
 from functools import lru_cache
 from pathlib import Path
 
-import win32com.client
-
+from core.utils.lazy_import import lazy_import
 from core.utils.win32.aumid import get_aumid_from_shortcut
 
+com_client = lazy_import("win32com.client")
+
 
 @lru_cache(maxsize=1)
 def get_wscript_shell():
     """Get a cached WScript.Shell COM object for reading shortcut metadata."""
-    return win32com.client.Dispatch("WScript.Shell")
+    return com_client.Dispatch("WScript.Shell")
 
 
 @lru_cache(maxsize=1)
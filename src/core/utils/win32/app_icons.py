@@ -8,9 +8,9 @@ import win32con
 import win32gui
 import win32process
 import win32ui
-from PIL import Image
 from win32con import DIB_RGB_COLORS
 
+from core.utils.lazy_import import lazy_import
 from core.utils.win32.aumid import GetApplicationUserModelId, get_aumid_for_window
 from core.utils.win32.aumid_icons import get_icon_for_aumid
 from core.utils.win32.bindings import (
@@ -29,6 +29,8 @@ from core.utils.win32.constants import PROCESS_QUERY_LIMITED_INFORMATION, SHGSI_
 from core.utils.win32.pe_icons import IconExtractor
 from core.utils.win32.structs import BITMAP, BITMAPINFO, BITMAPINFOHEADER, ICONINFO, SHSTOCKICONINFO
 
+Image = lazy_import("PIL.Image")
+
 pil_logger = logging.getLogger("PIL")
 pil_logger.setLevel(logging.INFO)
 
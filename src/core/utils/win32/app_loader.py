@@ -1,19 +1,58 @@
 import ctypes
 import glob
+import hashlib
+import json
+import logging
 import os
 import re
 import subprocess
+import threading
+import time
 import winreg
+from dataclasses import dataclass
 
 from PyQt6.QtCore import (
     QThread,
     pyqtSignal,
 )
 
-_APPS_CACHE = None
+from core.utils.utilities import app_data_path
 
 _CPL_NS_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\ControlPanel\NameSpace"
 
+_SNAPSHOT_FILE = "app_catalog.json"
+_SNAPSHOT_VERSION = 1
+# Sources are rescanned after this long even if their fingerprint is unchanged
+_MAX_SOURCE_AGE = 24 * 3600
+
+# (name, path, description)
+type AppEntry = tuple[str, str, str | None]
+
+# Source name -> {"fingerprint": str or None, "scanned": time, "apps": [[name, path, description], ...]}
+_SOURCES: dict[str, dict] | None = None
+_APPS_CACHE: list[AppEntry] | None = None
+# Guards the two above; held only briefly, never while scanning
+_CATALOG_LOCK = threading.Lock()
+# Serializes revalidation, so concurrent loaders don't scan the same sources twice
+_SCAN_LOCK = threading.Lock()
+
+_FILTER_KEYWORDS = {
+    "readme",
+    "documentation",
+    "license",
+    "setup",
+    "administrative tools",
+}
+
+_STRICT_FILTER_KEYWORDS = {
+    "uninstall",
+    "installer",
+    "help",
+}
+
+# Pre-compile regex for strict keywords
+_STRICT_PATTERN = re.compile(r"\b(" + "|".join(map(re.escape, _STRICT_FILTER_KEYWORDS)) + r")\b")
+
 
 def _load_indirect_string(resource: str) -> str | None:
     """Resolve a @resource.dll,-123 string to its localized value via SHLoadIndirectString."""
@@ -65,143 +104,310 @@ def _enumerate_control_panel_items():
                 continue
 
 
+def _start_menu_dirs() -> list[str]:
+    return [
+        os.path.expandvars(r"%APPDATA%\Microsoft\Windows\Start Menu"),
+        os.path.expandvars(r"%PROGRAMDATA%\Microsoft\Windows\Start Menu"),
+    ]
+
+
+def _should_filter_app(name: str) -> bool:
+    """Check if app name contains any filter keywords"""
+    name_lower = name.lower()
+
+    # Check loose keywords (substring match)
+    if any(keyword in name_lower for keyword in _FILTER_KEYWORDS):
+        return True
+
+    # Check strict keywords (whole word match)
+    if _STRICT_PATTERN.search(name_lower):
+        return True
+
+    return False
+
+
+def _digest(parts) -> str:
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(str(part).encode("utf-8", "surrogatepass") + b"\0")
+    return digest.hexdigest()
+
+
+def _directory_mtimes(root: str):
+    """Yield ``(path, mtime)`` for *root* and every directory below it.
+
+    A directory's mtime changes whenever an entry in it is added, removed or
+    renamed, which covers installs and uninstalls without listing any files.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            yield path, os.stat(path).st_mtime_ns
+            with os.scandir(path) as entries:
+                stack.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+
+
+def _fingerprints() -> dict[str, str | None]:
+    """Cheap change markers for every source, computed without scanning them. None if unavailable."""
+    start_menu = _digest(sorted(item for root in _start_menu_dirs() for item in _directory_mtimes(root)))
+    try:
+        packages = sorted(os.listdir(os.path.expandvars(r"%LOCALAPPDATA%\Packages")))
+    except OSError:
+        packages = []
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _CPL_NS_KEY) as ns:
+            subkeys, _, modified = winreg.QueryInfoKey(ns)
+        # Item names are localized, so a display language change rescans them too
+        control_panel = _digest((subkeys, modified, ctypes.windll.kernel32.GetUserDefaultUILanguage()))
+    except OSError:
+        control_panel = None
+    return {
+        "start_menu": start_menu,
+        # Get-StartApps lists the Start Menu shortcuts as well as the packaged apps
+        "start_apps": _digest((start_menu, *packages)),
+        "control_panel": control_panel,
+    }
+
+
+def _scan_start_menu() -> list[list]:
+    apps = []
+    for dir in _start_menu_dirs():
+        # Also scan .url files (e.g. Steam games)
+        for pattern in ("*.lnk", "*.url"):
+            for path in glob.glob(os.path.join(dir, "**", pattern), recursive=True):
+                name = os.path.splitext(os.path.basename(path))[0]
+                if not _should_filter_app(name):
+                    apps.append([name, path, None])
+    return apps
+
+
+def _scan_start_apps() -> list[list]:
+    ps_script = (
+        "Get-StartApps | ForEach-Object { [PSCustomObject]@{Name=$_.Name;AppID=$_.AppID} } | ConvertTo-Json -Compress"
+    )
+    result = subprocess.run(
+        [
+            "powershell",
+            "-NoProfile",
+            "-NonInteractive",
+            "-NoLogo",
+            "-ExecutionPolicy",
+            "Bypass",
+            "-Command",
+            ps_script,
+        ],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        timeout=10,
+        check=True,
+        creationflags=subprocess.CREATE_NO_WINDOW,
+    )
+    uwp_list = json.loads(result.stdout)
+    if isinstance(uwp_list, dict):
+        uwp_list = [uwp_list]
+    apps = []
+    for entry in uwp_list:
+        name = entry.get("Name")
+        appid = entry.get("AppID")
+        if name and appid and not _should_filter_app(name):
+            apps.append([name, f"UWP::{appid}", None])
+    return apps
+
+
+def _scan_control_panel() -> list[list]:
+    # Control Panel items from registry (Device Manager, Programs and Features, etc.)
+    return [
+        [name, f"CPL::{clsid}::{canonical}", desc] for name, clsid, canonical, desc in _enumerate_control_panel_items()
+    ]
+
+
+# In merge order: when two sources list an app of the same name, the earlier one wins
+_SCANNERS = {
+    "start_menu": _scan_start_menu,
+    "start_apps": _scan_start_apps,
+    "control_panel": _scan_control_panel,
+}
+
+
+def _merge_sources(sources: dict[str, dict]) -> list[AppEntry]:
+    apps = []
+    seen_names = set()
+    for source in _SCANNERS:
+        for name, path, description in sources.get(source, {}).get("apps", ()):
+            # Some shortcuts use CamelCase without spaces (e.g. "LiveCaptions")
+            # while Get-StartApps returns the spaced form ("Live captions").
+            # Checking both forms prevents duplicates.
+            lower = name.lower()
+            stripped = lower.replace(" ", "")
+            if lower in seen_names or stripped in seen_names:
+                continue
+            apps.append((name, path, description))
+            seen_names.add(lower)
+            seen_names.add(stripped)
+    return apps
+
+
+def _revalidate(sources: dict[str, dict]) -> tuple[dict[str, dict], bool]:
+    """Rescan the sources whose fingerprint changed. Returns the updated sources and whether any was rescanned."""
+    fingerprints = _fingerprints()
+    now = time.time()
+    updated = dict(sources)
+    rescanned = False
+    for source, scan in _SCANNERS.items():
+        fingerprint = fingerprints[source]
+        previous = sources.get(source)
+        if (
+            previous is not None
+            and fingerprint is not None
+            and previous["fingerprint"] == fingerprint
+            and now - previous["scanned"] < _MAX_SOURCE_AGE
+        ):
+            continue
+        try:
+            apps = scan()
+        except Exception as e:
+            # Keep serving the last good scan of this source; it is retried on the next run
+            logging.debug("Failed to scan %s apps: %s", source, e)
+            continue
+        updated[source] = {"fingerprint": fingerprint, "scanned": now, "apps": apps}
+        rescanned = True
+    return updated, rescanned
+
+
+def _load_snapshot(path) -> dict[str, dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except OSError, ValueError:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _SNAPSHOT_VERSION:
+        return {}
+    sources = data.get("sources")
+    if not isinstance(sources, dict):
+        return {}
+    # A source that doesn't look like _revalidate wrote it is left out, so it is rescanned
+    return {name: source for name, source in sources.items() if name in _SCANNERS and _is_valid_source(source)}
+
+
+def _is_valid_source(source) -> bool:
+    if not isinstance(source, dict):
+        return False
+    fingerprint, scanned, apps = source.get("fingerprint"), source.get("scanned"), source.get("apps")
+    if not (fingerprint is None or isinstance(fingerprint, str)):
+        return False
+    if isinstance(scanned, bool) or not isinstance(scanned, int | float) or not isinstance(apps, list):
+        return False
+    return all(
+        isinstance(app, list)
+        and len(app) == 3
+        and isinstance(app[0], str)
+        and isinstance(app[1], str)
+        and (app[2] is None or isinstance(app[2], str))
+        for app in apps
+    )
+
+
+def _save_snapshot(path, sources: dict[str, dict]):
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": _SNAPSHOT_VERSION, "sources": sources}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError as e:
+        logging.debug("App catalog snapshot write failed: %s", e)
+
+
+@dataclass(frozen=True)
+class AppCatalogDelta:
+    """How the app list changed between two loads. Apps are identified by their path."""
+
+    added: tuple[AppEntry, ...] = ()
+    removed: tuple[AppEntry, ...] = ()
+    # (old, new) for apps whose name or description changed
+    renamed: tuple[tuple[AppEntry, AppEntry], ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.renamed)
+
+    @classmethod
+    def between(cls, old: list[AppEntry], new: list[AppEntry]) -> AppCatalogDelta:
+        old_by_path = {app[1]: app for app in old}
+        new_by_path = {app[1]: app for app in new}
+        return cls(
+            added=tuple(app for path, app in new_by_path.items() if path not in old_by_path),
+            removed=tuple(app for path, app in old_by_path.items() if path not in new_by_path),
+            renamed=tuple(
+                (old_by_path[path], app)
+                for path, app in new_by_path.items()
+                if path in old_by_path and old_by_path[path] != app
+            ),
+        )
+
+
 class AppListLoader(QThread):
     """
-    Thread to load the list of applications from the Windows Start Menu and UWP apps.
-    This class caches the results to avoid reloading on subsequent calls.
+    Thread to load the list of applications from the Windows Start Menu, UWP apps and Control Panel.
+
+    The catalog is kept in memory and persisted to disk with a fingerprint per source (Start Menu
+    directory mtimes, the installed package list, the Control Panel registry key). The last known
+    list is emitted right away with ``apps_loaded``, then only the sources whose fingerprint changed
+    are rescanned; if that changes the list, ``apps_changed`` carries the new list and the delta.
+    With *known_apps*, nothing is emitted up front and the delta is taken against them.
     """
 
     apps_loaded = pyqtSignal(list)
+    # (apps, AppCatalogDelta)
+    apps_changed = pyqtSignal(list, object)
+
+    def __init__(self, known_apps: list[AppEntry] | None = None):
+        super().__init__()
+        self._known_apps = known_apps
 
     @staticmethod
     def clear_cache():
-        global _APPS_CACHE
-        _APPS_CACHE = None
+        """Forget the in-memory catalog; the next load reads the snapshot again."""
+        global _SOURCES, _APPS_CACHE
+        with _CATALOG_LOCK:
+            _SOURCES = None
+            _APPS_CACHE = None
 
     def run(self):
-        global _APPS_CACHE
-        if _APPS_CACHE is not None:
-            self.apps_loaded.emit(_APPS_CACHE)
+        global _SOURCES, _APPS_CACHE
+        snapshot_path = app_data_path(_SNAPSHOT_FILE)
+        with _CATALOG_LOCK:
+            if _SOURCES is None:
+                _SOURCES = _load_snapshot(snapshot_path)
+                _APPS_CACHE = _merge_sources(_SOURCES) if _SOURCES else None
+            served = _APPS_CACHE
+        if self._known_apps is not None:
+            served = self._known_apps
+        elif served is not None:
+            self.apps_loaded.emit(served)
+
+        with _SCAN_LOCK:
+            with _CATALOG_LOCK:
+                sources = _SOURCES if _SOURCES is not None else _load_snapshot(snapshot_path)
+            sources, rescanned = _revalidate(sources)
+            with _CATALOG_LOCK:
+                if rescanned or _APPS_CACHE is None:
+                    _SOURCES = sources
+                    _APPS_CACHE = _merge_sources(sources)
+                apps = _APPS_CACHE
+            if rescanned:
+                _save_snapshot(snapshot_path, sources)
+
+        if served is None:
+            self.apps_loaded.emit(apps)
             return
-
-        filter_keywords = {
-            "readme",
-            "documentation",
-            "license",
-            "setup",
-            "administrative tools",
-        }
-
-        strict_filter_keywords = {
-            "uninstall",
-            "installer",
-            "help",
-        }
-
-        # Pre-compile regex for strict keywords
-        strict_pattern = re.compile(r"\b(" + "|".join(map(re.escape, strict_filter_keywords)) + r")\b")
-
-        start_menu_dirs = [
-            os.path.expandvars(r"%APPDATA%\Microsoft\Windows\Start Menu"),
-            os.path.expandvars(r"%PROGRAMDATA%\Microsoft\Windows\Start Menu"),
-        ]
-        apps = []
-        seen_names = set()
-
-        def should_filter_app(name):
-            """Check if app name contains any filter keywords"""
-            name_lower = name.lower()
-
-            # Check loose keywords (substring match)
-            if any(keyword in name_lower for keyword in filter_keywords):
-                return True
-
-            # Check strict keywords (whole word match)
-            if strict_pattern.search(name_lower):
-                return True
-
-            return False
-
-        def is_duplicate(name):
-            """Check if name (or its space-stripped form) was already seen.
-
-            Some shortcuts use CamelCase without spaces (e.g. "LiveCaptions")
-            while Get-StartApps returns the spaced form ("Live captions").
-            Checking both forms prevents duplicates.
-            """
-            lower = name.lower()
-            stripped = lower.replace(" ", "")
-            return lower in seen_names or stripped in seen_names
-
-        def mark_seen(name):
-            lower = name.lower()
-            seen_names.add(lower)
-            seen_names.add(lower.replace(" ", ""))
-
-        for dir in start_menu_dirs:
-            for lnk in glob.glob(os.path.join(dir, "**", "*.lnk"), recursive=True):
-                name = os.path.splitext(os.path.basename(lnk))[0]
-                if should_filter_app(name):
-                    continue
-                if not is_duplicate(name):
-                    apps.append((name, lnk, None))
-                    mark_seen(name)
-
-            # Also scan .url files (e.g. Steam games)
-            for url_file in glob.glob(os.path.join(dir, "**", "*.url"), recursive=True):
-                name = os.path.splitext(os.path.basename(url_file))[0]
-                if should_filter_app(name):
-                    continue
-                if not is_duplicate(name):
-                    apps.append((name, url_file, None))
-                    mark_seen(name)
-
-        try:
-            ps_script = "Get-StartApps | ForEach-Object { [PSCustomObject]@{Name=$_.Name;AppID=$_.AppID} } | ConvertTo-Json -Compress"
-            result = subprocess.run(
-                [
-                    "powershell",
-                    "-NoProfile",
-                    "-NonInteractive",
-                    "-NoLogo",
-                    "-ExecutionPolicy",
-                    "Bypass",
-                    "-Command",
-                    ps_script,
-                ],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-            if result.returncode == 0:
-                import json as _json
-
-                uwp_list = _json.loads(result.stdout)
-                if isinstance(uwp_list, dict):
-                    uwp_list = [uwp_list]
-                for entry in uwp_list:
-                    name = entry.get("Name")
-                    appid = entry.get("AppID")
-                    if name and appid and not is_duplicate(name) and not should_filter_app(name):
-                        apps.append((name, f"UWP::{appid}", None))
-                        mark_seen(name)
-        except Exception:
-            pass
-
-        # Source 3: Control Panel items from registry (Device Manager, Programs and Features, etc.)
-        try:
-            for name, clsid, canonical, desc in _enumerate_control_panel_items():
-                if not is_duplicate(name):
-                    apps.append((name, f"CPL::{clsid}::{canonical}", desc))
-                    mark_seen(name)
-        except Exception:
-            pass
-
-        _APPS_CACHE = apps
-        self.apps_loaded.emit(apps)
+        delta = AppCatalogDelta.between(served, apps)
+        if not delta.is_empty:
+            self.apps_changed.emit(apps, delta)
 
 
 class ShortcutResolver:
@@ -7,8 +7,7 @@ import ctypes
 import ctypes.wintypes as wt
 from ctypes import POINTER, WINFUNCTYPE, byref, c_void_p
 
-from PIL import Image
-
+from core.utils.lazy_import import lazy_import
 from core.utils.win32.aumid import GUID, _ensure_com_initialized
 from core.utils.win32.bindings import (
     DeleteObject,
@@ -19,6 +18,8 @@ from core.utils.win32.bindings import (
 )
 from core.utils.win32.structs import BITMAP, BITMAPINFO, BITMAPINFOHEADER
 
+Image = lazy_import("PIL.Image")
+
 # IShellItemImageFactory interface for icon extraction
 IID_IShellItemImageFactory = GUID("BCC18B79-BA16-442F-80C4-8A59C30C463B")
 
@@ -13,3 +13,4 @@ from .setupapi import *
 from .shell32 import *
 from .user32 import *
 from .wlanapi import *
+from .ws2_32 import *
@@ -0,0 +1,32 @@
+"""Wrappers for ws2_32 win32 API functions to make them easier to use and have proper types"""
+
+from ctypes import POINTER, WinDLL, c_int, c_size_t, c_void_p
+
+from core.utils.win32.structs import SOCKADDR_UN
+
+# Winsock errors are read with ctypes.get_last_error()
+ws2_32 = WinDLL("ws2_32", use_last_error=True)
+
+SOCKET = c_size_t
+INVALID_SOCKET = SOCKET(-1).value
+
+ws2_32.connect.argtypes = [SOCKET, POINTER(SOCKADDR_UN), c_int]
+ws2_32.connect.restype = c_int
+
+ws2_32.bind.argtypes = [SOCKET, POINTER(SOCKADDR_UN), c_int]
+ws2_32.bind.restype = c_int
+
+ws2_32.accept.argtypes = [SOCKET, c_void_p, c_void_p]
+ws2_32.accept.restype = SOCKET
+
+
+def connect(s: int, name, namelen: int) -> int:
+    return ws2_32.connect(s, name, namelen)
+
+
+def bind(s: int, name, namelen: int) -> int:
+    return ws2_32.bind(s, name, namelen)
+
+
+def accept(s: int, addr=None, addrlen=None) -> int:
+    return ws2_32.accept(s, addr, addrlen)
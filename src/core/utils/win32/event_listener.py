@@ -5,7 +5,7 @@ import time
 from PyQt6.QtCore import QThread
 from win32gui import GetForegroundWindow
 
-from core.event_service import EventService
+from core.event_service import CoalescePolicy, EventService
 from core.utils.win32.bindings.kernel32 import GetCurrentThreadId
 from core.utils.win32.bindings.ole32 import ole32
 from core.utils.win32.bindings.user32 import user32
@@ -20,6 +20,11 @@ class SystemEventListener(QThread):
         super().__init__()
         self._hook = None
         self._event_service = EventService()
+        # Title and state changes come in bursts (progress shown in titles, tab
+        # switches); listeners only need the latest one for each window. A lone
+        # change is delivered at once, a burst at most every 50 ms.
+        for event in (WinEvent.EventObjectNameChange, WinEvent.EventObjectStateChange):
+            self._event_service.set_coalescing(event, CoalescePolicy("throttle", 50, key=lambda hwnd, _event: hwnd))
         self._win_event_process = WINEVENTPROC(self._event_handler)
 
     def __str__(self):
@@ -14,12 +14,14 @@ from urllib.parse import urljoin, urlparse
 
 import win32com.client
 import win32gui
-from PIL import Image
 
+from core.utils.lazy_import import lazy_import
 from core.utils.win32.app_icons import hicon_to_image
 from core.utils.win32.aumid_icons import get_icon_for_aumid
 from core.utils.win32.pe_icons import IconExtractor
 
+Image = lazy_import("PIL.Image")
+
 
 def parse_icon_location(value: str) -> tuple[str, int]:
     """Split an icon location string like ``'file.dll,-3'`` into *(file, index)*.
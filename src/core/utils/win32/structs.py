@@ -734,3 +734,12 @@ class PDH_FMT_COUNTERVALUE_DOUBLE(ct.Structure):
         ("padding", DWORD),
         ("doubleValue", ct.c_double),
     ]
+
+
+class SOCKADDR_UN(ct.Structure):
+    """Address of a Unix domain socket (afunix.h)."""
+
+    _fields_ = [
+        ("sun_family", USHORT),
+        ("sun_path", ct.c_char * 108),
+    ]
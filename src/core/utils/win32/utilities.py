@@ -12,8 +12,8 @@ from PyQt6.QtGui import QCursor
 from PyQt6.QtWidgets import QApplication, QWidget
 from win32api import GetMonitorInfo, MonitorFromWindow
 from win32gui import GetClassName, GetWindowPlacement, GetWindowRect, GetWindowText
-from winrt.windows.management.deployment import PackageManager
 
+from core.utils.lazy_import import lazy_import
 from core.utils.utilities import is_windows_10
 from core.utils.win32.bindings import (
     CloseHandle,
@@ -34,6 +34,9 @@ from core.utils.win32.constants import (
     SW_MAXIMIZE,
 )
 
+# Only needed to resolve UWP apps
+deployment = lazy_import("winrt.windows.management.deployment")
+
 
 def get_windows_host_arch():
     """Returns the actual host machine architecture on Windows,
@@ -192,7 +195,7 @@ def get_app_name_from_pid(pid: int) -> str | None:
 
                     # Direct lookup by full name is much faster than iterating all packages, so try that first
                     try:
-                        package = PackageManager().find_package_by_user_security_id_package_full_name(
+                        package = deployment.PackageManager().find_package_by_user_security_id_package_full_name(
                             "", package_full_name
                         )
                         if package:
@@ -212,7 +215,7 @@ def get_app_name_from_pid(pid: int) -> str | None:
 
                     # Fallback: iterate all packages if direct lookup failed
                     try:
-                        package_manager = PackageManager()
+                        package_manager = deployment.PackageManager()
 
                         for package in package_manager.find_packages_by_user_security_id(""):
                             if package.id.full_name == package_full_name:
@@ -279,7 +282,7 @@ def get_app_name_from_aumid(aumid: str) -> str | None:
         else:
             package_family = aumid
 
-        package_manager = PackageManager()
+        package_manager = deployment.PackageManager()
         for package in package_manager.find_packages_by_user_security_id(""):
             try:
                 family_name = package.id.family_name
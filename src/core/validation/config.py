@@ -1,5 +1,7 @@
 from typing import Any
 
+from pydantic import Field
+
 from core.validation.bar import BarConfig
 from core.validation.widgets.base_model import CustomBaseModel
 
@@ -19,6 +21,7 @@ class GlazeWMConfig(CustomBaseModel):
 class YasbConfig(CustomBaseModel):
     watch_config: bool = True
     watch_stylesheet: bool = True
+    watch_delay: int = Field(default=200, ge=0)
     debug: bool = False
     # env_file is deprecated and will be removed in the future
     # Use load .env file from the config folder instead
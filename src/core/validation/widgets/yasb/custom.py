@@ -14,8 +14,10 @@ from core.validation.widgets.base_model import (
 
 class ExecOptionsConfig(CustomBaseModel):
     run_cmd: str | None = None
+    mode: Literal["poll", "stream"] = "poll"
     run_once: bool = False
     run_interval: int = Field(default=120000, ge=0)
+    timeout: int = Field(default=60000, ge=1)
     return_format: Literal["string", "json"] = "json"
     hide_empty: bool = False
     use_shell: bool = True
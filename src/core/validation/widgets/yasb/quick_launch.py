@@ -21,13 +21,21 @@ class QuickLaunchPopupConfig(CustomBaseModel):
     dark_mode: bool = True
 
 
+class ProviderConfig(CustomBaseModel):
+    """Options every provider accepts. None keeps the provider's own default."""
+
+    query_timeout: float | None = Field(default=None, gt=0)
+    cache_ttl: float | None = Field(default=None, ge=0)
+    clear_cache_on_deactivate: bool | None = None
+
+
 class QuickLaunchCallbacksConfig(CallbacksConfig):
     on_left: str = "toggle_quick_launch"
     on_middle: str = "do_nothing"
     on_right: str = "do_nothing"
 
 
-class AppsProviderConfig(CustomBaseModel):
+class AppsProviderConfig(ProviderConfig):
     enabled: bool = True
     prefix: str = "*"
     priority: int = 0
@@ -36,7 +44,7 @@ class AppsProviderConfig(CustomBaseModel):
     show_description: bool = True
 
 
-class CalculatorProviderConfig(CustomBaseModel):
+class CalculatorProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "="
     priority: int = 0
@@ -50,7 +58,7 @@ class WebSearchEngineConfig(CustomBaseModel):
     description: str = "Search the web"
 
 
-class WebSearchProviderConfig(CustomBaseModel):
+class WebSearchProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "?"
     priority: int = 0
@@ -59,34 +67,35 @@ class WebSearchProviderConfig(CustomBaseModel):
     remove_engines: list[str] = []
 
 
-class SystemCommandsProviderConfig(CustomBaseModel):
+class SystemCommandsProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = ">"
     priority: int = 0
 
 
-class SettingsProviderConfig(CustomBaseModel):
+class SettingsProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "@"
     priority: int = 0
 
 
-class KillProcessProviderConfig(CustomBaseModel):
+class KillProcessProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "!"
     priority: int = 0
 
 
-class FileSearchProviderConfig(CustomBaseModel):
+class FileSearchProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "/"
     priority: int = 0
-    backend: Literal["auto", "everything", "index", "disk"] = "auto"
+    backend: Literal["auto", "everything", "index", "local", "disk"] = "auto"
+    index_roots: list[str] = []
     show_path: bool = True
     show_preview: bool = False
 
 
-class BinanceProviderConfig(CustomBaseModel):
+class BinanceProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "crypto"
     priority: int = 0
@@ -96,13 +105,13 @@ class BinanceProviderConfig(CustomBaseModel):
     domain: str = "api-gcp.binance.com"
 
 
-class CurrencyProviderConfig(CustomBaseModel):
+class CurrencyProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "$"
     priority: int = 0
 
 
-class BookmarksProviderConfig(CustomBaseModel):
+class BookmarksProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "*"
     priority: int = 0
@@ -110,32 +119,32 @@ class BookmarksProviderConfig(CustomBaseModel):
     profile: str = "Default"
 
 
-class UnitConverterProviderConfig(CustomBaseModel):
+class UnitConverterProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "~"
     priority: int = 0
 
 
-class EmojiProviderConfig(CustomBaseModel):
+class EmojiProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = ":"
     priority: int = 0
 
 
-class SnippetsProviderConfig(CustomBaseModel):
+class SnippetsProviderConfig(ProviderConfig):
     enabled: bool = True
     prefix: str = ";"
     priority: int = 0
     type_delay: int = 200
 
 
-class ColorProviderConfig(CustomBaseModel):
+class ColorProviderConfig(ProviderConfig):
     enabled: bool = True
     prefix: str = "c:"
     priority: int = 0
 
 
-class ClipboardHistoryProviderConfig(CustomBaseModel):
+class ClipboardHistoryProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "cb"
     priority: int = 0
@@ -143,7 +152,7 @@ class ClipboardHistoryProviderConfig(CustomBaseModel):
     show_preview: bool = True
 
 
-class PortViewerProviderConfig(CustomBaseModel):
+class PortViewerProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "pv"
     priority: int = 0
@@ -151,13 +160,13 @@ class PortViewerProviderConfig(CustomBaseModel):
     include_established: bool = False
 
 
-class WorldClockProviderConfig(CustomBaseModel):
+class WorldClockProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "tz"
     priority: int = 0
 
 
-class HackerNewsProviderConfig(CustomBaseModel):
+class HackerNewsProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "hn"
     priority: int = 0
@@ -165,51 +174,51 @@ class HackerNewsProviderConfig(CustomBaseModel):
     max_items: int = 30
 
 
-class DevToolsProviderConfig(CustomBaseModel):
+class DevToolsProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "dev"
     priority: int = 0
 
 
-class IpInfoProviderConfig(CustomBaseModel):
+class IpInfoProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "ip"
     priority: int = 0
 
 
-class VSCodeProviderConfig(CustomBaseModel):
+class VSCodeProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "vsc"
     priority: int = 0
 
 
-class WindowSwitcherProviderConfig(CustomBaseModel):
+class WindowSwitcherProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "win"
     priority: int = 0
 
 
-class WindowsTerminalProviderConfig(CustomBaseModel):
+class WindowsTerminalProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "wt"
     priority: int = 0
 
 
-class GithubNotificationsProviderConfig(CustomBaseModel):
+class GithubNotificationsProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "gh"
     priority: int = 0
     token: str = "env"
 
 
-class WslProviderConfig(CustomBaseModel):
+class WslProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "wsl"
     priority: int = 0
     show_online: bool = True
 
 
-class SshProviderConfig(CustomBaseModel):
+class SshProviderConfig(ProviderConfig):
     enabled: bool = False
     prefix: str = "ssh"
     priority: int = 0
@@ -250,6 +259,7 @@ class QuickLaunchConfig(CustomBaseModel):
     search_placeholder: str = "Search applications..."
     remember_last_query: bool = False
     max_results: int = Field(default=50, ge=1, le=500)
+    parallel_providers: bool = True
     show_icons: bool = True
     icon_size: int = 32
     home_page: bool = False
@@ -1,6 +1,7 @@
 import hashlib
 import logging
 import os
+import threading
 from os.path import basename
 
 from watchdog.events import FileModifiedEvent, PatternMatchingEventHandler
@@ -23,11 +24,14 @@ class FileModifiedEventHandler(PatternMatchingEventHandler):
         self._ignore_patterns = []
         self._ignore_directories = True
         self._case_sensitive = False
-        self._last_styles_hash = None
-        self._last_config_hash = None
         self._stylesheet_path = self._normalize_path(get_stylesheet_path())
         self._imported_stylesheets = set()
-        self._imported_hashes = {}
+        self._stats: dict[str, tuple[int, int] | None] = {}
+        self._hashes: dict[str, str] = {}
+        self._pending: dict[str, str] = {}
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._counters = {"events": 0, "unchanged": 0, "styles_reloads": 0, "config_reloads": 0}
         self._observer = None
         self._watched_dirs = set()
         self._refresh_imported_stylesheets()
@@ -37,9 +41,8 @@ class FileModifiedEventHandler(PatternMatchingEventHandler):
 
     def _refresh_imported_stylesheets(self) -> None:
         try:
-            processor = CSSProcessor(self._stylesheet_path)
-            processor.process()
-            self._imported_stylesheets = {self._normalize_path(path) for path in processor.imported_files}
+            imported_files = CSSProcessor(self._stylesheet_path).collect_imports()
+            self._imported_stylesheets = {self._normalize_path(path) for path in imported_files}
             if self._stylesheet_path:
                 self._imported_stylesheets.add(self._stylesheet_path)
             self._patterns = [self.styles_file, self.config_file, *self._imported_stylesheets]
@@ -71,34 +74,92 @@ class FileModifiedEventHandler(PatternMatchingEventHandler):
         except Exception:
             return None
 
-    def on_modified(self, event: FileModifiedEvent):
-        modified_file = basename(event.src_path)
-        normalized_path = self._normalize_path(event.src_path)
+    def _file_stat(self, path) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
+    def _classify(self, path: str) -> str | None:
+        """Return which reload a change to *path* needs, or None if it is not watched."""
+        modified_file = basename(path)
+        normalized_path = self._normalize_path(path)
         if modified_file == self.styles_file and self.bar_manager.config.watch_stylesheet:
-            new_hash = self._file_hash(event.src_path)
-            if new_hash and new_hash != self._last_styles_hash:
-                self._last_styles_hash = new_hash
-                self._refresh_imported_stylesheets()
-                self.bar_manager.styles_modified.emit()
-                logging.debug("Stylesheet modified: %s", event.src_path)
-        elif modified_file == self.config_file and self.bar_manager.config.watch_config:
-            new_hash = self._file_hash(event.src_path)
-            if new_hash and new_hash != self._last_config_hash:
-                self._last_config_hash = new_hash
-                self.bar_manager.config_modified.emit()
-                logging.debug("Config file modified: %s", event.src_path)
-        elif normalized_path in self._imported_stylesheets and self.bar_manager.config.watch_stylesheet:
-            new_hash = self._file_hash(event.src_path)
-            if new_hash and self._imported_hashes.get(normalized_path) != new_hash:
-                self._imported_hashes[normalized_path] = new_hash
-                self._refresh_imported_stylesheets()
-                self.bar_manager.styles_modified.emit()
-                logging.debug("Imported stylesheet modified: %s", event.src_path)
+            return "styles"
+        if modified_file == self.config_file and self.bar_manager.config.watch_config:
+            return "config"
+        if normalized_path in self._imported_stylesheets and self.bar_manager.config.watch_stylesheet:
+            return "styles"
+        return None
+
+    def on_modified(self, event: FileModifiedEvent):
+        kind = self._classify(event.src_path)
+        if kind is None:
+            return
+        path = self._normalize_path(event.src_path)
+        with self._lock:
+            self._counters["events"] += 1
+            # Editors fire several events per save; the ones that leave
+            # mtime and size as they were at the last reload are dropped
+            # without reading the file.
+            if self._file_stat(path) == self._stats.get(path):
+                self._counters["unchanged"] += 1
+                return
+            self._pending[path] = kind
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.bar_manager.config.watch_delay / 1000, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self) -> None:
+        """Reload once for every file that changed during the quiet period."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._timer = None
+        changed: dict[str, list[str]] = {}
+        for path, kind in pending.items():
+            self._stats[path] = self._file_stat(path)
+            new_hash = self._file_hash(path)
+            if new_hash and new_hash != self._hashes.get(path):
+                self._hashes[path] = new_hash
+                changed.setdefault(kind, []).append(path)
+
+        with self._lock:
+            for kind in changed:
+                self._counters[f"{kind}_reloads"] += 1
+
+        if "styles" in changed:
+            self._refresh_imported_stylesheets()
+            self.bar_manager.styles_modified.emit()
+            logging.debug("Stylesheet modified: %s", ", ".join(changed["styles"]))
+        if "config" in changed:
+            self.bar_manager.config_modified.emit()
+            logging.debug("Config file modified: %s", ", ".join(changed["config"]))
+        if changed:
+            logging.debug("File watcher stats: %s", self.stats())
+
+    def stats(self) -> dict[str, int]:
+        """Counts of modify events received, events dropped by the stat check, and reloads triggered."""
+        with self._lock:
+            return dict(self._counters)
+
+
+# The handler of the running observer, if any; its counters are logged by `yasbc event-stats`
+_event_handler: FileModifiedEventHandler | None = None
+
+
+def log_watcher_stats() -> None:
+    if _event_handler is None:
+        logging.info("FileWatcher: not running")
+        return
+    logging.info("FileWatcher: %s", ", ".join(f"{name} {count}" for name, count in _event_handler.stats().items()))
 
 
 def create_observer(bar_manager: BarManager):
-    event_handler = FileModifiedEventHandler(bar_manager)
+    global _event_handler
+    event_handler = _event_handler = FileModifiedEventHandler(bar_manager)
     observer = Observer()
     event_handler.set_observer(observer)
     logging.info("Created file watcher")
@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QWidget
 
 from core.event_service import EventService
 from core.utils.utilities import add_shadow
+from core.utils.widgets.label_template import LabelTemplate, compile_label
 from core.utils.win32.system_function import function_map
 from core.widgets.registry import register_widget_class
 
@@ -94,6 +95,14 @@ class BaseWidget(QWidget):
     def register_callback(self, callback_name: str, fn: Callable[[], None]):
         self.callbacks[callback_name] = fn
 
+    def shutdown(self) -> None:
+        """
+        Stop what the widget started before it is closed and deleted when a config
+        reload removes it. Widgets that run threads, processes or popups of their own,
+        or subscribe to shared services, override this and call ``super().shutdown()``.
+        """
+        self.timer.stop()
+
     def start_timer(self):
         if self.timer_interval and self.timer_interval > 0:
             self.timer.timeout.connect(self._timer_callback)
@@ -157,21 +166,12 @@ class BaseWidget(QWidget):
         content_shadow: dict[str, Any] | None = None,
     ):
         def process_content(content: str, is_alt: bool = False) -> list[QLabel]:
-            label_parts = re.split("(<span.*?>.*?</span>)", content)
-            label_parts = [part for part in label_parts if part]
             widgets: list[QLabel] = []
-            for part in label_parts:
-                part = part.strip()
-                if not part:
-                    continue
-                if "<span" in part and "</span>" in part:
-                    class_name = re.search(r'class=(["\'])([^"\']+?)\1', part)
-                    class_result = class_name.group(2) if class_name else "icon"
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    label = QLabel(icon)
-                    label.setProperty("class", class_result)
+            for part in compile_label(content):
+                label = QLabel(part.text)
+                if part.is_icon:
+                    label.setProperty("class", part.class_name)
                 else:
-                    label = QLabel(part)
                     label.setProperty("class", "label alt" if is_alt else "label")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 label.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -188,3 +188,8 @@ class BaseWidget(QWidget):
         self._widgets = process_content(content)
         if content_alt:
             self._widgets_alt = process_content(content_alt, is_alt=True)
+        # Widgets that refresh on a timer update their labels through these
+        self._label_template = LabelTemplate(content, self._widgets)
+        self._label_alt_template = LabelTemplate(
+            content_alt or "", self._widgets_alt if content_alt else [], is_alt=True
+        )
@@ -8,7 +8,7 @@ from PyQt6.QtGui import QCursor
 from PyQt6.QtWidgets import QHBoxLayout, QPushButton
 
 from core.utils.utilities import add_shadow
-from core.utils.widgets.glazewm.client import GlazewmClient, TilingDirection
+from core.utils.widgets.glazewm.client import GlazewmClient, QueryType, TilingDirection
 from core.validation.widgets.glazewm.tiling_direction import GlazewmTilingDirectionConfig
 from core.widgets.base import BaseWidget
 
@@ -43,16 +43,16 @@ class GlazewmTilingDirectionWidget(BaseWidget):
 
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
 
-        self.glazewm_client = GlazewmClient(
-            config.glazewm_server_uri,
-            [
-                "sub -e focus_changed tiling_direction_changed focused_container_moved",
-                "query tiling-direction",
-            ],
-        )
+        self.glazewm_client = GlazewmClient.get(config.glazewm_server_uri)
         self.glazewm_client.glazewm_connection_status.connect(self._update_connection_status)  # type: ignore
         self.glazewm_client.tiling_direction_processed.connect(self._update_tiling_direction)  # type: ignore
-        self.glazewm_client.connect()
+        self.glazewm_client.subscribe(
+            ["focus_changed", "tiling_direction_changed", "focused_container_moved"],
+            [QueryType.TILING_DIRECTION],
+        )
+        self._update_connection_status(self.glazewm_client.is_connected)
+        if self.glazewm_client.tiling_direction is not None:
+            self._update_tiling_direction(self.glazewm_client.tiling_direction)
 
     @pyqtSlot()
     def toggle_tiling_direction(self):
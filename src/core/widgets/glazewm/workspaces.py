@@ -9,7 +9,19 @@ from PyQt6.QtGui import QCursor, QImage, QMouseEvent, QPixmap, QShowEvent, QWhee
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QWidget
 
 from core.utils.utilities import add_shadow, refresh_widget_style
-from core.utils.widgets.glazewm.client import GlazewmClient, Monitor, Window, Workspace
+from core.utils.widgets.glazewm.client import (
+    GlazewmClient,
+    Monitor,
+    QueryType,
+    Window,
+    WindowMoved,
+    Workspace,
+    WorkspaceAdded,
+    WorkspaceDelta,
+    WorkspaceFocused,
+    WorkspaceRemoved,
+    WorkspaceUpdated,
+)
 from core.utils.win32.app_icons import get_window_icon
 from core.utils.win32.utilities import get_monitor_hwnd, get_process_info
 from core.validation.widgets.glazewm.workspaces import GlazewmWorkspacesConfig
@@ -414,15 +426,20 @@ class GlazewmWorkspacesWidget(BaseWidget):
         self.widget_layout.addWidget(self.offline_text)
         self.widget_layout.addWidget(self.workspace_container)
 
-        self.glazewm_client = GlazewmClient(
-            self.config.glazewm_server_uri,
+        self.glazewm_client = GlazewmClient.get(self.config.glazewm_server_uri)
+        self.glazewm_client.glazewm_connection_status.connect(self._update_connection_status)  # type: ignore
+        self.glazewm_client.workspaces_changed.connect(self._on_workspaces_changed)  # type: ignore
+        self.glazewm_client.subscribe(
             [
-                "sub -e workspace_activated workspace_deactivated workspace_updated focus_changed focused_container_moved",
-                "query monitors",
+                "workspace_activated",
+                "workspace_deactivated",
+                "workspace_updated",
+                "focus_changed",
+                "focused_container_moved",
             ],
+            [QueryType.MONITORS],
         )
-        self.glazewm_client.glazewm_connection_status.connect(self._update_connection_status)  # type: ignore
-        self.glazewm_client.workspaces_data_processed.connect(self._update_workspaces)  # type: ignore
+        self._update_connection_status(self.glazewm_client.is_connected)
         self.icon_cache = dict()
         self.workspace_app_icons_enabled = (
             self.config.app_icons.enabled_populated
@@ -433,7 +450,12 @@ class GlazewmWorkspacesWidget(BaseWidget):
     @override
     def showEvent(self, a0: QShowEvent | None):
         super().showEvent(a0)
-        self.monitor_handle = get_monitor_hwnd(int(QWidget.winId(self)))
+        monitor_handle = get_monitor_hwnd(int(QWidget.winId(self)))
+        if monitor_handle != self.monitor_handle:
+            self.monitor_handle = monitor_handle
+            # Build the buttons from the shared model; later updates only touch what changed
+            if self.glazewm_client.monitors is not None:
+                self._update_workspaces(self.glazewm_client.monitors)
         self.glazewm_client.connect()
 
     @pyqtSlot(bool)
@@ -441,8 +463,26 @@ class GlazewmWorkspacesWidget(BaseWidget):
         self.workspace_container.setVisible(status)
         self.offline_text.setVisible(not status if not self.config.hide_if_offline else False)
 
-    @pyqtSlot(list)
-    def _update_workspaces(self, message: list[Monitor]):
+    @pyqtSlot(list, list)
+    def _on_workspaces_changed(self, monitors: list[Monitor], deltas: list[WorkspaceDelta]):
+        affected: set[str] = set()
+        for delta in deltas:
+            if isinstance(delta, (WorkspaceAdded, WorkspaceRemoved)):
+                # Buttons are created, hidden or reordered; rebuild from the whole model
+                self._update_workspaces(monitors)
+                return
+            if isinstance(delta, WorkspaceFocused):
+                affected.update(name for name in (delta.name, delta.previous) if name)
+            elif isinstance(delta, WindowMoved):
+                affected.update((delta.source, delta.target))
+            elif isinstance(delta, WorkspaceUpdated):
+                affected.add(delta.workspace.name)
+            else:
+                affected.add(delta.workspace)
+        self._update_workspaces(monitors, affected)
+
+    def _update_workspaces(self, message: list[Monitor], only: set[str] | None = None):
+        """Sync the buttons with the workspace model; with *only*, just the buttons of those workspaces."""
         current_mon = next((m for m in message if m.hwnd == self.monitor_handle), None)
         if not current_mon:
             return
@@ -462,6 +502,8 @@ class GlazewmWorkspacesWidget(BaseWidget):
             workspace_source = {workspace.name: workspace for workspace in all_workspaces.values()}
 
         for workspace in workspace_source.values():
+            if only is not None and workspace.name not in only:
+                continue
             if (btn := self.workspaces.get(workspace.name)) is None:
                 if self.workspace_app_icons_enabled:
                     btn = self.workspaces[workspace.name] = GlazewmWorkspaceButtonWithIcons(
@@ -497,6 +539,8 @@ class GlazewmWorkspacesWidget(BaseWidget):
         current_ws_names = set(workspace_source.keys())
 
         for btn in self.workspaces.values():
+            if only is not None and btn.workspace_name not in only:
+                continue
             btn.monitor_exclusive = self.config.monitor_exclusive
             is_current_ipc_workspace = btn.workspace_name in current_ws_names
 
@@ -10,6 +10,7 @@ from core.event_service import EventService
 from core.utils.utilities import PopupWidget, add_shadow
 from core.utils.widgets.animation_manager import AnimationManager
 from core.utils.widgets.komorebi.client import KomorebiClient
+from core.utils.widgets.komorebi.state_store import KomorebiStateDiff
 from core.utils.win32.utilities import get_monitor_hwnd
 from core.validation.widgets.komorebi.active_layout import ActiveLayoutConfig
 from core.widgets.base import BaseWidget
@@ -48,7 +49,7 @@ class ActiveLayoutWidget(BaseWidget):
     k_signal_connect = pyqtSignal(dict)
     k_signal_disconnect = pyqtSignal()
     k_signal_layout_change = pyqtSignal(dict, dict)
-    k_signal_update = pyqtSignal(dict, dict)
+    k_signal_update = pyqtSignal(dict, dict, object)
 
     validation_schema = ActiveLayoutConfig
     event_listener = KomorebiEventListener
@@ -246,7 +247,7 @@ class ActiveLayoutWidget(BaseWidget):
         self.k_signal_connect.connect(self._on_komorebi_connect_event)
         self.k_signal_disconnect.connect(self._on_komorebi_disconnect_event)
         self.k_signal_layout_change.connect(self._on_komorebi_layout_change_event)
-        self.k_signal_update.connect(self._on_komorebi_layout_change_event)
+        self.k_signal_update.connect(self._on_komorebi_update_event)
 
         self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
         self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
@@ -285,6 +286,11 @@ class ActiveLayoutWidget(BaseWidget):
     def _on_komorebi_layout_change_event(self, _event: dict, state: dict) -> None:
         self._update_active_layout(state)
 
+    def _on_komorebi_update_event(self, _event: dict, state: dict, diff: KomorebiStateDiff) -> None:
+        # is_paused is a top-level field
+        if diff.touches(get_monitor_hwnd(int(QWidget.winId(self))), global_state=True):
+            self._update_active_layout(state)
+
     def _on_komorebi_disconnect_event(self) -> None:
         if self.config.hide_if_offline:
             self.hide()
@@ -83,6 +83,14 @@ class KomorebiControlWidget(BaseWidget):
         except Exception:
             pass
 
+    def shutdown(self) -> None:
+        version_thread = getattr(self, "_version_thread", None)
+        if version_thread is not None and version_thread.isRunning():
+            version_thread.version_result.disconnect(self._on_version_result)
+            version_thread.wait()
+        self._on_destroyed()
+        super().shutdown()
+
     def _start_version_check(self):
         """Starts a background thread to retrieve the Komorebi version."""
         self._version_thread = VersionCheckThread(self._komorebic)
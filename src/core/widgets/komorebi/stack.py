@@ -13,6 +13,7 @@ from core.event_enums import KomorebiEvent
 from core.event_service import EventService
 from core.utils.utilities import add_shadow, refresh_widget_style
 from core.utils.widgets.komorebi.client import KomorebiClient
+from core.utils.widgets.komorebi.state_store import KomorebiStateDiff
 from core.utils.win32.app_icons import get_window_icon
 from core.utils.win32.utilities import get_monitor_hwnd
 from core.utils.win32.window_actions import close_application
@@ -151,7 +152,7 @@ class WindowButton(QFrame):
 
 class StackWidget(BaseWidget):
     k_signal_connect = pyqtSignal(dict)
-    k_signal_update = pyqtSignal(dict, dict)
+    k_signal_update = pyqtSignal(dict, dict, object)
     k_signal_disconnect = pyqtSignal()
     validation_schema = StackConfig
     event_listener = KomorebiEventListener
@@ -295,7 +296,10 @@ class StackWidget(BaseWidget):
         if self.config.hide_if_offline:
             self.hide()
 
-    def _on_komorebi_update_event(self, event: dict, state: dict) -> None:
+    def _on_komorebi_update_event(self, event: dict, state: dict, diff: KomorebiStateDiff) -> None:
+        # On the floating layer the shown window follows the foreground window, which the state doesn't record
+        if self._curr_workspace_layer != "Floating" and not diff.touches(get_monitor_hwnd(int(QWidget.winId(self)))):
+            return
         if self._update_komorebi_state(state):
             self._hide_no_window_text()
 
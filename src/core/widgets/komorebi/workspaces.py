@@ -12,6 +12,7 @@ from core.event_service import EventService
 from core.utils.utilities import add_shadow, refresh_widget_style
 from core.utils.widgets.komorebi.animation import KomorebiAnimation
 from core.utils.widgets.komorebi.client import KomorebiClient
+from core.utils.widgets.komorebi.state_store import KomorebiStateDiff
 from core.utils.win32.app_icons import get_window_icon
 from core.utils.win32.utilities import get_monitor_hwnd, get_process_info
 from core.validation.widgets.komorebi.workspaces import KomorebiWorkspacesConfig
@@ -218,7 +219,7 @@ class WorkspaceButtonWithIcons(QFrame):
 
 class WorkspaceWidget(BaseWidget):
     k_signal_connect = pyqtSignal(dict)
-    k_signal_update = pyqtSignal(dict, dict)
+    k_signal_update = pyqtSignal(dict, dict, object)
     k_signal_disconnect = pyqtSignal()
     validation_schema = KomorebiWorkspacesConfig
     event_listener = KomorebiEventListener
@@ -342,7 +343,10 @@ class WorkspaceWidget(BaseWidget):
         if self.config.hide_if_offline:
             self.hide()
 
-    def _on_komorebi_update_event(self, event: dict, state: dict) -> None:
+    def _on_komorebi_update_event(self, event: dict, state: dict, diff: KomorebiStateDiff) -> None:
+        if not diff.touches(get_monitor_hwnd(int(QWidget.winId(self))), global_state=True):
+            self._komorebi_state = state
+            return
         if self._update_komorebi_state(state):
             # Update icons in workspace buttons (must be done before animation)
             if self._workspace_app_icons_enabled:
@@ -412,10 +416,6 @@ class WorkspaceWidget(BaseWidget):
             else:
                 self.float_override_label.hide()
 
-        # send workspace_update event to active_window widgets
-        if event["type"] in ["MoveWindow", "Show", "Hide", "Destroy"]:
-            self._event_service.emit_event("workspace_update", event["type"])
-
     def _clear_container_layout(self):
         for i in reversed(range(self._workspace_container_layout.count())):
             old_workspace_widget = self._workspace_container_layout.itemAt(i).widget()
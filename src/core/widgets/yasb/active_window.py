@@ -5,12 +5,12 @@ import re
 
 import win32gui
 import win32process
-from PIL import Image
 from PyQt6.QtCore import QElapsedTimer, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QLabel
 
 from core.event_service import EventService
+from core.utils.lazy_import import lazy_import
 from core.utils.utilities import add_shadow
 from core.utils.widgets.animation_manager import AnimationManager
 from core.utils.win32.app_icons import get_window_icon
@@ -20,6 +20,8 @@ from core.validation.widgets.yasb.active_window import ActiveWindowConfig
 from core.widgets.base import BaseWidget
 from settings import APP_BAR_TITLE
 
+Image = lazy_import("PIL.Image")
+
 # Get the current process ID to exclude our own windows
 CURRENT_PROCESS_ID = os.getpid()
 # Define ignored titles, classes, and processes
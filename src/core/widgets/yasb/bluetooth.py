@@ -255,6 +255,10 @@ class BluetoothWidget(BaseWidget):
             self.bluetooth_thread.terminate()
             self.bluetooth_thread.wait()
 
+    def shutdown(self) -> None:
+        self.stop()
+        super().shutdown()
+
     def _toggle_label(self):
         if self.config.animation.enabled:
             AnimationManager.animate(self, self.config.animation.type, self.config.animation.duration)
@@ -461,6 +461,10 @@ class CavaWidget(BaseWidget):
         except Exception as e:
             logging.error("Error reloading cava: %s", e)
 
+    def shutdown(self) -> None:
+        self.stop_cava()
+        super().shutdown()
+
     def stop_cava(self) -> None:
         self._stop_cava = True
         self.colors.clear()
@@ -1,4 +1,3 @@
-import re
 from collections import deque
 
 from PyQt6.QtWidgets import QLabel
@@ -6,7 +5,6 @@ from PyQt6.QtWidgets import QLabel
 from core.utils.utilities import (
     PopupWidget,
     build_progress_widget,
-    refresh_widget_style,
 )
 from core.utils.widgets.animation_manager import AnimationManager
 from core.utils.widgets.cpu.cpu_api import CpuData, CpuFreq, CpuWorker
@@ -162,12 +160,6 @@ class CpuWidget(BaseWidget):
             },
         }
 
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
         if self.config.progress_bar.enabled and self.progress_widget:
             if self._widget_container_layout.indexOf(self.progress_widget) == -1:
                 self._widget_container_layout.insertWidget(
@@ -176,22 +168,8 @@ class CpuWidget(BaseWidget):
                 )
             self.progress_widget.set_value(data.percent)
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    label_class = "label alt" if self._show_alt_label else "label"
-                    formatted_text = part.format(info=cpu_info)
-                    active_widgets[widget_index].setText(formatted_text)
-                    active_widgets[widget_index].setProperty("class", label_class)
-                    active_widgets[widget_index].setProperty(
-                        "class", f"{label_class} status-{self._get_cpu_threshold(data.percent)}"
-                    )
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        template = self._label_alt_template if self._show_alt_label else self._label_template
+        template.format({"info": cpu_info}, status=self._get_cpu_threshold(data.percent))
 
     def _toggle_label(self):
         if self.config.animation.enabled:
@@ -1,70 +1,19 @@
 import json
 import re
 import subprocess
-import threading
 
-from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QLabel
 
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import add_shadow
 from core.utils.widgets.animation_manager import AnimationManager
+from core.utils.widgets.custom.command_runner import CommandRunner, CommandSpec
 from core.utils.win32.system_function import function_map
 from core.validation.widgets.yasb.custom import CustomConfig
 from core.widgets.base import BaseWidget
 
 
-class CustomWorker(QObject):
-    finished = pyqtSignal()
-    data_ready = pyqtSignal(object)
-
-    def __init__(
-        self,
-        cmd: list[str] | None,
-        use_shell: bool,
-        encoding: str | None,
-        return_type: str,
-        hide_empty: bool,
-    ):
-        super().__init__()
-        self.cmd = cmd
-        self.use_shell = use_shell
-        self.encoding = encoding
-        self.return_type = return_type
-        self.hide_empty = hide_empty
-        self._is_running = True
-
-    def stop(self):
-        self._is_running = False
-
-    def run(self):
-        exec_data = None
-        if self.cmd and self._is_running:
-            proc = subprocess.Popen(
-                self.cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                shell=self.use_shell,
-                encoding=self.encoding,
-            )
-            output = proc.stdout.read()
-            if self.return_type == "json":
-                try:
-                    exec_data = json.loads(output)
-                except json.JSONDecodeError:
-                    exec_data = None
-            else:
-                exec_data = output.decode("utf-8").strip()
-
-        if self._is_running:
-            try:
-                self.data_ready.emit(exec_data)
-                self.finished.emit()
-            except RuntimeError:
-                pass
-
-
 class CustomWidget(BaseWidget):
     validation_schema = CustomConfig
 
@@ -72,9 +21,19 @@ class CustomWidget(BaseWidget):
         super().__init__(config.exec_options.run_interval, class_name=f"custom-widget {config.class_name}")
         self.config = config
         self._exec_data: dict | str | None = None
-        self._exec_cmd = self.config.exec_options.run_cmd.split(" ") if self.config.exec_options.run_cmd else None
         self._show_alt_label = False
-        self._worker = None  # Keep reference to worker for cleanup
+        exec_options = self.config.exec_options
+        self._command = None
+        if exec_options.run_cmd:
+            self._command = CommandSpec(
+                exec_options.run_cmd,
+                exec_options.use_shell,
+                exec_options.encoding,
+                exec_options.return_format,
+                exec_options.timeout,
+            )
+            runner = CommandRunner.instance()
+            runner.result_ready.connect(self._on_command_result)
 
         # Construct container
         self._init_container(self.config.container_shadow.model_dump())
@@ -89,7 +48,11 @@ class CustomWidget(BaseWidget):
 
         self._create_dynamically_label(self.config.label, self.config.label_alt)
 
-        if self.config.exec_options.run_once:
+        if self._command and exec_options.mode == "stream":
+            runner.subscribe(self._command, exec_options.run_interval)
+            command = self._command
+            self.destroyed.connect(lambda *_: runner.unsubscribe(command))
+        elif exec_options.run_once:
             self._exec_callback()
         else:
             self.start_timer()
@@ -197,27 +160,16 @@ class CustomWidget(BaseWidget):
             set_tooltip(self._widget_container, tooltip_text, delay=400)
 
     def _exec_callback(self):
-        if self._exec_cmd:
-            if self._worker:
-                self._worker.stop()
-
-            self._worker = CustomWorker(
-                self._exec_cmd,
-                self.config.exec_options.use_shell,
-                self.config.exec_options.encoding,
-                self.config.exec_options.return_format,
-                self.config.exec_options.hide_empty,
-            )
-            worker_thread = threading.Thread(target=self._worker.run)
-            self._worker.data_ready.connect(self._handle_exec_data)
-            self._worker.finished.connect(self._worker.deleteLater)
-            worker_thread.start()
+        if self._command:
+            # Widgets polling the same command share a result up to half their interval old
+            CommandRunner.instance().run(self._command, self.config.exec_options.run_interval // 2)
         else:
             self._update_label()
 
-    def _handle_exec_data(self, exec_data):
-        self._exec_data = exec_data
-        self._update_label()
+    def _on_command_result(self, command: CommandSpec, exec_data):
+        if command == self._command:
+            self._exec_data = exec_data
+            self._update_label()
 
     def _cb_execute_subprocess(self, cmd: str, *cmd_args: list[str]):
         # Overrides the default 'exec' callback from BaseWidget to allow for data formatting
@@ -1,5 +1,4 @@
 import os
-import re
 
 import win32api
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -8,7 +7,6 @@ from PyQt6.QtWidgets import QHBoxLayout, QLabel, QProgressBar, QVBoxLayout, QWid
 from core.utils.utilities import (
     PopupWidget,
     build_progress_widget,
-    refresh_widget_style,
 )
 from core.utils.widgets.animation_manager import AnimationManager
 from core.validation.widgets.yasb.disk import DiskConfig
@@ -66,12 +64,6 @@ class DiskWidget(BaseWidget):
         self.show_group_label()
 
     def _update_label(self):
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split(r"(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
         disk_space = self._get_space()
         percent_value = float(disk_space["used"]["percent"].rstrip("%")) if disk_space else 0
 
@@ -84,27 +76,12 @@ class DiskWidget(BaseWidget):
 
             self.progress_widget.set_value(percent_value)
 
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    # Ensure the icon is correctly set
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    # Update label with formatted content
-                    label_class = "label alt" if self._show_alt_label else "label"
-                    formatted_text = (
-                        part.format(space=disk_space, volume_label=self.config.volume_label.upper())
-                        if disk_space
-                        else part
-                    )
-                    active_widgets[widget_index].setProperty(
-                        "class", f"{label_class} status-{self._get_disk_threshold(percent_value)}"
-                    )
-                    active_widgets[widget_index].setText(formatted_text)
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        template = self._label_alt_template if self._show_alt_label else self._label_template
+        status = self._get_disk_threshold(percent_value)
+        if disk_space:
+            template.format({"space": disk_space, "volume_label": self.config.volume_label.upper()}, status=status)
+        else:
+            template.substitute({}, status=status)
 
     def _get_volume_label(self, drive_letter: str) -> str | None:
         if not self.config.group_label.show_label_name:
@@ -127,6 +127,12 @@ class GlucoseMonitor(BaseWidget):
 
             self._worker.start()
 
+    def shutdown(self) -> None:
+        if hasattr(self, "_worker"):
+            self._update_timer.stop()
+            self._worker.stop()
+        super().shutdown()
+
     def _open_cgm(self) -> None:
         shell_open(self.config.host)
 
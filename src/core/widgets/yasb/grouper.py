@@ -134,6 +134,14 @@ class GrouperWidget(BaseWidget):
         except Exception as e:
             logging.error("GrouperWidget error initializing child widgets: %s", e)
 
+    def shutdown(self) -> None:
+        for child_widget in self._child_widgets:
+            try:
+                child_widget.shutdown()
+            except Exception as e:
+                logging.error("GrouperWidget error shutting down child widget: %s", e)
+        super().shutdown()
+
     def _propagate_bar_context(self) -> None:
         """Propagate bar context to existing child widgets."""
         try:
@@ -361,6 +361,7 @@ class AppDialog(QDialog):
 
         self._app_loader = AppListLoader()
         self._app_loader.apps_loaded.connect(on_apps_loaded)
+        self._app_loader.apps_changed.connect(lambda apps, _delta: on_apps_loaded(apps))
         self._app_loader.start()
 
     def _fetch_url_info(self):
@@ -1781,6 +1782,14 @@ class LaunchpadWidget(BaseWidget):
             except Exception as e:
                 logging.warning("Failed to apply blur effect: %s", e)
 
+    def shutdown(self) -> None:
+        if self._icon_worker and self._icon_worker.isRunning():
+            self._icon_worker.stop()
+            self._icon_worker.wait()
+        self._cleanup_popup()
+        self._cleanup_overlay()
+        super().shutdown()
+
     def _cleanup_popup(self):
         if self._launchpad_popup:
             self._cleanup_drop_overlay()
@@ -1,14 +1,11 @@
-import json
-import re
 from collections import deque
-from urllib.parse import quote
 
-from PyQt6.QtCore import QEventLoop, Qt, QUrl
-from PyQt6.QtNetwork import QAuthenticator, QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QFrame, QGridLayout, QHBoxLayout, QLabel, QVBoxLayout, QWidget
 
 from core.utils.utilities import PopupWidget
 from core.utils.widgets.animation_manager import AnimationManager
+from core.utils.widgets.libre_monitor.poller import LibreMonitorPoller, PollStatus
 from core.validation.widgets.yasb.libre_monitor import LibreMonitorConfig
 from core.widgets.base import BaseWidget
 
@@ -31,23 +28,14 @@ class LibreHardwareMonitorWidget(BaseWidget):
         self.register_callback("update_label", self._update_label)
         self.register_callback("toggle_menu", self._toggle_menu)
 
-        self._data = None
-        # Create a network manager to handle the LHM connection asynchronously
-        self._network_manager = QNetworkAccessManager()
-        # Called when the request is finished
-        self._network_manager.finished.connect(self._handle_network_response)
-        # Called if the server requests authentication
-        self._network_manager.authenticationRequired.connect(self._handle_authentication)
-
-        # Create a request
-        url = QUrl(
-            f"http://{self.config.server_host}:{self.config.server_port}/Sensor?action=Get&id={quote(self.config.sensor_id)}"
-        )
-        self.request = QNetworkRequest(url)
-        self.request.setHeader(
-            QNetworkRequest.KnownHeaders.ContentTypeHeader,
-            "application/x-www-form-urlencoded",
-        )
+        # All widgets and popups reading from the same server share one poller
+        self._poller = LibreMonitorPoller.get(self.config.server_host, self.config.server_port)
+        if self.config.server_username and self.config.server_password:
+            self._poller.set_credentials(self.config.server_username, self.config.server_password)
+        self._poller.updated.connect(self._on_sensors_updated)
+        # Values younger than half the interval were fetched for another widget this tick
+        self._max_age_ms = self.config.update_interval // 2
+        self._label_pending = False
 
         # Callbacks
         self.callback_left = self.config.callbacks.on_left
@@ -138,45 +126,26 @@ class LibreHardwareMonitorWidget(BaseWidget):
         )
         self._menu.show()
         self._update_menu_content()
+        # Current values are already shown; otherwise they are once the poll finished
+        self._poller.poll(self._max_age_ms)
 
     def _update_menu_content(self):
         """Update only the values in the existing labels if popup is open"""
-        if self._is_menu_visible():
-            for sensor in self.config.libre_menu.sensors:
-                sensor_id = sensor.id
-                value_label = self.sensor_value_labels.get(sensor_id)
-                if value_label is not None and isinstance(value_label, QLabel):
-                    try:
-                        self._update_sensor_value(sensor_id, value_label)
-                    except RuntimeError:
-                        continue
-
-    def _update_sensor_value(self, sensor_id, value_label):
-        """Update just the value for a specific sensor"""
-        if not self._is_menu_visible():
+        if not self._is_menu_visible() or self._poller.status is not PollStatus.OK:
             return
-        url = QUrl(
-            f"http://{self.config.server_host}:{self.config.server_port}/Sensor?action=Get&id={quote(sensor_id)}"
-        )
-        request = QNetworkRequest(url)
-        request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/x-www-form-urlencoded")
-        manager = QNetworkAccessManager()
-        manager.authenticationRequired.connect(self._handle_authentication)
-        reply = manager.post(request, b"")
-        loop = QEventLoop()
-        reply.finished.connect(loop.quit)
-        loop.exec()
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            bytes_string = reply.readAll().data()
-            data = json.loads(bytes_string.decode("utf-8"))
-            if data.get("result") == "ok":
-                value = data.get("value", "N/A")
-                unit = data.get("format", "").split(" ")[-1]
-                value_label.setText(f"{value:.{self.config.libre_menu.precision}f} {unit}")
-            else:
-                # Sensor missing or not found
-                value_label.setText("N/A")
-        reply.deleteLater()
+        for sensor in self.config.libre_menu.sensors:
+            value_label = self.sensor_value_labels.get(sensor.id)
+            if value_label is None or not isinstance(value_label, QLabel):
+                continue
+            reading = self._poller.readings.get(sensor.id)
+            try:
+                if reading is not None:
+                    value_label.setText(f"{reading.value:.{self.config.libre_menu.precision}f} {reading.unit}")
+                else:
+                    # Sensor missing or not found
+                    value_label.setText("N/A")
+            except RuntimeError:
+                continue
 
     def _is_menu_visible(self):
         """Check if the popup menu is visible"""
@@ -193,10 +162,26 @@ class LibreHardwareMonitorWidget(BaseWidget):
         return self.config.histogram_icons[bar_index]
 
     def _update_label(self):
-        """Make a request and update the label with the received data"""
-        if self.config.sensor_id:
-            # If sensor_id is empty skip call
-            self._make_request()
+        """Poll the sensors and update the label once they are current"""
+        if self.config.sensor_id or self._is_menu_visible():
+            # If sensor_id is empty only the popup needs the values
+            self._label_pending = True
+            if self._poller.poll(self._max_age_ms):
+                self._on_sensors_updated()
+        else:
+            self._render_label()
+
+    def _on_sensors_updated(self):
+        """Called once the shared poller has current values, fetched for this widget or another one"""
+        if self._label_pending:
+            self._label_pending = False
+            self._render_label()
+        # Update popup menu if it's visible
+        if self._is_menu_visible():
+            self._update_menu_content()
+
+    def _render_label(self):
+        """Update the label with the latest values of the poller"""
         info = {
             "status": "",
             "value": "",
@@ -205,11 +190,16 @@ class LibreHardwareMonitorWidget(BaseWidget):
             "max": "",
             "histogram": "",
         }
-        if self._data and self._data.get("result") == "ok":
-            value = self._data.get("value", 0.0)
-
-            self._history.append(float(value))
-            self._history_long.append(float(value))
+        # Nothing to show before the first poll, or without a sensor
+        status = self._poller.status if self.config.sensor_id else None
+        reading = self._poller.readings.get(self.config.sensor_id)
+        if status is None:
+            pass
+        elif reading is not None:
+            value = reading.value
+
+            self._history.append(value)
+            self._history_long.append(value)
             history_min_value = min(self._history_long)
             history_max_value = max(self._history_long)
             min_val = history_min_value if self.config.histogram_fixed_min is None else self.config.histogram_fixed_min
@@ -218,70 +208,18 @@ class LibreHardwareMonitorWidget(BaseWidget):
             info["value"] = f"{value:.{self.config.precision}f}"
             info["min"] = f"{history_min_value:.{self.config.precision}f}"
             info["max"] = f"{history_max_value:.{self.config.precision}f}"
-            info["unit"] = self._data.get("format", "Error Error").split(" ")[-1]
+            info["unit"] = reading.unit
             info["histogram"] = (
                 "".join([self._get_histogram_bar(val, min_val, max_val) for val in self._history])
                 .encode("utf-8")
                 .decode("unicode_escape")
             )
-        elif self._data:
-            info["value"] = self._data.get("status", "")
-
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-        for part in label_parts:
-            part = part.strip()
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    formatted_text = part.format(info=info) if info else part
-                    active_widgets[widget_index].setText(formatted_text)
-                widget_index += 1
-
-        # Update popup menu if it's visible
-        if self._is_menu_visible():
-            self._update_menu_content()
-
-    def _make_request(self):
-        """Makes a post request to LibreHardwareMonitor"""
-        self._network_manager.post(self.request, b"")
-
-    def _handle_network_response(self, reply: QNetworkReply):
-        """
-        Handles the network response from the QNetworkAccessManager.
-        Handles the potential error codes and populates the data dict with the result.
-        """
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            bytes_string = reply.readAll().data()
-            self._data = json.loads(bytes_string.decode("utf-8"))
-            if self._data.get("result") == "ok":
-                self._data["status"] = "Connected..."
-            else:
-                self._data["status"] = self.config.sensor_id_error_label
-                self._data["histogram"] = self.config.sensor_id_error_label
-        elif reply.error() == QNetworkReply.NetworkError.AuthenticationRequiredError:
-            self._data = {
-                "status": self.config.auth_error_label,
-                "result": "fail",
-                "value": "",
-                "histogram": self.config.auth_error_label,
-            }
+        elif status is PollStatus.OK:
+            info["value"] = self.config.sensor_id_error_label
+        elif status is PollStatus.AUTH_ERROR:
+            info["value"] = self.config.auth_error_label
         else:
-            self._data = {
-                "status": self.config.connection_error_label,
-                "result": "fail",
-                "value": "",
-                "histogram": self.config.auth_error_label,
-            }
-        reply.deleteLater()
-
-    def _handle_authentication(self, _: QNetworkReply, auth: QAuthenticator):
-        """If server requests auth, this will be called and username and password will be set"""
-        if self.config.server_username and self.config.server_password:
-            auth.setUser(self.config.server_username)
-            auth.setPassword(self.config.server_password)
+            info["value"] = self.config.connection_error_label
+
+        template = self._label_alt_template if self._show_alt_label else self._label_template
+        template.format({"info": info})
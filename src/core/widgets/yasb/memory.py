@@ -1,5 +1,4 @@
 import collections
-import re
 
 from humanize import naturalsize
 from PyQt6.QtWidgets import QLabel
@@ -7,7 +6,6 @@ from PyQt6.QtWidgets import QLabel
 from core.utils.utilities import (
     PopupWidget,
     build_progress_widget,
-    refresh_widget_style,
 )
 from core.utils.widgets.animation_manager import AnimationManager
 from core.utils.widgets.memory.memory_api import MemoryData, MemoryWorker, SwapMemory, VirtualMemory
@@ -151,12 +149,6 @@ class MemoryWidget(BaseWidget):
     def _update_label(self, virtual_mem, swap_mem):
         """Update label using shared memory data."""
 
-        active_widgets = self._widgets_alt if self._show_alt_label else self._widgets
-        active_label_content = self.config.label_alt if self._show_alt_label else self.config.label
-        label_parts = re.split("(<span.*?>.*?</span>)", active_label_content)
-        label_parts = [part for part in label_parts if part]
-        widget_index = 0
-
         _round = lambda value: round(value) if self.config.hide_decimal else value
         _naturalsize = lambda value: naturalsize(value, True, True, "%.0f" if self.config.hide_decimal else "%.1f")
         label_options = {
@@ -180,24 +172,8 @@ class MemoryWidget(BaseWidget):
                 )
             self.progress_widget.set_value(virtual_mem.percent)
 
-        for part in label_parts:
-            part = part.strip()
-            for fmt_str, value in label_options.items():
-                part = part.replace(fmt_str, str(value))
-
-            if part and widget_index < len(active_widgets) and isinstance(active_widgets[widget_index], QLabel):
-                if "<span" in part and "</span>" in part:
-                    icon = re.sub(r"<span.*?>|</span>", "", part).strip()
-                    active_widgets[widget_index].setText(icon)
-                else:
-                    active_widgets[widget_index].setText(part)
-                    # Set memory threshold as property
-                    label_class = "label alt" if self._show_alt_label else "label"
-                    active_widgets[widget_index].setProperty(
-                        "class", f"{label_class} status-{self._get_virtual_memory_threshold(virtual_mem.percent)}"
-                    )
-                    refresh_widget_style(active_widgets[widget_index])
-                widget_index += 1
+        template = self._label_alt_template if self._show_alt_label else self._label_template
+        template.substitute(label_options, status=self._get_virtual_memory_threshold(virtual_mem.percent))
 
     def _toggle_label(self):
         if self.config.animation.enabled:
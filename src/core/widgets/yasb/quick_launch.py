@@ -39,7 +39,7 @@ from core.utils.utilities import LoaderLine, PopupWidget, app_data_path
 from core.utils.widgets.animation_manager import AnimationManager
 from core.utils.widgets.quick_launch.base_provider import ProviderResult
 from core.utils.widgets.quick_launch.context_menu import QuickLaunchContextMenuService
-from core.utils.widgets.quick_launch.icon_utils import load_and_scale_icon, svg_to_pixmap
+from core.utils.widgets.quick_launch.icon_utils import PIXMAP_CACHE, load_and_scale_icon, svg_to_pixmap
 from core.utils.widgets.quick_launch.providers.resources.icons import (
     ICON_NO_RESULTS,
     ICON_SEARCH_INPUT,
@@ -54,17 +54,19 @@ from core.widgets.base import BaseWidget
 
 
 class ResultListModel(QAbstractListModel):
-    """Model holding ProviderResult items with precomputed icon pixmaps."""
+    """Model holding ProviderResult items with lazily computed icon pixmaps.
+
+    New result sets are applied as a diff: rows are matched by result id
+    (or by their content when a provider sets no id), and only removals,
+    moves, insertions and changed rows are signalled to the view.
+    """
 
     RESULT_ROLE = Qt.ItemDataRole.UserRole + 1
     ICON_ROLE = Qt.ItemDataRole.UserRole + 2
 
-    _emoji_cache: dict[tuple[str, int, float], QPixmap | None] = {}
-
     def __init__(self, parent=None):
         super().__init__(parent)
         self._results: list[ProviderResult] = []
-        self._icons: dict[int, QPixmap] = {}
         self._late_icons: dict[str, QPixmap] = {}
         self._icon_size: int = 0
         self._dpr: float = 1.0
@@ -88,30 +90,93 @@ class ResultListModel(QAbstractListModel):
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
         if not index.isValid() or not (0 <= index.row() < len(self._results)):
             return None
-        row = index.row()
-        result = self._results[row]
+        result = self._results[index.row()]
         if role == self.RESULT_ROLE:
             return result
         if role == self.ICON_ROLE:
             if result.id and result.id in self._late_icons:
                 return self._late_icons[result.id]
-            if row not in self._icons:
-                pixmap = self._compute_icon(result, self._icon_size, self._dpr)
-                self._icons[row] = pixmap
-            return self._icons.get(row)
+            return self._compute_icon(result, self._icon_size, self._dpr)
         if role == Qt.ItemDataRole.DisplayRole:
             return result.title
         return None
 
+    @staticmethod
+    def _row_key(result: ProviderResult) -> tuple:
+        if result.id:
+            return (result.provider, result.id)
+        return (result.provider, result.title, result.description, result.icon_char, result.icon_path)
+
     def set_results(self, results: list[ProviderResult], icon_size: int, dpr: float):
-        """Replace all results. Icons are computed lazily on first access."""
-        self.beginResetModel()
-        self._results = list(results)
-        self._icons.clear()
-        self._late_icons.clear()
-        self._icon_size = icon_size
-        self._dpr = dpr
-        self.endResetModel()
+        """Apply a new result set. Icons are computed lazily on first access."""
+        results = list(results)
+        new_keys = [self._row_key(r) for r in results]
+        old_keys = [self._row_key(r) for r in self._results]
+        live_ids = {r.id for r in results if r.id}
+        self._late_icons = {k: v for k, v in self._late_icons.items() if k in live_ids}
+        # The diff matches rows by key, so it needs the keys unique on both sides.
+        if (
+            not self._results
+            or not results
+            or (icon_size, dpr) != (self._icon_size, self._dpr)
+            or len(set(new_keys)) != len(new_keys)
+            or len(set(old_keys)) != len(old_keys)
+        ):
+            self.beginResetModel()
+            self._results = results
+            self._icon_size = icon_size
+            self._dpr = dpr
+            self.endResetModel()
+            return
+        self._apply_diff(results, old_keys, new_keys)
+
+    def _apply_diff(self, results: list[ProviderResult], keys: list[tuple], new_keys: list[tuple]):
+        wanted = set(new_keys)
+        kept = {key for key in keys if key in wanted}
+
+        # Remove rows that are gone, bottom-up in contiguous runs.
+        row = len(keys) - 1
+        while row >= 0:
+            if keys[row] in wanted:
+                row -= 1
+                continue
+            end = row
+            while row >= 0 and keys[row] not in wanted:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, end)
+            del self._results[row + 1 : end + 1]
+            del keys[row + 1 : end + 1]
+            self.endRemoveRows()
+
+        # Walk the target order, moving kept rows up and inserting new runs.
+        row = 0
+        while row < len(new_keys):
+            key = new_keys[row]
+            if row < len(keys) and keys[row] == key:
+                if self._results[row] != results[row]:
+                    self._results[row] = results[row]
+                    idx = self.index(row)
+                    self.dataChanged.emit(idx, idx)
+                row += 1
+                continue
+            try:
+                source = keys.index(key, row + 1)
+            except ValueError:
+                source = -1
+            if source > row:
+                self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), row)
+                self._results.insert(row, self._results.pop(source))
+                keys.insert(row, keys.pop(source))
+                self.endMoveRows()
+                continue
+            end = row
+            while end < len(new_keys) and new_keys[end] not in kept:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._results[row:row] = results[row:end]
+            keys[row:row] = new_keys[row:end]
+            self.endInsertRows()
+            row = end
 
     @staticmethod
     def _compute_icon(result: ProviderResult, icon_size: int, dpr: float) -> QPixmap | None:
@@ -130,10 +195,10 @@ class ResultListModel(QAbstractListModel):
         We should find a better way to do this without rendering to a large canvas and scanning for bounds,
         but this emoji fonts looks like have a bad gemetry.
         """
-        key = (char, size, dpr)
-        cached = ResultListModel._emoji_cache.get(key)
+        key = ("emoji", char, size, dpr)
+        cached = PIXMAP_CACHE.get(key)
         if cached is not None:
-            return cached
+            return None if cached.isNull() else cached
         target = int(size * dpr)
         render_size = 128
         canvas_size = render_size * 2
@@ -187,6 +252,7 @@ class ResultListModel(QAbstractListModel):
                     right = r
 
         if right < left or bottom < top:
+            PIXMAP_CACHE.put(key, QPixmap())
             return None
 
         pad = 2
@@ -201,8 +267,7 @@ class ResultListModel(QAbstractListModel):
             target, target, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
         )
         pixmap.setDevicePixelRatio(dpr)
-        ResultListModel._emoji_cache[key] = pixmap
-        return pixmap
+        return PIXMAP_CACHE.put(key, pixmap)
 
     def update_icon(self, result_id: str, icon_path: str, icon_size: int, dpr: float):
         """Update an icon that was loaded asynchronously."""
@@ -433,7 +498,11 @@ class QuickLaunchWidget(BaseWidget):
         self._service.icon_ready.connect(self._on_icon_ready)
         self._service.query_finished.connect(self._on_query_finished)
         self._service.configure_providers(
-            self.config.providers.model_dump(), self.config.max_results, self.config.show_icons, self.config.icon_size
+            self.config.providers.model_dump(),
+            self.config.max_results,
+            self.config.show_icons,
+            self.config.icon_size,
+            self.config.parallel_providers,
         )
 
         self._init_container(self.config.container_shadow.model_dump())
@@ -501,11 +570,7 @@ class QuickLaunchWidget(BaseWidget):
         if not self._position_locked:
             self._position_locked = True
         # Notify all active providers of deactivation so they can clear caches
-        for p in self._service.providers:
-            try:
-                p.on_deactivate()
-            except Exception:
-                pass
+        self._service.deactivate_providers()
         self._pending_query_id = None
         self._active_prefix = None
         self._preview_visible = False
@@ -931,6 +996,7 @@ class QuickLaunchWidget(BaseWidget):
         self._selected_index = index
 
         menu_result = QuickLaunchContextMenuService.show(self.window(), provider, result, global_pos)
+        self._service.invalidate_results(provider.name)
         if menu_result.refresh_results and self._popup and self._popup.isVisible():
             sb = self._popup.results_view.verticalScrollBar()
             self._pending_scroll_value = sb.value() if sb else 0
@@ -1184,6 +1250,7 @@ class QuickLaunchWidget(BaseWidget):
         if not provider:
             return
         menu_result = provider.handle_preview_action(action_id, result, data)
+        self._service.invalidate_results(provider.name)
         if menu_result.close_popup:
             QTimer.singleShot(0, self._hide_popup)
         elif self._popup and self._popup.isVisible():
@@ -1198,12 +1265,12 @@ class QuickLaunchWidget(BaseWidget):
         if self._popup and self._popup.isVisible() and self._result_model:
             self._result_model.update_icon(result_id, icon_path, self.config.icon_size, self._dpr)
 
-    def _on_query_finished(self, query_id: str, results: list):
+    def _on_query_finished(self, query_id: str, results: list, final: bool = True):
         if query_id != self._pending_query_id:
             return
         if not self._popup or not self._popup.isVisible():
             return
-        if not any(getattr(r, "is_loading", False) for r in results):
+        if final and not any(getattr(r, "is_loading", False) for r in results):
             self._stop_loader()
         self._apply_results(results)
         self._update_prediction()
@@ -1281,6 +1348,7 @@ class QuickLaunchWidget(BaseWidget):
         provider = self._get_provider(result.provider)
         if provider:
             should_close = provider.execute(result)
+            self._service.invalidate_results(provider.name)
         if should_close is True:
             QTimer.singleShot(0, self._hide_popup)
         elif should_close is False and self._popup:
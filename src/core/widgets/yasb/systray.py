@@ -2,6 +2,7 @@ import json
 import logging
 import re
 import threading
+import weakref
 from typing import Any, override
 from uuid import UUID
 
@@ -83,7 +84,9 @@ class SystrayWidget(BaseWidget):
     _systray_client_instance = None
     _systray_client_thread = None
     _systray_refresh_signal = None
+    _systray_refresh_widget = None
     _systray_about_to_quit_signal = None
+    _systray_widgets: weakref.WeakSet[SystrayWidget] = weakref.WeakSet()
 
     @classmethod
     def get_monitor_instance(cls, hook: bool = False):
@@ -282,10 +285,9 @@ class SystrayWidget(BaseWidget):
         systray_client.icon_modified.connect(self.on_icon_modified)
         systray_client.icon_deleted.connect(self.on_icon_deleted)
 
+        SystrayWidget._systray_widgets.add(self)
         if SystrayWidget._systray_refresh_signal is None:
-            SystrayWidget._systray_refresh_signal = systray_client.update_icons.connect(
-                self.refresh_systray_timer.start
-            )
+            self._take_refresh_signal(systray_client)
 
         app_inst = QApplication.instance()
         if app_inst is not None:
@@ -297,10 +299,43 @@ class SystrayWidget(BaseWidget):
         if systray_thread is not None and not systray_thread.isRunning():
             systray_thread.start()
 
+    def _take_refresh_signal(self, systray_client):
+        """Refresh the icons through this widget's timer; one widget does it for all of them"""
+        SystrayWidget._systray_refresh_signal = systray_client.update_icons.connect(self.refresh_systray_timer.start)
+        SystrayWidget._systray_refresh_widget = self
+
+    @override
+    def shutdown(self) -> None:
+        """Save the state and leave the shared client, stopping it after the last systray widget"""
+        self.save_state()
+        SystrayWidget._systray_widgets.discard(self)
+        client = SystrayWidget._systray_client_instance
+        if client is not None:
+            for signal, slot in (
+                (client.icon_modified, self.on_icon_modified),
+                (client.icon_deleted, self.on_icon_deleted),
+            ):
+                try:
+                    signal.disconnect(slot)
+                except TypeError:
+                    pass
+            if SystrayWidget._systray_refresh_widget is self:
+                client.update_icons.disconnect(SystrayWidget._systray_refresh_signal)
+                SystrayWidget._systray_refresh_signal = None
+                SystrayWidget._systray_refresh_widget = None
+                for widget in SystrayWidget._systray_widgets:
+                    widget._take_refresh_signal(client)
+                    break
+        if not SystrayWidget._systray_widgets:
+            self._cleanup_threads()
+        super().shutdown()
+
     @classmethod
     def _cleanup_threads(cls):
         """Cleanup destroy Win32 message loop threads before app quit"""
         try:
+            cls._systray_refresh_signal = None
+            cls._systray_refresh_widget = None
             if cls._systray_client_instance is not None:
                 cls._systray_client_instance.destroy()
                 cls._systray_client_instance = None
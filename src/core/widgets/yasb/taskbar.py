@@ -3,11 +3,11 @@ import logging
 
 import win32con
 import win32gui
-from PIL import Image
 from PyQt6.QtCore import QEasingCurve, QMimeData, QPoint, QPropertyAnimation, QRect, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QCursor, QDrag, QImage, QMouseEvent, QPixmap
 from PyQt6.QtWidgets import QApplication, QFrame, QHBoxLayout, QLabel, QSizePolicy, QWidget
 
+from core.utils.lazy_import import lazy_import
 from core.utils.tooltip import set_tooltip
 from core.utils.utilities import add_shadow, is_valid_qobject, refresh_widget_style
 from core.utils.widgets.animation_manager import AnimationManager
@@ -31,6 +31,8 @@ from core.utils.win32.window_actions import (
 from core.validation.widgets.yasb.taskbar import TaskbarConfig
 from core.widgets.base import BaseWidget
 
+Image = lazy_import("PIL.Image")
+
 try:
     from core.utils.widgets.taskbar.window_manager import connect_taskbar
 except ImportError:
@@ -1550,6 +1552,26 @@ class TaskbarWidget(BaseWidget):
         except Exception:
             pass
 
+    def shutdown(self) -> None:
+        # The task manager is shared with the taskbars of other bars; only disconnect from it
+        if getattr(self, "_thumbnail_mgr", None):
+            self._thumbnail_mgr.stop()
+        for animation in self._animating_widgets.values():
+            animation.stop()
+        self._animating_widgets.clear()
+        if getattr(self, "_task_manager", None):
+            for signal, slot in (
+                (self._task_manager.window_added, self._on_window_added),
+                (self._task_manager.window_removed, self._on_window_removed),
+                (self._task_manager.window_updated, self._on_window_updated),
+                (self._task_manager.window_monitor_changed, self._on_window_monitor_changed),
+            ):
+                try:
+                    signal.disconnect(slot)
+                except TypeError:
+                    pass
+        super().shutdown()
+
     def _stop_events(self) -> None:
         """Stop the task manager and clean up"""
         # Clean up any running animations
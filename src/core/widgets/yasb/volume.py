@@ -2,11 +2,11 @@ import ctypes
 import logging
 import re
 
-from PIL import Image
 from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, QRect, Qt
 from PyQt6.QtGui import QImage, QPixmap, QWheelEvent
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QSlider, QVBoxLayout, QWidget
 
+from core.utils.lazy_import import lazy_import
 from core.utils.tooltip import CustomToolTip, set_tooltip
 from core.utils.utilities import (
     PopupWidget,
@@ -21,6 +21,8 @@ from core.utils.win32.utilities import get_app_name_from_pid
 from core.validation.widgets.yasb.volume import VolumeConfig
 from core.widgets.base import BaseWidget
 
+Image = lazy_import("PIL.Image")
+
 
 class VolumeWidget(BaseWidget):
     validation_schema = VolumeConfig
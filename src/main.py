@@ -8,6 +8,7 @@ from sys import argv
 from types import TracebackType
 
 import qasync
+from PyQt6.QtCore import QTimer
 
 from core.application import YASBApplication
 from core.bar_manager import BarManager
@@ -16,6 +17,7 @@ from core.event_service import EventService
 from core.log import enable_debug_logging, init_logger
 from core.tray import SystemTrayManager
 from core.utils.controller import start_cli_server
+from core.utils.startup_timeline import startup_timeline
 from core.utils.update_service import get_update_service, start_update_checker
 from core.watcher import create_observer
 from env_loader import load_env, set_font_engine
@@ -115,7 +117,8 @@ async def main_async(app: YASBApplication):
     app.aboutToQuit.connect(app_close_event.set)
 
     # Initialize configuration early after the single instance check
-    config, stylesheet = get_config_and_stylesheet()
+    with startup_timeline.phase("get_config_and_stylesheet"):
+        config, stylesheet = get_config_and_stylesheet()
 
     if config.debug:
         enable_debug_logging()
@@ -125,11 +128,13 @@ async def main_async(app: YASBApplication):
     manager = BarManager(config, stylesheet)
 
     try:
-        manager.initialize_bars(init=True)
+        with startup_timeline.phase("initialize_bars"):
+            manager.initialize_bars(init=True)
         # Initialise file watcher if needed
-        observer = create_observer(manager) if config.watch_config or config.watch_stylesheet else None
-        if observer:
-            observer.start()
+        with startup_timeline.phase("start file watcher"):
+            observer = create_observer(manager) if config.watch_config or config.watch_stylesheet else None
+            if observer:
+                observer.start()
 
         def stop_observer():
             if observer:
@@ -140,8 +145,9 @@ async def main_async(app: YASBApplication):
 
         # Build system tray icon
         if config.show_systray:
-            tray_manager = SystemTrayManager(manager)
-            tray_manager.show()
+            with startup_timeline.phase("system tray"):
+                tray_manager = SystemTrayManager(manager)
+                tray_manager.show()
 
         # Initialize auto update service
         if config.update_check:
@@ -152,6 +158,11 @@ async def main_async(app: YASBApplication):
             except Exception as e:
                 logging.error("Failed to start auto update service: %s", e)
 
+        startup_timeline.finish()
+        if config.debug:
+            # Give the bars a moment to paint so first paint times are in the summary
+            QTimer.singleShot(2000, startup_timeline.log_summary)
+
         await app_close_event.wait()
     finally:
         # Cancel async tasks while loop is still running